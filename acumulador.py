@@ -0,0 +1,95 @@
+import math
+
+import numpy as np
+
+from contagem import indices_de_classe
+from frequencias import FrequencyTable
+from resumo import combinar_momentos, momentos
+
+
+class AcumuladorFrequencias:
+    """
+    Tabela de frequências incremental sobre classes de limites fixos.
+
+    Cada lote recebido em `adicionar` é contado nas classes e as colunas Fi, Fac,
+    Fr, Frac, F% e Fac% são atualizadas sem recontar os lotes anteriores. Média e
+    variância são mantidas pelas atualizações de Welford/Chan, e acumuladores com
+    os mesmos limites podem ser juntados com `merge`, sem voltar aos dados brutos.
+    Como em `TabelaJanela`, valores fora das classes não entram em n, nos momentos
+    nem no mínimo e no máximo; só são contados em `fora`.
+    """
+
+    def __init__(self, intervalos, tipo_dados="Contínuos"):
+        # as classes são copiadas com as frequências zeradas
+        self.intervalos = FrequencyTable.de_dicionarios(intervalos, tipo_dados).copia_vazia()
+        self.tipo_dados = tipo_dados
+        self.n = 0  # valores contados nas classes
+        self.fora = 0  # valores recebidos que não caíram em nenhuma classe
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.media = 0.0
+        self._m2 = 0.0  # soma dos quadrados dos desvios em relação à média
+
+    @property
+    def contagens(self):
+        return self.intervalos.fi
+
+    @classmethod
+    def de_tabela(cls, tabela):
+        """Acumulador zerado com as classes de `tabela` (os dados dela não são contados)."""
+        return cls(tabela.gerar_intervalos(), tabela.tipo_dados)
+
+    def adicionar(self, lote):
+        """Conta um novo lote de valores e atualiza as colunas e os momentos."""
+        lote = np.asarray(lote, dtype=float).ravel()
+        if lote.size == 0:
+            return self.intervalos
+        if not np.all(np.isfinite(lote)):
+            raise ValueError("Os dados contêm valores não finitos (inf ou nan).")
+
+        indices = indices_de_classe(lote, self.intervalos.inferiores, self.intervalos.superiores,
+                                    self.tipo_dados == "Discretos")
+        dentro = indices >= 0
+        self.intervalos.fi += np.bincount(indices[dentro], minlength=len(self.intervalos))
+        self.fora += int(lote.size - np.count_nonzero(dentro))
+
+        lote = lote[dentro]
+        if lote.size:
+            self.minimo = min(self.minimo, float(lote.min()))
+            self.maximo = max(self.maximo, float(lote.max()))
+            self._combinar_momentos(momentos(lote))
+        return self._atualizar_colunas()
+
+    def merge(self, outro):
+        """Junta a este acumulador as contagens e os momentos de outro com as mesmas classes."""
+        if (self.tipo_dados != outro.tipo_dados
+                or not np.array_equal(self.intervalos.limites, outro.intervalos.limites)):
+            raise ValueError("Só é possível juntar acumuladores com as mesmas classes.")
+
+        self.intervalos.fi += outro.intervalos.fi
+        self.fora += outro.fora
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self._combinar_momentos((outro.n, outro.media, outro._m2))
+        return self._atualizar_colunas()
+
+    def _combinar_momentos(self, parcial):
+        # Welford/Chan: junta (n, média, M2) do lote sem revisitar os dados
+        self.n, self.media, self._m2 = combinar_momentos((self.n, self.media, self._m2), parcial)
+
+    def _atualizar_colunas(self):
+        # n só conta os valores das classes, então Fac% termina em 100%
+        return self.intervalos.preencher(self.n if self.n > 0 else math.inf)
+
+    @property
+    def variancia(self):
+        """Variância amostral (n - 1) dos valores contados nas classes."""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def variancia_populacional(self):
+        return self._m2 / self.n if self.n else 0.0
+
+    @property
+    def desvio_padrao(self):
+        return math.sqrt(self.variancia)
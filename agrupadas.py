@@ -0,0 +1,81 @@
+import math
+
+import numpy as np
+
+from frequencias import FrequencyTable
+
+METODOS_MODA = ("czuber", "king")
+
+
+def estatisticas_agrupadas(intervalos, amostral=True, metodo_moda="czuber"):
+    """
+    Média, mediana, moda, variância, desvio padrão e CV calculados da tabela
+    agrupada (pontos médios e frequências), em O(k) independentemente de n.
+
+    Devolve também as colunas do cálculo da variância de classe: ponto médio
+    (xi), xi·Fi e Fi·(xi − média)², com os respectivos totais.
+    """
+    if metodo_moda not in METODOS_MODA:
+        raise ValueError(f"Método de moda desconhecido: {metodo_moda!r} (use um de {METODOS_MODA}).")
+
+    tabela = FrequencyTable.de_dicionarios(intervalos)
+    fi = tabela.fi.astype(float)
+    n = fi.sum()
+    if n == 0:
+        return {}
+
+    xi = tabela.pontos_medios
+    xi_fi = xi * fi
+    media = xi_fi.sum() / n
+    desvios_quadrados_fi = fi * (xi - media) ** 2
+    soma_desvios = desvios_quadrados_fi.sum()
+
+    divisor = n - 1 if amostral else n
+    variancia = soma_desvios / divisor if divisor > 0 else 0.0
+    desvio_padrao = math.sqrt(variancia)
+
+    return {
+        'media': float(media),
+        'mediana': _mediana(tabela, n),
+        'moda': _moda(tabela, metodo_moda),
+        'variancia': float(variancia),
+        'desvio_padrao': desvio_padrao,
+        'cv': desvio_padrao / media * 100 if media else None,
+        'pontos_medios': xi,
+        'xi_fi': xi_fi,
+        'desvios_quadrados_fi': desvios_quadrados_fi,
+        'soma_xi_fi': float(xi_fi.sum()),
+        'soma_desvios_quadrados_fi': float(soma_desvios),
+    }
+
+
+def _mediana(tabela, n):
+    # Md = li + (n/2 − Fac anterior) / Fi · h, na primeira classe com Fac ≥ n/2
+    posicao = n / 2
+    i = int(np.searchsorted(tabela.fac, posicao, side="left"))
+    i = min(i, len(tabela) - 1)
+    fac_anterior = tabela.fac[i - 1] if i > 0 else 0
+    li, ls = tabela.limites[i], tabela.limites[i + 1]
+    if tabela.fi[i] == 0:
+        return float(li)
+    return float(li + (posicao - fac_anterior) / tabela.fi[i] * (ls - li))
+
+
+def _moda(tabela, metodo):
+    # classe modal: a de maior Fi (a primeira, em caso de empate)
+    i = int(np.argmax(tabela.fi))
+    li, ls = tabela.limites[i], tabela.limites[i + 1]
+    anterior = float(tabela.fi[i - 1]) if i > 0 else 0.0
+    posterior = float(tabela.fi[i + 1]) if i < len(tabela) - 1 else 0.0
+
+    if metodo == "king":
+        # Mo = li + f_post / (f_ant + f_post) · h
+        peso, total = posterior, anterior + posterior
+    else:
+        # Czuber: Mo = li + d1 / (d1 + d2) · h, com d1 = Fi − f_ant e d2 = Fi − f_post
+        peso = tabela.fi[i] - anterior
+        total = peso + tabela.fi[i] - posterior
+
+    if total == 0:
+        return float((li + ls) / 2)
+    return float(li + peso / total * (ls - li))
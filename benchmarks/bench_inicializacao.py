@@ -0,0 +1,99 @@
+"""
+Mede o tempo de importação dos pontos de entrada e o compara com um orçamento.
+
+Uso:
+    python benchmarks/bench_inicializacao.py
+    python benchmarks/bench_inicializacao.py --repeticoes 10 --json
+
+Cada entrada é importada em um interpretador novo com `python -X importtime`; o
+tempo é a soma das importações de primeiro nível (o menor entre as repetições).
+Para as interfaces gráficas, são importados apenas os módulos que o arquivo
+importa no carregamento (lidos do próprio código), sem abrir a janela. O script
+sai com código 1 se alguma entrada passar do orçamento ou carregar um módulo
+que deveria ficar para o primeiro uso (NumPy e matplotlib na interface, por
+exemplo).
+"""
+import argparse
+import ast
+import json
+import os
+import subprocess
+import sys
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CAMINHOS = [RAIZ, os.path.join(RAIZ, "src")]
+
+# nome: (arquivo ou módulo, orçamento em ms, módulos que não podem ser importados)
+ENTRADAS = {
+    "interface (src/app.py)": ("src/app.py", 150, ("numpy", "matplotlib")),
+    "interface (estatistica/app.py)": ("estatistica/app.py", 150, ("numpy", "matplotlib")),
+    "lote (python -m tabela build)": ("lote", 400, ("matplotlib", "tkinter")),
+}
+
+
+def importacoes_do_arquivo(caminho):
+    """Comandos `import` de primeiro nível de um arquivo, como código executável."""
+    with open(os.path.join(RAIZ, caminho), encoding="utf-8") as arquivo:
+        arvore = ast.parse(arquivo.read())
+    comandos = [no for no in arvore.body if isinstance(no, (ast.Import, ast.ImportFrom))]
+    return "\n".join(ast.unparse(no) for no in comandos)
+
+
+def medir_importacao(codigo):
+    """Tempo total (s) e módulos importados ao executar `codigo` em um novo processo."""
+    ambiente = dict(os.environ, PYTHONPATH=os.pathsep.join(CAMINHOS))
+    processo = subprocess.run([sys.executable, "-X", "importtime", "-c", codigo],
+                              capture_output=True, text=True, env=ambiente, cwd=RAIZ)
+    if processo.returncode != 0:
+        raise RuntimeError(processo.stderr.strip().splitlines()[-1])
+
+    total = 0
+    modulos = set()
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, cumulativo, nome = linha.split("|")
+        if not cumulativo.strip().isdigit():
+            continue  # cabeçalho
+        modulos.add(nome.strip())
+        if not nome[1:].startswith(" "):
+            total += int(cumulativo)  # primeiro nível (microssegundos)
+    return total / 1e6, modulos
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--json", action="store_true", help="imprime os resultados em JSON")
+    args = parser.parse_args()
+
+    resultados = []
+    for nome, (alvo, orcamento, proibidos) in ENTRADAS.items():
+        codigo = importacoes_do_arquivo(alvo) if alvo.endswith(".py") else f"import {alvo}"
+        medidas = [medir_importacao(codigo) for _ in range(args.repeticoes)]
+        tempo = min(t for t, _ in medidas)
+        carregados = sorted(p for p in proibidos
+                            if any(m == p or m.startswith(p + ".") for m in medidas[0][1]))
+        resultados.append({
+            "entrada": nome,
+            "tempo_ms": round(tempo * 1000, 1),
+            "orcamento_ms": orcamento,
+            "proibidos_importados": carregados,
+            "ok": tempo * 1000 <= orcamento and not carregados,
+        })
+
+    if args.json:
+        print(json.dumps(resultados, indent=2, ensure_ascii=False))
+    else:
+        print(f"{'Entrada':<34} {'Tempo (ms)':>10} {'Orçamento':>10}  Situação")
+        for r in resultados:
+            situacao = "ok" if r["ok"] else "ACIMA DO ORÇAMENTO"
+            if r["proibidos_importados"]:
+                situacao = "importa " + ", ".join(r["proibidos_importados"])
+            print(f"{r['entrada']:<34} {r['tempo_ms']:>10.1f} {r['orcamento_ms']:>10}  {situacao}")
+
+    return 0 if all(r["ok"] for r in resultados) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
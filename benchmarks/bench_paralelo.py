@@ -0,0 +1,89 @@
+"""
+Mede a escalabilidade de TabelaParalela com 1, 2, 4 e 8 processos.
+
+Uso:
+    python benchmarks/bench_paralelo.py --n 20000000 --trabalhadores 1 2 4 8
+    python benchmarks/bench_paralelo.py --arquivo   # lê os dados de um arquivo texto
+
+O tempo medido cobre o resumo (1ª passada) e a contagem das classes (2ª passada);
+a criação do pool de processos fica de fora, como num serviço que o reaproveita.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from paralelo import TabelaParalela  # noqa: E402
+from tabela import TabelaIntervaloClasse  # noqa: E402
+
+
+def construir(tabela):
+    tabela.definir_tipo_dados()
+    tabela.calcular_frequencias(tabela.gerar_intervalos())
+
+
+def medir(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        tempos.append(time.perf_counter() - inicio)
+    return min(tempos)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=int, default=20_000_000, help="quantidade de valores")
+    parser.add_argument("--trabalhadores", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--arquivo", action="store_true", help="lê os dados de um arquivo texto")
+    args = parser.parse_args()
+
+    dados = np.round(np.random.default_rng(42).normal(50, 12, args.n), 2)
+    caminho = None
+    if args.arquivo:
+        caminho = os.path.join(tempfile.mkdtemp(), "dados.txt")
+        np.savetxt(caminho, dados, fmt="%.2f")
+
+    def sequencial():
+        if caminho:
+            from fluxo import TabelaArquivo
+            tabela = TabelaArquivo(caminho)
+        else:
+            tabela = TabelaIntervaloClasse()
+            tabela.dados = dados
+        construir(tabela)
+
+    base = medir(sequencial, args.repeticoes)
+    print(f"n = {args.n:,} | fonte = {'arquivo' if caminho else 'memória'} | "
+          f"núcleos disponíveis = {os.cpu_count()}")
+    print(f"{'Processos':<10} {'Tempo (s)':>10} {'Aceleração':>11}")
+    print(f"{'sequencial':<10} {base:>10.3f} {1.0:>10.2f}x")
+
+    for trabalhadores in args.trabalhadores:
+        with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+            # aquece o pool para não medir a criação dos processos
+            list(executor.map(abs, range(trabalhadores)))
+
+            def paralelo():
+                tabela = TabelaParalela(trabalhadores, caminho=caminho, executor=executor)
+                if caminho is None:
+                    tabela.dados = dados
+                with tabela:  # um só segmento de memória para as duas passadas
+                    construir(tabela)
+
+            tempo = medir(paralelo, args.repeticoes)
+        print(f"{trabalhadores:<10} {tempo:>10.3f} {base / tempo:>10.2f}x")
+
+    if caminho:
+        os.remove(caminho)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+"""
+Mede cada etapa da montagem da tabela e dos gráficos, com resultados em JSON.
+
+Uso:
+    python benchmarks/bench_pipeline.py --n 100 10000 1000000 --saida atual.json
+    python benchmarks/bench_pipeline.py --n 1000000 --comparar base.json
+    python benchmarks/bench_pipeline.py --n 100000000 --distribuicoes normal --sem-texto
+
+Para cada distribuição sintética (uniforme, normal, cauda pesada e inteiros,
+sempre com a mesma semente) e cada n, são medidos separadamente: leitura do
+texto (converter_texto), definir_tipo_dados, calcular_estatisticas,
+gerar_intervalos, calcular_frequencias, formatação do texto da tabela e desenho
+do histograma e da ogiva (Agg, em memória). O tempo é o menor entre as
+repetições; o pico de memória de cada etapa vem de uma execução à parte com
+tracemalloc, para não afetar os tempos.
+
+Com `--comparar`, cada tempo é comparado ao do arquivo JSON informado (por
+exemplo, o resultado de outro commit) e o script sai com código 1 se alguma
+etapa ficar mais lenta que o limite (`--tolerancia`).
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [RAIZ, os.path.join(RAIZ, "src")]
+
+from carregador import converter_texto  # noqa: E402
+from tabela import TabelaIntervaloClasse  # noqa: E402
+
+ETAPAS = ("leitura", "definir_tipo_dados", "calcular_estatisticas", "gerar_intervalos",
+          "calcular_frequencias", "formatacao", "graficos")
+
+DISTRIBUICOES = ("uniforme", "normal", "cauda_pesada", "inteiros")
+
+# textos acima deste tamanho não são gerados (a leitura do texto é pulada)
+MAX_N_TEXTO = 10_000_000
+
+
+def gerar_dados(distribuicao, n, semente=42):
+    """Dados sintéticos reprodutíveis."""
+    rng = np.random.default_rng(semente)
+    if distribuicao == "uniforme":
+        return np.round(rng.uniform(0, 100, n), 2)
+    if distribuicao == "normal":
+        return np.round(rng.normal(50, 12, n), 2)
+    if distribuicao == "cauda_pesada":
+        return np.round(rng.standard_t(2, n) * 10 + 50, 2)
+    if distribuicao == "inteiros":
+        return rng.integers(0, 1000, n).astype(float)
+    raise ValueError(f"Distribuição desconhecida: {distribuicao!r}")
+
+
+def executar_etapas(dados, texto, painel):
+    """Executa o pipeline inteiro e devolve uma função por etapa, na ordem."""
+    tabela = TabelaIntervaloClasse()
+    estado = {}
+
+    def leitura():
+        tabela.dados = converter_texto(texto) if texto is not None else dados
+
+    def tipo():
+        tabela.definir_tipo_dados()
+
+    def estatisticas():
+        estado['estatisticas'] = tabela.calcular_estatisticas()
+
+    def intervalos():
+        estado['intervalos'] = tabela.gerar_intervalos()
+
+    def frequencias():
+        estado['intervalos'] = tabela.calcular_frequencias(estado['intervalos'])
+        # as medidas agrupadas também fazem parte do resultado exibido
+        estado['estatisticas'] = tabela.calcular_estatisticas(estado['intervalos'])
+
+    def formatacao():
+        tabela.texto_da_tabela(estado['intervalos'], estado['estatisticas'])
+
+    def graficos():
+        painel.histograma(estado['intervalos'], "Histograma", desenhar=False)
+        painel.salvar(io.BytesIO(), format="png")
+        painel.ogiva(estado['intervalos'], "Ogiva", desenhar=False)
+        painel.salvar(io.BytesIO(), format="png")
+
+    funcoes = [leitura, tipo, estatisticas, intervalos, frequencias, formatacao]
+    if painel is not None:
+        funcoes.append(graficos)
+    return funcoes
+
+
+def medir(dados, texto, painel, repeticoes):
+    """Menor tempo de cada etapa entre as repetições e o pico de memória por etapa."""
+    tempos = {}
+    for _ in range(repeticoes):
+        for nome, funcao in zip(ETAPAS, executar_etapas(dados, texto, painel)):
+            inicio = time.perf_counter()
+            funcao()
+            decorrido = time.perf_counter() - inicio
+            tempos[nome] = min(decorrido, tempos.get(nome, decorrido))
+
+    picos = {}
+    tracemalloc.start()
+    try:
+        for nome, funcao in zip(ETAPAS, executar_etapas(dados, texto, painel)):
+            tracemalloc.reset_peak()
+            antes = tracemalloc.get_traced_memory()[0]
+            funcao()
+            picos[nome] = tracemalloc.get_traced_memory()[1] - antes
+    finally:
+        tracemalloc.stop()
+    return tempos, picos
+
+
+def ambiente():
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=RAIZ).stdout.strip() or None
+    except OSError:
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "maquina": platform.machine(),
+        "sistema": platform.system(),
+        "nucleos": os.cpu_count(),
+    }
+
+
+def comparar(resultados, base, tolerancia, minimo):
+    """
+    Razões atual/base por etapa; devolve as que passaram da tolerância. Etapas
+    que levam menos de `minimo` segundos na base são só exibidas: nessa escala
+    a variação entre execuções é maior que a tolerância.
+    """
+    tempos_base = {(r["distribuicao"], r["n"], r["etapa"]): r["tempo_s"] for r in base["resultados"]}
+    regressoes = []
+    print(f"\n{'Distribuição':<14} {'n':>11} {'Etapa':<22} {'Base (s)':>10} {'Atual (s)':>10} {'Razão':>7}")
+    for r in resultados:
+        chave = (r["distribuicao"], r["n"], r["etapa"])
+        if chave not in tempos_base or tempos_base[chave] <= 0:
+            continue
+        razao = r["tempo_s"] / tempos_base[chave]
+        marca = "  <-- mais lento" if razao > tolerancia and tempos_base[chave] >= minimo else ""
+        print(f"{r['distribuicao']:<14} {r['n']:>11,} {r['etapa']:<22} "
+              f"{tempos_base[chave]:>10.4f} {r['tempo_s']:>10.4f} {razao:>6.2f}x{marca}")
+        if razao > tolerancia and tempos_base[chave] >= minimo:
+            regressoes.append(chave)
+    return regressoes
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--n", type=float, nargs="+", default=[1e2, 1e4, 1e6],
+                        help="tamanhos dos conjuntos de dados (ex.: 1e2 1e4 1e8)")
+    parser.add_argument("--distribuicoes", nargs="+", choices=DISTRIBUICOES, default=list(DISTRIBUICOES))
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--sem-texto", action="store_true",
+                        help="não mede a leitura do texto (os dados entram como vetor)")
+    parser.add_argument("--sem-graficos", action="store_true", help="não mede o desenho dos gráficos")
+    parser.add_argument("--saida", help="grava os resultados neste arquivo JSON")
+    parser.add_argument("--comparar", metavar="BASE.json", help="compara com resultados anteriores")
+    parser.add_argument("--tolerancia", type=float, default=1.25,
+                        help="razão atual/base acima da qual a etapa é considerada regressão")
+    parser.add_argument("--minimo", type=float, default=1e-3,
+                        help="tempo mínimo (s) na base para uma etapa contar como regressão")
+    args = parser.parse_args()
+
+    painel = None
+    if not args.sem_graficos:
+        from painel import PainelGrafico
+        painel = PainelGrafico()
+
+    resultados = []
+    print(f"{'Distribuição':<14} {'n':>11} " + " ".join(f"{e[:12]:>12}" for e in ETAPAS))
+    for distribuicao in args.distribuicoes:
+        for n in map(int, args.n):
+            dados = gerar_dados(distribuicao, n)
+            texto = None
+            if not args.sem_texto and n <= MAX_N_TEXTO:
+                texto = " ".join(np.char.mod("%g", dados).tolist())
+            tempos, picos = medir(dados, texto, painel, args.repeticoes)
+
+            print(f"{distribuicao:<14} {n:>11,} " +
+                  " ".join(f"{tempos[e]:>12.5f}" if e in tempos else f"{'-':>12}" for e in ETAPAS))
+            for etapa in tempos:
+                if etapa == "leitura" and texto is None:
+                    continue
+                resultados.append({"distribuicao": distribuicao, "n": n, "etapa": etapa,
+                                   "tempo_s": tempos[etapa], "pico_bytes": picos[etapa]})
+
+    relatorio = {"ambiente": ambiente(), "repeticoes": args.repeticoes, "resultados": resultados}
+    if args.saida:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            json.dump(relatorio, arquivo, indent=2, ensure_ascii=False)
+        print(f"\nResultados gravados em {args.saida}")
+
+    if args.comparar:
+        with open(args.comparar, encoding="utf-8") as arquivo:
+            regressoes = comparar(resultados, json.load(arquivo), args.tolerancia, args.minimo)
+        if regressoes:
+            print(f"\n{len(regressoes)} etapa(s) acima da tolerância de {args.tolerancia:.2f}x")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,584 @@
+"""
+Teste diferencial: cada motor da tabela contra uma implementação de referência.
+
+Uso:
+    python benchmarks/diferencial.py --casos 500 --semente 1
+    python benchmarks/diferencial.py --casos 200 --motores numpy arquivo paralelo --grande 200000
+    python -m pytest tests          # 50 casos, em tests/test_diferencial.py
+
+Os casos vêm de geradores aleatórios reprodutíveis (pela semente) e de uma
+lista fixa de casos adversariais: valores exatamente sobre os limites de
+classe, o máximo na última classe fechada, inteiros guardados como float
+(discretos) ao lado de decimais (contínuos), um único valor, todos os valores
+iguais (amplitude total e de classe zero), magnitudes grandes e negativas, e
+entradas que devem ser recusadas (sem dados, inf, nan).
+
+A referência é o algoritmo original da tabela, copiado aqui em Python puro e
+sem usar nada do código testado: mínimo e máximo da lista, `x != int(x)` para
+o tipo dos dados, limites acumulados em float, o laço de comparações e o laço
+acumulado de Fr, F% e Fac%. Cada motor precisa reproduzir todas as colunas
+(limites, Fi, Fac, Fr, Frac, F%, Fac%) e as estatísticas. A aritmética exata é
+conferida contra uma contagem independente em inteiros. Os motores que leem
+arquivos recebem valores separados por vírgula, espaço, tab, LF e CRLF, com
+cabeçalho e blocos de poucos caracteres, para que os cortes caiam no meio dos
+números. Qualquer exceção fora dos casos marcados como inválidos é uma falha.
+
+Quando um caso falha, ele é reduzido (removendo valores enquanto a divergência
+continua) antes de ser exibido. Ao final, o tempo total de cada motor é
+comparado ao da referência nos mesmos casos; com `--grande N`, também num
+conjunto de N valores.
+
+Sai com código 1 se algum motor divergir.
+"""
+import argparse
+import math
+import os
+import statistics
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [RAIZ]
+
+import contagem  # noqa: E402
+from acumulador import AcumuladorFrequencias  # noqa: E402
+from fluxo import TabelaArquivo  # noqa: E402
+from grupos import TabelaGrupos  # noqa: E402
+from janela import TabelaJanela  # noqa: E402
+from paralelo import TabelaParalela  # noqa: E402
+from regras import MAXIMO_CLASSES  # noqa: E402
+from tabela import TabelaIntervaloClasse  # noqa: E402
+
+# coluna comparada -> chave do dicionário de intervalo
+COLUNAS = {
+    "fi": "frequencia",
+    "fac": "frequencia_acumulada",
+    "fr": "frequencia_relativa",
+    "frac": "frequencia_relativa_acumulada",
+    "fp": "frequencia_percentual",
+    "facp": "frequencia_percentual_acumulada",
+}
+
+# regras cujo k não depende de quantis aproximados (o esboço KLL é aleatório)
+REGRAS = ("sturges", "raiz", "rice", "scott")
+
+# separadores gravados nos arquivos dos motores de leitura
+SEPARADORES = (",", " ", ", ", "\t", "\n", "\r\n")
+
+# tolerância para somas feitas em outra ordem (pesos, momentos combinados)
+TOLERANCIA = 1e-9
+
+
+class Caso:
+    """
+    Dados e parâmetros de uma tabela a comparar. `erro`, em casos que devem ser
+    recusados, são as exceções aceitas (da referência e do motor).
+    """
+
+    __slots__ = ("dados", "casas_decimais", "regra", "origem", "erro")
+
+    def __init__(self, dados, casas_decimais=2, regra="sturges", origem="", erro=None):
+        self.dados = np.asarray(dados, dtype=float)
+        self.casas_decimais = casas_decimais
+        self.regra = regra
+        self.origem = origem
+        self.erro = erro
+
+    def com_dados(self, dados):
+        return Caso(dados, self.casas_decimais, self.regra, self.origem, self.erro)
+
+    def __repr__(self):
+        return (f"Caso({self.origem}, n={self.dados.size}, casas_decimais={self.casas_decimais}, "
+                f"regra={self.regra!r}, dados={self.dados.tolist()!r})")
+
+
+# ===================== GERADORES =====================
+
+def decimais(rng, n, casas, escala):
+    """Valores com no máximo `casas` decimais (exatos na grade de 10^-casas)."""
+    fator = 10 ** casas
+    return rng.integers(-escala * fator, escala * fator, n) / fator
+
+
+def gerar_caso(rng):
+    """Um caso aleatório: distribuição, tamanho, casas decimais e regra sorteados."""
+    n = int(rng.choice([1, 2, 3, 5, 10, 50, 200, 1000]))
+    casas = int(rng.integers(0, 5))
+    tipo = rng.choice(["inteiros", "decimais", "normal", "cauda_pesada", "repetidos", "sobre_limites"])
+    if tipo == "inteiros":
+        dados = rng.integers(-50, 500, n).astype(float)
+    elif tipo == "decimais":
+        dados = decimais(rng, n, casas, int(rng.choice([1, 100, 10_000])))
+    elif tipo == "normal":
+        dados = np.round(rng.normal(50, 12, n), casas)
+    elif tipo == "cauda_pesada":
+        dados = np.round(rng.standard_t(2, n) * 10, casas)
+    elif tipo == "repetidos":
+        dados = rng.choice(decimais(rng, 3, casas, 10), n)
+    else:
+        dados = sobre_os_limites(rng, n, casas)
+    return Caso(dados, casas, str(rng.choice(REGRAS)), f"aleatorio:{tipo}")
+
+
+def sobre_os_limites(rng, n, casas):
+    """Dados em que parte dos valores cai exatamente sobre os limites de classe."""
+    base = decimais(rng, max(n, 2), casas, 100)
+    intervalos, _ = referencia(Caso(base, casas))
+    limites = [classe['limite_inferior'] for classe in intervalos] + [intervalos[-1]['limite_superior']]
+    return np.concatenate((base, rng.choice(limites, max(n // 2, 1))))
+
+
+def casos_adversariais():
+    """Casos fixos nas bordas do comportamento da tabela."""
+    yield Caso([5.0], 2, "sturges", "um valor")
+    yield Caso([7.0] * 9, 2, "sturges", "todos iguais (amplitude zero)")
+    yield Caso([2.5, 2.5, 2.5], 1, "scott", "todos iguais, contínuos")
+    yield Caso([0.0, 10.0], 0, "sturges", "só os extremos")
+    yield Caso(list(range(11)), 2, "sturges", "inteiros 0..10")
+    yield Caso([0.1 * i for i in range(1, 31)], 1, "raiz", "0,1 acumulado em float")
+    yield Caso([0.0, 0.3, 0.6, 0.9, 1.2, 1.5, 1.8, 2.1], 1, "rice", "limites em múltiplos de 0,3")
+    yield Caso([1.0, 1.0, 1.0, 4.0], 0, "sturges", "máximo na última classe fechada")
+    yield Caso([-3.25, -1.5, 0.0, 1.5, 3.25], 2, "sturges", "negativos e zero")
+    yield Caso([1e12, 1e12 + 0.01, 1e12 + 0.02, 1e12 + 0.05], 2, "sturges", "magnitude grande")
+    yield Caso([0.001, 0.002, 0.0025, 0.004], 3, "raiz", "3 casas")
+    yield Caso([1.0, 2.0, 2.0, 3.0, 3.0, 3.0, 100.0], 0, "scott", "valor isolado à direita")
+    yield Caso([1.5, 2.0, 2.5, 3.0], 0, "sturges", "decimais com 0 casas")
+    yield Caso([], 2, "sturges", "sem dados", erro=(ValueError,))
+    yield Caso([1.0, math.inf, 3.0], 2, "sturges", "infinito", erro=(ValueError, OverflowError))
+    yield Caso([1.0, math.nan, 3.0], 2, "sturges", "nan", erro=(ValueError,))
+
+
+# ===================== REFERÊNCIA =====================
+
+def classes_referencia(regra, dados, amplitude):
+    """k pela regra: Sturges como no original; as demais pelas suas definições."""
+    n = len(dados)
+    if regra == "raiz":
+        return max(1, math.ceil(math.sqrt(n)))
+    if regra == "rice":
+        return max(1, math.ceil(2 * n ** (1 / 3)))
+    if regra == "scott" and n > 1:
+        largura = 3.49 * statistics.stdev(dados) * n ** (-1 / 3)
+        if largura > 0 and amplitude > 0:
+            return max(1, min(math.ceil(amplitude / largura), MAXIMO_CLASSES, n))
+    return round(1 + 3.322 * math.log10(n))
+
+
+def referencia(caso):
+    """
+    Oráculo: intervalos (lista de dicionários) e estatísticas pelo algoritmo
+    original, em Python puro.
+    """
+    dados = caso.dados.tolist()
+    discretos = not any(x != int(x) for x in dados)
+    min_val, max_val = min(dados), max(dados)
+    n_total = len(dados)
+    k = classes_referencia(caso.regra, dados, max_val - min_val)
+
+    fator = 10 ** caso.casas_decimais
+    amplitude_classe = math.ceil((max_val - min_val) / k * fator) / fator
+
+    intervalos = []
+    limite_inferior = min_val
+    for i in range(k):
+        limite_superior = limite_inferior + amplitude_classe
+        if i == k - 1:
+            limite_superior = max_val
+        intervalos.append({'limite_inferior': limite_inferior, 'limite_superior': limite_superior,
+                           'frequencia': 0, 'eh_ultima_classe': i == k - 1})
+        limite_inferior = limite_superior
+
+    for dado in dados:
+        for intervalo in intervalos:
+            if discretos or intervalo['eh_ultima_classe']:
+                if intervalo['limite_inferior'] <= dado <= intervalo['limite_superior']:
+                    intervalo['frequencia'] += 1
+                    break
+            elif intervalo['limite_inferior'] <= dado < intervalo['limite_superior']:
+                intervalo['frequencia'] += 1
+                break
+
+    freq_acum = freq_rel_acum = freq_perc_acum = 0
+    for intervalo in intervalos:
+        freq_acum += intervalo['frequencia']
+        intervalo['frequencia_acumulada'] = freq_acum
+
+        intervalo['frequencia_relativa'] = intervalo['frequencia'] / n_total
+        freq_rel_acum += intervalo['frequencia_relativa']
+        intervalo['frequencia_relativa_acumulada'] = freq_rel_acum
+
+        intervalo['frequencia_percentual'] = round(intervalo['frequencia_relativa'] * 100, 2)
+        freq_perc_acum += intervalo['frequencia_percentual']
+        intervalo['frequencia_percentual_acumulada'] = round(freq_perc_acum, 2)
+
+    # média e variância dos dados agrupados, pelos pontos médios
+    pontos = [(c['limite_inferior'] + c['limite_superior']) / 2 for c in intervalos]
+    media = math.fsum(x * c['frequencia'] for x, c in zip(pontos, intervalos)) / n_total
+    soma_desvios = math.fsum(c['frequencia'] * (x - media) ** 2 for x, c in zip(pontos, intervalos))
+    variancia = soma_desvios / (n_total - 1) if n_total > 1 else 0.0
+
+    estatisticas = {
+        'min': min_val,
+        'max': max_val,
+        'amplitude_total': max_val - min_val,
+        'k': k,
+        'amplitude_classe': (max_val - min_val) / k,
+        'media': media,
+        'variancia': variancia,
+        'desvio_padrao': math.sqrt(variancia),
+    }
+    return intervalos, estatisticas
+
+
+def referencia_exata(caso):
+    """
+    Contagem independente da aritmética exata: limites min + i·A e dados em
+    inteiros (unidades de 10^-casas), pelo laço original de comparações, e
+    Frac e Fac% calculados de Fac / n.
+    """
+    fator = 10 ** caso.casas_decimais
+    dados = caso.dados.tolist()
+    inteiros = [round(x * fator) for x in dados]
+    discretos = not any(x != int(x) for x in dados)
+    minimo, maximo = min(inteiros), max(inteiros)
+    k = classes_referencia(caso.regra, dados, max(dados) - min(dados))
+    amplitude = -(-(maximo - minimo) // k)
+    limites = [minimo + i * amplitude for i in range(k)] + [maximo]
+
+    fi = [0] * k
+    for x in inteiros:
+        for i in range(k):
+            fechada = discretos or i == k - 1
+            if limites[i] <= x <= limites[i + 1] if fechada else limites[i] <= x < limites[i + 1]:
+                fi[i] += 1
+                break
+
+    n_total = len(inteiros)
+    intervalos = []
+    fac = 0
+    for i in range(k):
+        fac += fi[i]
+        intervalos.append({
+            'limite_inferior': limites[i] / fator,
+            'limite_superior': limites[i + 1] / fator,
+            'frequencia': fi[i],
+            'frequencia_acumulada': fac,
+            'frequencia_relativa': fi[i] / n_total,
+            'frequencia_relativa_acumulada': fac / n_total,
+            'frequencia_percentual': round(fi[i] / n_total * 100, 2),
+            'frequencia_percentual_acumulada': round(fac * 100 / n_total, 2),
+        })
+    return intervalos, None
+
+
+def na_grade(caso):
+    # a contagem em inteiros só equivale à tabela para dados decimais exatos
+    return contagem.na_grade(caso.dados, 10 ** caso.casas_decimais) is not None
+
+
+# ===================== MOTORES =====================
+
+def _tabela(caso, classe=TabelaIntervaloClasse, **opcoes):
+    tabela = classe(**opcoes)
+    tabela.casas_decimais = caso.casas_decimais
+    tabela.regra_classes = caso.regra
+    return tabela
+
+
+def _construir(tabela):
+    tabela.definir_tipo_dados()
+    return tabela.construir()
+
+
+def escrever_dados(caminho, dados, rng):
+    """
+    Grava os valores com separadores sorteados e uma linha de cabeçalho.
+    Devolve o tamanho do texto, em caracteres.
+    """
+    partes = ["valor\r\n"]
+    for valor, separador in zip(dados.tolist(), rng.choice(SEPARADORES, dados.size).tolist()):
+        # repr preserva o float exato na volta
+        partes += [repr(valor), separador]
+    if partes[1:] and rng.random() < 0.5:
+        partes.pop()  # último valor sem separador depois
+    texto = "".join(partes)
+    with open(caminho, "w", encoding="utf-8", newline="") as arquivo:
+        arquivo.write(texto)
+    return len(texto)
+
+
+def bloco_pequeno(rng, caracteres):
+    # poucos blocos por arquivo, de tamanho sorteado: os cortes caem no meio
+    # dos números e entre o \r e o \n
+    return caracteres // int(rng.integers(2, 8)) + int(rng.integers(1, 8))
+
+
+def motor_numpy(caso):
+    tabela = _tabela(caso)
+    tabela.dados = caso.dados
+    return _construir(tabela)
+
+
+def motor_arquivo(caso, pasta, rng):
+    caminho = os.path.join(pasta, "dados.txt")
+    caracteres = escrever_dados(caminho, caso.dados, rng)
+    tabela = _tabela(caso, TabelaArquivo, caminho=caminho, pular_linhas=1,
+                     tamanho_bloco=bloco_pequeno(rng, caracteres))
+    return _construir(tabela)
+
+
+def motor_paralelo(caso, executor):
+    tabela = _tabela(caso, TabelaParalela, trabalhadores=2, executor=executor)
+    tabela.dados = caso.dados
+    with tabela:
+        return _construir(tabela)
+
+
+def motor_paralelo_arquivo(caso, pasta, executor, rng):
+    # faixas de bytes do arquivo (ler_faixa), uma por trabalhador
+    caminho = os.path.join(pasta, "paralelo.txt")
+    caracteres = escrever_dados(caminho, caso.dados, rng)
+    tabela = _tabela(caso, TabelaParalela, trabalhadores=int(rng.integers(2, 5)), caminho=caminho,
+                     pular_linhas=1, tamanho_bloco=bloco_pequeno(rng, caracteres), executor=executor)
+    with tabela:
+        return _construir(tabela)
+
+
+def motor_acumulador(caso, rng):
+    base = _tabela(caso)
+    base.dados = caso.dados
+    base.definir_tipo_dados()
+    acumulador = AcumuladorFrequencias.de_tabela(base)
+    # os dados chegam em lotes de tamanhos aleatórios
+    cortes = np.sort(rng.integers(0, caso.dados.size + 1, 3))
+    for lote in np.split(caso.dados, cortes):
+        acumulador.adicionar(lote)
+    return acumulador.intervalos, None
+
+
+def motor_janela(caso, rng):
+    base = _tabela(caso)
+    base.dados = caso.dados
+    base.definir_tipo_dados()
+    # janela maior que os dados: deve conter todos eles
+    janela = TabelaJanela.de_tabela(base, tamanho=caso.dados.size + int(rng.integers(0, 5)))
+    for lote in np.array_split(caso.dados, 3):
+        janela.adicionar(lote)
+    return janela.tabela(), None
+
+
+def motor_grupos(caso, rng):
+    grupos = rng.integers(0, 4, caso.dados.size)
+    tabela = TabelaGrupos(grupos, caso.dados, caso.casas_decimais, caso.regra)
+    return tabela.total(), None
+
+
+def motor_ponderado(caso):
+    valores, contagens = np.unique(caso.dados, return_counts=True)
+    tabela = _tabela(caso)
+    tabela.dados = valores
+    tabela.pesos = contagens
+    return _construir(tabela)
+
+
+def motor_exato(caso):
+    tabela = _tabela(caso)
+    tabela.dados = caso.dados
+    tabela.aritmetica_exata = True
+    return _construir(tabela)
+
+
+# ===================== COMPARAÇÃO =====================
+
+def colunas(intervalos):
+    """Limites e colunas de frequência de uma lista de intervalos (ou FrequencyTable)."""
+    limites = [classe['limite_inferior'] for classe in intervalos]
+    limites.append(intervalos[-1]['limite_superior'])
+    resultado = {"limites": np.array(limites, dtype=float)}
+    for coluna, chave in COLUNAS.items():
+        resultado[coluna] = np.array([classe[chave] for classe in intervalos], dtype=float)
+    return resultado
+
+
+def tolerancia_absoluta(caso, chave):
+    """
+    Erro absoluto tolerado numa estatística. A média agrupada em float erra
+    por volta de ulp(max |x|), e a variância herda esse erro ao quadrado (n·δ²):
+    com dados perto de 1e12, isso já aparece na 5ª casa significativa.
+    """
+    delta = float(np.abs(caso.dados).max()) * np.finfo(float).eps if caso.dados.size else 0.0
+    if chave == "variancia":
+        return max(caso.dados.size * delta ** 2, 1e-12)
+    if chave == "desvio_padrao":
+        return max(math.sqrt(caso.dados.size) * delta, 1e-12)
+    return 1e-12
+
+
+def diferencas(esperado, obtido, caso):
+    """Lista das divergências entre dois resultados (intervalos, estatísticas)."""
+    (iv_esp, est_esp), (iv_obt, est_obt) = esperado, obtido
+    if len(iv_esp) != len(iv_obt):
+        return [f"k: {len(iv_esp)} != {len(iv_obt)}"]
+
+    erros = []
+    col_esp, col_obt = colunas(iv_esp), colunas(iv_obt)
+    for coluna, a in col_esp.items():
+        b = col_obt[coluna]
+        if not np.allclose(a, b, rtol=TOLERANCIA, atol=0):
+            erros.append(f"{coluna}: {a.tolist()} != {b.tolist()}")
+
+    if est_esp is not None and est_obt is not None:
+        for chave, valor in est_esp.items():
+            outro = est_obt.get(chave)
+            if isinstance(valor, (np.ndarray, float, int)) and not isinstance(valor, bool):
+                atol = tolerancia_absoluta(caso, chave)
+                if outro is None or not np.allclose(valor, outro, rtol=TOLERANCIA, atol=atol):
+                    erros.append(f"{chave}: {valor!r} != {outro!r}")
+            elif valor != outro:
+                erros.append(f"{chave}: {valor!r} != {outro!r}")
+    return erros
+
+
+def executar(funcao, caso):
+    """Resultado (ou a exceção) e o tempo gasto."""
+    inicio = time.perf_counter()
+    try:
+        resultado = funcao(caso)
+    except Exception as erro:
+        resultado = erro
+    return resultado, time.perf_counter() - inicio
+
+
+def comparar(funcao_referencia, funcao, caso):
+    """Divergências do motor no caso, e os tempos da referência e do motor."""
+    esperado, tempo_referencia = executar(funcao_referencia, caso)
+    obtido, tempo = executar(funcao, caso)
+    if caso.erro is not None:
+        # caso inválido: os dois lados precisam recusá-lo
+        if isinstance(esperado, caso.erro) and isinstance(obtido, caso.erro):
+            erros = []
+        else:
+            erros = [f"esperava {[e.__name__ for e in caso.erro]}: referência {esperado!r}, "
+                     f"motor {obtido!r}"]
+    elif isinstance(esperado, Exception) or isinstance(obtido, Exception):
+        # num caso válido, qualquer exceção é falha, mesmo que dos dois lados
+        erros = [f"exceção: referência {esperado!r}, motor {obtido!r}"]
+    else:
+        erros = diferencas(esperado, obtido, caso)
+    return erros, tempo_referencia, tempo
+
+
+def reduzir(funcao_referencia, funcao, caso, tentativas=300):
+    """Caso menor que ainda diverge: remove blocos de valores, do maior ao menor."""
+    tamanho = max(caso.dados.size // 2, 1)
+    while tamanho >= 1 and tentativas > 0:
+        inicio = 0
+        while inicio < caso.dados.size and tentativas > 0:
+            menor = caso.com_dados(np.delete(caso.dados, np.s_[inicio:inicio + tamanho]))
+            tentativas -= 1
+            if menor.dados.size and comparar(funcao_referencia, funcao, menor)[0]:
+                caso = menor
+            else:
+                inicio += tamanho
+        tamanho //= 2
+    return caso
+
+
+# ===================== EXECUÇÃO =====================
+
+def montar_motores(pasta, executor, rng):
+    """Nome -> (função, referência, condição para o caso valer para o motor)."""
+    def sempre(caso):
+        return True
+
+    def uma_regra_exata(caso):
+        # Scott depende do desvio padrão, somado em outra ordem com pesos
+        return caso.regra != "scott"
+
+    return {
+        "numpy": (motor_numpy, referencia, sempre),
+        "arquivo": (lambda caso: motor_arquivo(caso, pasta, rng), referencia, sempre),
+        "paralelo": (lambda caso: motor_paralelo(caso, executor), referencia, sempre),
+        "paralelo_arquivo": (lambda caso: motor_paralelo_arquivo(caso, pasta, executor, rng),
+                             referencia, sempre),
+        "acumulador": (lambda caso: motor_acumulador(caso, rng), referencia, sempre),
+        "janela": (lambda caso: motor_janela(caso, rng), referencia, sempre),
+        "grupos": (lambda caso: motor_grupos(caso, rng), referencia, sempre),
+        "ponderado": (motor_ponderado, referencia, uma_regra_exata),
+        "exato": (motor_exato, referencia_exata, na_grade),
+    }
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--casos", type=int, default=300, help="casos aleatórios (padrão: 300)")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--motores", nargs="+", default=None,
+                        help="motores a testar (padrão: todos)")
+    parser.add_argument("--grande", type=int, default=0, metavar="N",
+                        help="mede também a velocidade num conjunto de N valores")
+    args = parser.parse_args(argumentos)
+
+    rng = np.random.default_rng(args.semente)
+    casos = list(casos_adversariais()) + [gerar_caso(rng) for _ in range(args.casos)]
+
+    with tempfile.TemporaryDirectory() as pasta, ProcessPoolExecutor(max_workers=2) as executor:
+        motores = montar_motores(pasta, executor, rng)
+        escolhidos = args.motores or list(motores)
+        desconhecidos = set(escolhidos) - set(motores)
+        if desconhecidos:
+            parser.error(f"motores desconhecidos: {sorted(desconhecidos)} (use {list(motores)})")
+
+        falhas = 0
+        print(f"{'Motor':<16} {'Casos':>6} {'Falhas':>7} {'Motor (s)':>10} {'Referência (s)':>15} "
+              f"{'Velocidade':>11}")
+        for nome in escolhidos:
+            funcao, funcao_referencia, vale = motores[nome]
+            aplicados = divergentes = 0
+            tempo = tempo_referencia = 0.0
+            primeira = None
+            for caso in casos:
+                if not vale(caso):
+                    continue
+                aplicados += 1
+                erros, t_ref, t = comparar(funcao_referencia, funcao, caso)
+                tempo_referencia += t_ref
+                tempo += t
+                if erros:
+                    divergentes += 1
+                    primeira = primeira or caso
+
+            velocidade = tempo_referencia / tempo if tempo > 0 else math.inf
+            print(f"{nome:<16} {aplicados:>6} {divergentes:>7} {tempo:>10.3f} {tempo_referencia:>15.3f} "
+                  f"{velocidade:>10.1f}x")
+            if primeira is not None:
+                falhas += divergentes
+                menor = reduzir(funcao_referencia, funcao, primeira)
+                print(f"  menor caso divergente: {menor!r}")
+                for erro in comparar(funcao_referencia, funcao, menor)[0][:5]:
+                    print(f"    {erro}")
+
+        if args.grande:
+            medir_grande(args.grande, motores, escolhidos, rng)
+
+    return 1 if falhas else 0
+
+
+def medir_grande(n, motores, escolhidos, rng):
+    """Tempo de cada motor num único conjunto grande, relativo à referência."""
+    caso = Caso(np.round(rng.normal(50, 12, n), 2), 2, "sturges", f"grande n={n}")
+    _, t_ref = executar(referencia, caso)
+    print(f"\nConjunto grande (n = {n:,}): referência {t_ref:.3f} s")
+    for nome in escolhidos:
+        funcao, _, vale = motores[nome]
+        if vale(caso):
+            _, t = executar(funcao, caso)
+            print(f"  {nome:<16} {t:>8.3f} s  {t_ref / t:>8.1f}x")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,120 @@
+import hashlib
+import os
+import sys
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+# Limite padrão de memória do cache compartilhado
+LIMITE_BYTES = 256 * 1024 * 1024
+
+# Bytes lidos por vez ao calcular o digest de um vetor grande
+BLOCO_DIGEST = 1 << 24
+
+
+def digest(valor):
+    """
+    Impressão digital (BLAKE2b, 128 bits) do conteúdo de um texto, bytes ou vetor.
+    Vetores com os mesmos valores, tipo e formato têm o mesmo digest.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    if isinstance(valor, str):
+        h.update(valor.encode("utf-8"))
+    elif isinstance(valor, (bytes, bytearray, memoryview)):
+        h.update(valor)
+    else:
+        vetor = np.ascontiguousarray(valor)
+        h.update(f"{vetor.dtype.str}{vetor.shape}".encode())
+        bytes_ = vetor.reshape(-1).view(np.uint8)
+        for inicio in range(0, bytes_.size, BLOCO_DIGEST):
+            h.update(bytes_[inicio:inicio + BLOCO_DIGEST])
+    return h.hexdigest()
+
+
+def digest_arquivo(caminho, *parametros):
+    """Identidade de um arquivo (caminho, tamanho e data de modificação), sem lê-lo."""
+    info = os.stat(caminho)
+    return digest(repr((os.path.abspath(caminho), info.st_size, info.st_mtime_ns, parametros)))
+
+
+def tamanho_de(valor):
+    """Estimativa dos bytes ocupados por um valor guardado no cache."""
+    if isinstance(valor, np.ndarray):
+        return valor.nbytes
+    if isinstance(valor, (tuple, list)):
+        return sys.getsizeof(valor) + sum(tamanho_de(v) for v in valor)
+    if isinstance(valor, dict):
+        return sys.getsizeof(valor) + sum(tamanho_de(v) for v in valor.values())
+    if hasattr(valor, "limites") and hasattr(valor, "fi"):
+        # FrequencyTable: as sete colunas têm k (ou k + 1) posições de 8 bytes
+        return 7 * valor.limites.nbytes
+    return sys.getsizeof(valor)
+
+
+class CacheLRU:
+    """
+    Cache de resultados com descarte do item menos usado recentemente (LRU) e
+    limite de memória.
+
+    As chaves são tuplas com o digest dos dados e os parâmetros do cálculo
+    (casas decimais, regra de classes...). Os valores guardados são devolvidos
+    sem cópia e não devem ser alterados por quem os recebe. Pode ser usado por
+    várias threads.
+    """
+
+    def __init__(self, limite_bytes=LIMITE_BYTES):
+        self.limite_bytes = limite_bytes
+        self.bytes = 0
+        self.acertos = 0
+        self.faltas = 0
+        self._itens = OrderedDict()  # chave -> (valor, tamanho)
+        self._trava = threading.RLock()
+
+    def obter(self, chave, calcular):
+        """Valor guardado para `chave` ou, na falta dele, `calcular()` guardado no cache."""
+        with self._trava:
+            if chave in self._itens:
+                self._itens.move_to_end(chave)
+                self.acertos += 1
+                return self._itens[chave][0]
+            self.faltas += 1
+
+        valor = calcular()
+        self.guardar(chave, valor)
+        return valor
+
+    def guardar(self, chave, valor):
+        tamanho = tamanho_de(valor)
+        with self._trava:
+            if chave in self._itens:
+                self.bytes -= self._itens.pop(chave)[1]
+            if tamanho > self.limite_bytes:
+                return valor  # maior que o cache inteiro: não é guardado
+            self._itens[chave] = (valor, tamanho)
+            self.bytes += tamanho
+            while self.bytes > self.limite_bytes:
+                _, (_, tamanho_antigo) = self._itens.popitem(last=False)
+                self.bytes -= tamanho_antigo
+        return valor
+
+    def limpar(self):
+        with self._trava:
+            self._itens.clear()
+            self.bytes = 0
+
+    def estatisticas(self):
+        """Acertos, faltas, itens e bytes ocupados."""
+        with self._trava:
+            return {'acertos': self.acertos, 'faltas': self.faltas,
+                    'itens': len(self._itens), 'bytes': self.bytes}
+
+    def __contains__(self, chave):
+        return chave in self._itens
+
+    def __len__(self):
+        return len(self._itens)
+
+
+# Cache compartilhado pelas tabelas e pela interface
+CACHE = CacheLRU()
@@ -0,0 +1,71 @@
+import os
+import warnings
+
+import numpy as np
+
+from desempenho import medir
+
+# Formatos binários brutos (little-endian) reconhecidos pela extensão
+FORMATOS_BRUTOS = {
+    "f64": "<f8",
+    "i32": "<i4",
+}
+EXTENSOES = {
+    ".npy": "npy",
+    ".f64": "f64",
+    ".bin": "f64",
+    ".i32": "i32",
+}
+
+
+@medir("entrada", tamanho_resultado=len)  # n = valores lidos, não caracteres
+def converter_texto(texto):
+    """Converte números separados por vírgula, espaço ou quebra de linha em vetor float."""
+    texto = texto.replace(",", " ")
+    if not texto.strip():
+        # np.fromstring devolve [-1.] para texto só com espaços
+        return np.empty(0)
+
+    with warnings.catch_warnings():
+        # versões antigas do NumPy só avisam (e truncam) quando há texto inválido
+        warnings.simplefilter("error", DeprecationWarning)
+        try:
+            return np.fromstring(texto, sep=" ")
+        except (DeprecationWarning, ValueError):
+            raise ValueError("O texto contém valores que não são números válidos.") from None
+
+
+def formato_do_arquivo(caminho):
+    """Formato deduzido da extensão: "npy", "f64", "i32" ou "texto"."""
+    return EXTENSOES.get(os.path.splitext(caminho)[1].lower(), "texto")
+
+
+def carregar(caminho, formato=None, coluna=None, pular_linhas=0):
+    """
+    Carrega dados numéricos de um arquivo para um vetor NumPy.
+
+    - `.npy`: aberto com `np.load(mmap_mode="r")`, sem copiar os dados;
+    - brutos `.f64`/`.bin` (float64) e `.i32` (int32), little-endian: mapeados com
+      `np.memmap`, também sem cópia (o sistema lê as páginas sob demanda);
+    - texto (CSV ou um valor por linha): convertido em C por `np.fromstring`, ou,
+      com `coluna` informada, por `np.loadtxt` lendo só aquela coluna do CSV.
+
+    O vetor devolvido pode ser atribuído direto a `TabelaIntervaloClasse.dados`.
+    """
+    formato = formato or formato_do_arquivo(caminho)
+
+    if formato == "npy":
+        return np.load(caminho, mmap_mode="r")
+    if formato in FORMATOS_BRUTOS:
+        if os.path.getsize(caminho) == 0:
+            return np.empty(0, dtype=FORMATOS_BRUTOS[formato])
+        return np.memmap(caminho, dtype=FORMATOS_BRUTOS[formato], mode="r")
+    if formato != "texto":
+        raise ValueError(f"Formato desconhecido: {formato!r}.")
+
+    if coluna is not None:
+        return np.loadtxt(caminho, delimiter=",", usecols=coluna, skiprows=pular_linhas, ndmin=1)
+    with open(caminho, encoding="utf-8") as arquivo:
+        for _ in range(pular_linhas):
+            arquivo.readline()
+        return converter_texto(arquivo.read())
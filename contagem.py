@@ -0,0 +1,85 @@
+import numpy as np
+
+
+def indices_de_classe(dados, inferiores, superiores, discretos):
+    """
+    Devolve, para cada dado, o índice da classe em que ele é contado (-1 se em nenhuma).
+
+    As classes precisam ser contíguas (limite inferior de uma = limite superior da
+    anterior), como as geradas por `gerar_intervalos`. A regra é a mesma da contagem
+    original: `li |- ls` para contínuos, última classe fechada `li |-| ls` e
+    limites inclusivos para discretos (o dado fica na primeira classe que o contém).
+    """
+    dados, inferiores, superiores = (_numerico(v) for v in (dados, inferiores, superiores))
+    k = len(superiores)
+
+    # contínuos: primeira classe cujo limite superior é maior que o dado;
+    # discretos: primeira classe cujo limite superior alcança o dado
+    lado = "left" if discretos else "right"
+    indices = np.searchsorted(superiores[:-1], dados, side=lado)
+
+    # a última classe é fechada à direita; abaixo do 1º limite não há classe
+    validos = dados >= inferiores[0]
+    validos &= (indices < k - 1) | (dados <= superiores[-1])
+    return np.where(validos, indices, -1)
+
+
+def _numerico(valores):
+    # inteiros (contagem na grade de `na_grade`) são mantidos; o resto vira float
+    valores = np.asarray(valores)
+    return valores if valores.dtype.kind in "iu" else valores.astype(float, copy=False)
+
+
+def na_grade(valores, fator):
+    """
+    Valores em unidades de 1/`fator` (por exemplo, centésimos com fator 100)
+    como inteiros int64, ou None se algum valor não estiver nessa grade. Um
+    valor está na grade quando é exatamente o double mais próximo do decimal
+    (0,07 está; 0,07 + 1e-17 calculado em float, como 13,299999999999997, não).
+    """
+    valores = np.asarray(valores)
+    if valores.dtype.kind in "iu" and fator == 1:
+        return valores.astype(np.int64, copy=False)
+    valores = valores.astype(float, copy=False)
+    inteiros = np.rint(valores * fator)
+    if inteiros.size and np.abs(inteiros).max() >= 2.0 ** 53:
+        return None  # fora da faixa em que float64 representa inteiros exatamente
+    if not np.array_equal(inteiros / fator, valores):
+        return None
+    return inteiros.astype(np.int64)
+
+
+def contar_classes(dados, inferiores, superiores, discretos, pesos=None):
+    """
+    Conta quantos dados caem em cada classe (vetor de tamanho k). Com `pesos`,
+    soma o peso (frequência) de cada valor em vez de 1.
+    """
+    indices = indices_de_classe(dados, inferiores, superiores, discretos)
+    validos = indices >= 0
+    if pesos is None:
+        return np.bincount(indices[validos], minlength=len(superiores))
+    return np.bincount(indices[validos], weights=np.asarray(pesos, dtype=float)[validos],
+                       minlength=len(superiores))
+
+
+def classes_contiguas(inferiores, superiores):
+    """Verifica se as classes podem ser contadas por busca binária nos limites."""
+    inferiores = np.asarray(inferiores, dtype=float)
+    superiores = np.asarray(superiores, dtype=float)
+    return bool(
+        np.array_equal(inferiores[1:], superiores[:-1])
+        and np.all(np.diff(superiores[:-1]) >= 0)
+    )
+
+
+def contar_classes_por_grupo(grupos, dados, inferiores, superiores, discretos, n_grupos):
+    """
+    Contagens por grupo e classe (matriz n_grupos × k) numa única passada:
+    `grupos` traz o código (0 a n_grupos - 1) do grupo de cada dado, e o par
+    (grupo, classe) vira um índice único para um só `np.bincount`.
+    """
+    k = len(superiores)
+    indices = indices_de_classe(dados, inferiores, superiores, discretos)
+    validos = indices >= 0
+    celulas = np.asarray(grupos, dtype=np.int64)[validos] * k + indices[validos]
+    return np.bincount(celulas, minlength=n_grupos * k).reshape(n_grupos, k)
@@ -0,0 +1,172 @@
+"""
+Medição opcional do tempo e da memória de cada etapa da tabela e dos gráficos.
+
+Desligada por padrão: as funções marcadas com `@medir("etapa")` só verificam
+uma variável global antes de seguir direto para a função original. Com
+`ativar()`, cada chamada registra a etapa, o tempo de relógio, o tempo de CPU
+do processo, o tamanho da entrada (n) e, com `memoria=True`, o pico de bytes
+alocados (tracemalloc) durante a etapa.
+
+    import desempenho
+    desempenho.ativar()
+    tabela.construir()
+    print(desempenho.relatorio())
+    desempenho.salvar_json("perfil.json")
+"""
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+# Etapas medidas, na ordem do cálculo
+ETAPAS = ("entrada", "tipo", "estatisticas", "intervalos", "frequencias", "exibicao", "graficos")
+
+_ativo = False
+_memoria = False
+_registros = []
+_trava = threading.Lock()
+_pilha = threading.local()  # etapas abertas em cada thread (medições aninhadas)
+_nulo = nullcontext()
+
+
+def ativar(memoria=True):
+    """Liga a medição. `memoria` inclui o pico de bytes alocados (mais lento)."""
+    global _ativo, _memoria
+    _memoria = memoria
+    if memoria and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    _ativo = True
+
+
+def desativar():
+    global _ativo, _memoria
+    _ativo = False
+    if _memoria and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    _memoria = False
+
+
+def ativo():
+    return _ativo
+
+
+def limpar():
+    with _trava:
+        _registros.clear()
+
+
+def registros():
+    """Cópia dos registros: dicionários com etapa, funcao, tempo_s, cpu_s, n e bytes."""
+    with _trava:
+        return [dict(r) for r in _registros]
+
+
+def etapa(nome, funcao=None, tamanho=None):
+    """
+    Contexto que mede um trecho como a etapa `nome`. Desligada a medição,
+    devolve um contexto vazio.
+    """
+    if not _ativo:
+        return _nulo
+    return _medir_trecho(nome, funcao or nome, tamanho)
+
+
+@contextmanager
+def _medir_trecho(nome, funcao, tamanho):
+    registro = {'etapa': nome, 'funcao': funcao, 'n': tamanho}
+    abertas = _pilha.__dict__.setdefault("abertas", [])
+    memoria = _memoria and tracemalloc.is_tracing()
+    if memoria:
+        atual, pico = tracemalloc.get_traced_memory()
+        if abertas:
+            # o pico da etapa de fora é guardado antes de zerar o contador
+            abertas[-1]['_pico'] = max(abertas[-1]['_pico'], pico)
+        tracemalloc.reset_peak()
+        registro['_inicio'] = registro['_pico'] = atual
+    abertas.append(registro)
+
+    inicio, inicio_cpu = time.perf_counter(), time.process_time()
+    try:
+        yield registro
+    finally:
+        registro['tempo_s'] = time.perf_counter() - inicio
+        registro['cpu_s'] = time.process_time() - inicio_cpu
+        abertas.pop()
+        if memoria:
+            pico = max(registro.pop('_pico'), tracemalloc.get_traced_memory()[1])
+            registro['bytes'] = pico - registro.pop('_inicio')
+            if abertas:
+                abertas[-1]['_pico'] = max(abertas[-1]['_pico'], pico)
+        else:
+            registro['bytes'] = None
+        with _trava:
+            _registros.append(registro)
+
+
+def medir(nome, tamanho=None, tamanho_resultado=None):
+    """
+    Decorador que mede cada chamada da função como a etapa `nome`.
+    `tamanho(*args, **kwargs)`, chamado depois da função, informa o n da entrada;
+    `tamanho_resultado(resultado)` o calcula do valor devolvido.
+    """
+    def decorador(funcao):
+        rotulo = funcao.__qualname__
+
+        @functools.wraps(funcao)
+        def medida(*args, **kwargs):
+            if not _ativo:
+                return funcao(*args, **kwargs)
+            with _medir_trecho(nome, rotulo, None) as registro:
+                resultado = funcao(*args, **kwargs)
+                if tamanho is not None:
+                    registro['n'] = tamanho(*args, **kwargs)
+                elif tamanho_resultado is not None:
+                    registro['n'] = tamanho_resultado(resultado)
+            return resultado
+        return medida
+    return decorador
+
+
+def totais(lista=None):
+    """Soma por etapa (chamadas, tempo, CPU, maior n e maior pico de bytes), na ordem de ETAPAS."""
+    lista = registros() if lista is None else lista
+    por_etapa = {}
+    for r in lista:
+        total = por_etapa.setdefault(r['etapa'], {'chamadas': 0, 'tempo_s': 0.0, 'cpu_s': 0.0,
+                                                  'n': None, 'bytes': None})
+        total['chamadas'] += 1
+        total['tempo_s'] += r['tempo_s']
+        total['cpu_s'] += r['cpu_s']
+        for campo in ('n', 'bytes'):
+            if r[campo] is not None:
+                total[campo] = max(total[campo] or 0, r[campo])
+    ordem = {nome: i for i, nome in enumerate(ETAPAS)}
+    return dict(sorted(por_etapa.items(), key=lambda item: ordem.get(item[0], len(ETAPAS))))
+
+
+def relatorio(lista=None):
+    """Texto com os totais por etapa, como no relatório "Desempenho" da janela."""
+    por_etapa = totais(lista)
+    if not por_etapa:
+        return "Nenhuma etapa medida."
+    linhas = [f"{'Etapa':<14} {'Chamadas':>8} {'Tempo (ms)':>11} {'CPU (ms)':>10} "
+              f"{'n':>12} {'Pico (KiB)':>11}",
+              "-" * 71]
+    for nome, total in por_etapa.items():
+        n = f"{total['n']:,}" if total['n'] is not None else "-"
+        pico = f"{total['bytes'] / 1024:.1f}" if total['bytes'] is not None else "-"
+        linhas.append(f"{nome:<14} {total['chamadas']:>8} {total['tempo_s'] * 1e3:>11.2f} "
+                      f"{total['cpu_s'] * 1e3:>10.2f} {n:>12} {pico:>11}")
+    return "\n".join(linhas)
+
+
+def para_json(lista=None):
+    lista = registros() if lista is None else lista
+    return {'registros': lista, 'totais': totais(lista)}
+
+
+def salvar_json(caminho, lista=None):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(para_json(lista), arquivo, indent=2, ensure_ascii=False)
@@ -1,10 +1,8 @@
 # src/app.py
 import tkinter as tk
 from tkinter import scrolledtext, messagebox
-import matplotlib.pyplot as plt
-from tabela import TabelaIntervaloClasse
-from histogram import build_hist_data, plot_hist
-from ogiva import ogiva_de_dados_brutos, ogiva_de_tabela_agrupada
+
+# tabela (NumPy) e os gráficos (matplotlib) são importados no primeiro uso
 
 ultimo_tabela = None
 ultimo_intervalos = None
@@ -16,8 +14,11 @@ def gerar_tabela():
         saida.delete("1.0", tk.END)
         saida.insert(tk.END, "Digite os dados!\n")
         return
+    from carregador import converter_texto
+    from tabela import TabelaIntervaloClasse
+
     try:
-        dados = [float(x) for x in texto.replace(",", " ").split()]
+        dados = converter_texto(texto)
     except ValueError:
         messagebox.showerror("Erro", "Insira apenas números válidos.")
         return
@@ -25,25 +26,28 @@ def gerar_tabela():
     tabela = TabelaIntervaloClasse()
     tabela.dados = dados
     tabela.definir_tipo_dados()
-    estatisticas = tabela.calcular_estatisticas()
     intervalos = tabela.gerar_intervalos()
     intervalos = tabela.calcular_frequencias(intervalos)
+    estatisticas = tabela.calcular_estatisticas(intervalos)
 
     ultimo_tabela = tabela
     ultimo_intervalos = intervalos
 
 
-    saida.delete("1.0", tk.END)
-    saida.insert(tk.END, "=== TABELA DE FREQUÊNCIAS ===\n\n")
+    # texto montado antes e inserido de uma vez (um único layout do Text)
+    partes = ["=== TABELA DE FREQUÊNCIAS ===\n\n"]
     for i, inter in enumerate(intervalos, 1):
-        saida.insert(tk.END, f"{i}: {inter['intervalo']} -> Fi={inter['frequencia']}  Fac={inter['frequencia_acumulada']}\n Frac={inter['frequencia']}")
+        partes.append(f"{i}: {inter['intervalo']} -> Fi={inter['frequencia']}  Fac={inter['frequencia_acumulada']}\n Frac={inter['frequencia']}")
 
-    saida.insert(tk.END, "\n=== ESTATÍSTICAS ===\n")
-    saida.insert(tk.END, f"n = {len(tabela.dados)}\n")
-    saida.insert(tk.END, f"Média = {estatisticas['media']:.2f}\n")
-    saida.insert(tk.END, f"Mediana = {estatisticas['mediana']:.2f}\n")
-    saida.insert(tk.END, f"Desvio padrão = {estatisticas['desvio_padrao']:.2f}\n")
-    saida.insert(tk.END, f"Tipo = {tabela.tipo_dados}\n")
+    partes.append("\n=== ESTATÍSTICAS ===\n")
+    partes.append(f"n = {len(tabela.dados)}\n")
+    partes.append(f"Média = {estatisticas['media']:.2f}\n")
+    partes.append(f"Mediana = {estatisticas['mediana']:.2f}\n")
+    partes.append(f"Desvio padrão = {estatisticas['desvio_padrao']:.2f}\n")
+    partes.append(f"Tipo = {tabela.tipo_dados}\n")
+
+    saida.delete("1.0", tk.END)
+    saida.insert(tk.END, "".join(partes))
 
 def mostrar_histograma():
     if not (ultimo_tabela and ultimo_intervalos):
@@ -63,6 +67,10 @@ def mostrar_histograma():
         freq = [i['frequencia'] for i in intervalos]
         data_dict = {"type": "discrete", "values": valores, "freq": freq, "n": len(dados)}
 
+    from graficos import pyplot
+    from histogram import build_hist_data, plot_hist
+
+    plt = pyplot()
     hist_data = build_hist_data(data_dict, use_density=False)
     fig, ax = plt.subplots(figsize=(7, 4))
     plot_hist(ax, hist_data, title=f"Histograma ({tabela.tipo_dados})")
@@ -75,12 +83,14 @@ def mostrar_ogiva_tabela():
     # usa os limites superiores da tabela agrupada
     intervalos_xy = [(i['limite_inferior'], i['limite_superior']) for i in ultimo_intervalos]
     freq = [i['frequencia'] for i in ultimo_intervalos]
+    from ogiva import ogiva_de_tabela_agrupada
     ogiva_de_tabela_agrupada(intervalos_xy, freq, mostrar_percentual=True)
 
 def mostrar_ogiva_brutos():
     if not ultimo_tabela:
         saida.insert(tk.END, "\n⚠️ Gere a tabela primeiro (para eu pegar os dados)!\n")
         return
+    from ogiva import ogiva_de_dados_brutos
     ogiva_de_dados_brutos(ultimo_tabela.dados, num_classes=None, mostrar_percentual=True)
 
 # --------- UI ---------
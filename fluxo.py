@@ -0,0 +1,211 @@
+import numpy as np
+
+from cache import digest_arquivo
+from carregador import converter_texto
+from resumo import Resumo
+from tabela import TabelaIntervaloClasse
+
+# Caracteres lidos por bloco (~8 MB de texto); limita a memória usada na leitura
+TAMANHO_BLOCO = 1 << 23
+
+SEPARADORES = (" ", ",", "\n", "\r", "\t")
+SEPARADORES_BYTES = tuple(sep.encode() for sep in SEPARADORES)
+
+
+def ler_blocos(caminho, tamanho_bloco=TAMANHO_BLOCO, pular_linhas=0):
+    """
+    Lê um arquivo CSV ou com um valor por linha e devolve os números bloco a bloco.
+
+    Cada bloco tem no máximo `tamanho_bloco` caracteres de texto; um número cortado
+    no fim do bloco é guardado e completado na leitura seguinte.
+    """
+    with open(caminho, encoding="utf-8") as arquivo:
+        for _ in range(pular_linhas):
+            arquivo.readline()
+
+        resto = ""
+        while True:
+            texto = arquivo.read(tamanho_bloco)
+            if not texto:
+                break
+            texto = resto + texto
+
+            corte = max(texto.rfind(sep) for sep in SEPARADORES) + 1
+            resto = texto[corte:]
+            bloco = converter_texto(texto[:corte])
+            if bloco.size:
+                yield bloco
+
+        if resto.strip():
+            yield converter_texto(resto)
+
+
+def inicio_dos_dados(caminho, pular_linhas=0):
+    """Posição (em bytes) do primeiro dado, depois das linhas de cabeçalho."""
+    with open(caminho, "rb") as arquivo:
+        for _ in range(pular_linhas):
+            arquivo.readline()
+        return arquivo.tell()
+
+
+def _primeiro_separador(texto):
+    posicoes = [p for p in (texto.find(sep) for sep in SEPARADORES_BYTES) if p >= 0]
+    return min(posicoes) if posicoes else -1
+
+
+def ler_faixa(caminho, inicio, fim, tamanho_bloco=TAMANHO_BLOCO):
+    """
+    Lê, em blocos, os números que começam entre os bytes `inicio` e `fim` do arquivo.
+
+    Faixas vizinhas ([a, b) e [b, c)) dividem o arquivo sem perder nem repetir
+    números: quem começa no meio de um número o deixa para a faixa anterior, que
+    o completa lendo além do seu fim.
+    """
+    with open(caminho, "rb") as arquivo:
+        if inicio > 0:
+            arquivo.seek(inicio - 1)
+            if arquivo.read(1) not in SEPARADORES_BYTES:
+                # a faixa começa no meio de um número da faixa anterior
+                while True:
+                    pedaco = arquivo.read(4096)
+                    if not pedaco:
+                        return
+                    corte = _primeiro_separador(pedaco)
+                    if corte >= 0:
+                        arquivo.seek(corte + 1 - len(pedaco), 1)
+                        break
+
+        posicao = arquivo.tell()
+        resto = b""
+        while posicao < fim:
+            pedaco = arquivo.read(min(tamanho_bloco, fim - posicao))
+            if not pedaco:
+                break
+            posicao += len(pedaco)
+            texto = resto + pedaco
+
+            corte = max(texto.rfind(sep) for sep in SEPARADORES_BYTES) + 1
+            resto = texto[corte:]
+            bloco = converter_texto(texto[:corte].decode("utf-8", "replace"))
+            if bloco.size:
+                yield bloco
+
+        # completa o número que atravessa o fim da faixa
+        while resto:
+            pedaco = arquivo.read(4096)
+            corte = _primeiro_separador(pedaco)
+            if corte >= 0:
+                resto += pedaco[:corte]
+                break
+            resto += pedaco
+            if not pedaco:
+                break
+        if resto.strip():
+            yield converter_texto(resto.decode("utf-8", "replace"))
+
+
+class TabelaArquivo(TabelaIntervaloClasse):
+    """
+    Tabela de intervalo de classe construída a partir de um arquivo lido em blocos.
+
+    A 1ª passada calcula o resumo (mínimo, máximo, n) e a 2ª conta as classes, de
+    modo que a memória fica limitada ao tamanho do bloco. Com `limites=(min, max)`
+    e `k` informados a 1ª passada é dispensada; nesse caso `tipo_dados` deve ser
+    informado (padrão "Contínuos") e valores fora dos limites não entram na
+    tabela nem em n (Fr e Fac% somam 1 e 100%); a quantidade deles fica em `fora`.
+Se nenhum valor cair dentro dos limites, a contagem levanta ValueError.
+
+    Os intervalos produzidos são os mesmos dicionários de `TabelaIntervaloClasse`,
+    aceitos por `exibir_tabela` e pelos gráficos.
+    """
+
+    def __init__(self, caminho, tamanho_bloco=TAMANHO_BLOCO, pular_linhas=0,
+                 limites=None, k=None, tipo_dados=None):
+        super().__init__()
+        if limites is not None and k is None:
+            raise ValueError("Informe o número de classes (k) junto com os limites.")
+
+        self.caminho = caminho
+        self.tamanho_bloco = tamanho_bloco
+        self.pular_linhas = pular_linhas
+        self.limites = limites
+        self.k = k
+        self.fora = 0  # valores lidos fora dos `limites`, conhecidos depois da contagem
+        self._contado = False
+        if limites is not None:
+            self.tipo_dados = tipo_dados or "Contínuos"
+
+    @property
+    def resumo(self):
+        if self._resumo is None:
+            self._resumo = Resumo()
+            if self.limites is None:
+                for bloco in self._ler():
+                    self._resumo.atualizar(bloco)
+            else:
+                # n, somas e integralidade são preenchidos na passada de contagem
+                self._resumo.minimo, self._resumo.maximo = map(float, self.limites)
+        return self._resumo
+
+    @property
+    def digest(self):
+        # identidade do arquivo, sem ler o conteúdo
+        if self._digest is None:
+            self._digest = digest_arquivo(self.caminho, self.pular_linhas, self.limites, self.k)
+        return self._digest
+
+    def definir_tipo_dados(self):
+        if self.limites is None:
+            super().definir_tipo_dados()
+
+    def tem_dados(self):
+        if self.limites is None or self._contado:
+            return super().tem_dados()
+        # com limites informados, n só é conhecido depois da contagem: basta
+        # achar um valor dentro deles
+        minimo, maximo = map(float, self.limites)
+        return any(np.any((bloco >= minimo) & (bloco <= maximo)) for bloco in self._ler())
+
+    def numero_classes(self):
+        if self.k is not None:
+            return self.k
+        return super().numero_classes()
+
+    def modo_quantis_padrao(self):
+        # o modo exato juntaria o arquivo inteiro na memória
+        return "aproximado"
+
+    def _todos_os_dados(self):
+        return np.concatenate(list(self._blocos()) or [np.empty(0)])
+
+    def _ler(self):
+        return self._verificando(ler_blocos(self.caminho, self.tamanho_bloco, self.pular_linhas))
+
+    def _blocos(self):
+        if self.limites is None:
+            yield from self._ler()
+            return
+
+        minimo, maximo = map(float, self.limites)
+        lido = Resumo()
+        fora = 0
+        for bloco in self._ler():
+            dentro = (bloco >= minimo) & (bloco <= maximo)
+            if not dentro.all():
+                if not np.all(np.isfinite(bloco[~dentro])):
+                    raise ValueError("Os dados contêm valores não finitos (inf ou nan).")
+                fora += int(bloco.size - np.count_nonzero(dentro))
+                bloco = bloco[dentro]
+            if bloco.size:
+                lido.atualizar(bloco)
+                yield bloco
+        self.fora = fora
+        if not lido.n:
+            raise ValueError("Nenhum valor dentro das classes.")
+
+        resumo = self.resumo
+        resumo.n = lido.n
+        resumo.soma = lido.soma
+        resumo.m2 = lido.m2
+        resumo.inteiros = lido.inteiros
+        self._contado = True
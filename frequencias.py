@@ -0,0 +1,253 @@
+import math
+from collections.abc import MutableMapping, Sequence
+
+import numpy as np
+
+from contagem import classes_contiguas
+
+# Colunas numéricas e os nomes usados nos dicionários de intervalo
+COLUNAS = {
+    'frequencia': 'fi',
+    'frequencia_acumulada': 'fac',
+    'frequencia_relativa': 'fr',
+    'frequencia_relativa_acumulada': 'frac',
+    'frequencia_percentual': 'fp',
+    'frequencia_percentual_acumulada': 'facp',
+}
+
+CHAVES = ('intervalo', 'limite_inferior', 'limite_superior', 'frequencia',
+          'frequencia_acumulada', 'eh_ultima_classe', 'frequencia_relativa',
+          'frequencia_relativa_acumulada', 'frequencia_percentual',
+          'frequencia_percentual_acumulada', 'ponto_medio')
+
+
+def formatar_intervalo(limite_inferior, limite_superior, ultima, tipo_dados, casas_decimais):
+    """Texto do intervalo de classe: `li |- ls`, ou `li |-| ls` na última classe."""
+    if tipo_dados == "Discretos":
+        if ultima:
+            return f"{int(limite_inferior)} |-| {int(math.ceil(limite_superior))}"
+        return f"{int(limite_inferior)} |- {int(math.floor(limite_superior))}"
+
+    formato = f"{{:.{casas_decimais}f}}"
+    separador = "|-|" if ultima else "|-"
+    return f"{formato.format(limite_inferior)} {separador} {formato.format(limite_superior)}"
+
+
+def limites_das_classes(intervalos):
+    """Vetores de limites inferiores e superiores das classes, em qualquer formato."""
+    if isinstance(intervalos, FrequencyTable):
+        return intervalos.inferiores, intervalos.superiores
+    return (np.array([i['limite_inferior'] for i in intervalos], dtype=float),
+            np.array([i['limite_superior'] for i in intervalos], dtype=float))
+
+
+def somar_frequencias(intervalos, contagens):
+    """Soma as contagens por classe à coluna Fi."""
+    if isinstance(intervalos, FrequencyTable):
+        if np.asarray(contagens).dtype.kind == "f":
+            intervalos.frequencias_fracionarias()
+        intervalos.fi += contagens
+        return
+    for intervalo, fi in zip(intervalos, np.asarray(contagens).tolist()):
+        intervalo['frequencia'] += fi
+
+
+def acumular_frequencias(intervalos, n_total, exata=False):
+    """
+    Preenche Fac, Fr, Frac, F% e Fac% a partir das frequências (Fi) já contadas.
+
+    Com `exata`, Frac e Fac% vêm de Fac / n (e não da soma das colunas já
+    arredondadas), de modo que a última classe chega exatamente a 1 e 100%.
+    """
+    if isinstance(intervalos, FrequencyTable):
+        return intervalos.preencher(n_total, exata)
+
+    freq_acum = freq_rel_acum = freq_perc_acum = 0
+    for intervalo in intervalos:
+        freq_acum += intervalo['frequencia']
+        intervalo['frequencia_acumulada'] = freq_acum
+
+        intervalo['frequencia_relativa'] = intervalo['frequencia'] / n_total
+        freq_rel_acum += intervalo['frequencia_relativa']
+        intervalo['frequencia_relativa_acumulada'] = freq_acum / n_total if exata else freq_rel_acum
+
+        intervalo['frequencia_percentual'] = round(intervalo['frequencia_relativa'] * 100, 2)
+        freq_perc_acum += intervalo['frequencia_percentual']
+        intervalo['frequencia_percentual_acumulada'] = round(
+            freq_acum * 100 / n_total if exata else freq_perc_acum, 2)
+
+    return intervalos
+
+
+class FrequencyTable(Sequence):
+    """
+    Tabela de frequências em colunas: limites de classe (k + 1 valores) e os
+    vetores Fi, Fac, Fr, Frac, F% e Fac%, cada um contíguo em memória.
+
+    Os textos dos intervalos só são formatados quando pedidos. Para manter
+    compatibilidade com a antiga lista de dicionários, `tabela[i]` devolve uma
+    visão tipo dicionário da classe i (`tabela[i]['frequencia']`, `.get(...)`),
+    que lê e escreve diretamente nas colunas.
+    """
+
+    __slots__ = ('limites', 'fi', 'fac', 'fr', 'frac', 'fp', 'facp',
+                 'tipo_dados', 'casas_decimais', '_rotulos')
+
+    def __init__(self, limites, tipo_dados=None, casas_decimais=2, rotulos=None):
+        self.limites = np.array(limites, dtype=float)
+        k = len(self.limites) - 1
+        self.fi = np.zeros(k, dtype=np.int64)
+        self.fac = np.zeros(k, dtype=np.int64)
+        self.fr = np.zeros(k)
+        self.frac = np.zeros(k)
+        self.fp = np.zeros(k)
+        self.facp = np.zeros(k)
+        self.tipo_dados = tipo_dados
+        self.casas_decimais = casas_decimais
+        self._rotulos = list(rotulos) if rotulos is not None else None
+
+    @classmethod
+    def de_dicionarios(cls, intervalos, tipo_dados=None, casas_decimais=2):
+        """Converte a lista de dicionários de intervalo (formato antigo) em colunas."""
+        if isinstance(intervalos, FrequencyTable):
+            return intervalos
+        inferiores, superiores = limites_das_classes(intervalos)
+        if not classes_contiguas(inferiores, superiores):
+            raise ValueError("As classes precisam ser contíguas para formar uma FrequencyTable.")
+        limites = np.append(inferiores, superiores[-1])
+        tabela = cls(limites, tipo_dados, casas_decimais,
+                     rotulos=[i['intervalo'] for i in intervalos])
+        for nome, coluna in COLUNAS.items():
+            getattr(tabela, coluna)[:] = [i[nome] for i in intervalos]
+        return tabela
+
+    def copia_vazia(self):
+        """Mesmas classes e rótulos, com todas as frequências zeradas."""
+        return FrequencyTable(self.limites, self.tipo_dados, self.casas_decimais, self._rotulos)
+
+    # ---------- colunas ----------
+
+    @property
+    def inferiores(self):
+        return self.limites[:-1]
+
+    @property
+    def superiores(self):
+        return self.limites[1:]
+
+    @property
+    def pontos_medios(self):
+        """Ponto médio (xi) de cada classe."""
+        return (self.inferiores + self.superiores) / 2
+
+    @property
+    def rotulos(self):
+        """Textos dos intervalos (`li |- ls`), formatados na primeira consulta."""
+        if self._rotulos is None:
+            k = len(self)
+            self._rotulos = [
+                formatar_intervalo(li, ls, i == k - 1, self.tipo_dados, self.casas_decimais)
+                for i, (li, ls) in enumerate(zip(self.inferiores.tolist(), self.superiores.tolist()))
+            ]
+        return self._rotulos
+
+    def preencher(self, n_total, exata=False):
+        """Calcula Fac, Fr, Frac, F% e Fac% a partir de Fi (ver `acumular_frequencias`)."""
+        np.cumsum(self.fi, out=self.fac)
+        np.divide(self.fi, n_total, out=self.fr)
+        if exata:
+            np.divide(self.fac, n_total, out=self.frac)
+            self.fp[:] = [round(fr * 100, 2) for fr in self.fr.tolist()]
+            self.facp[:] = [round(fac * 100 / n_total, 2) for fac in self.fac.tolist()]
+            return self
+        np.cumsum(self.fr, out=self.frac)
+
+        # round() do Python (e não np.round) para manter os mesmos valores da tabela original
+        freq_perc_acum = 0
+        for i, fr in enumerate(self.fr.tolist()):
+            self.fp[i] = round(fr * 100, 2)
+            freq_perc_acum += self.fp[i].item()
+            self.facp[i] = round(freq_perc_acum, 2)
+        return self
+
+    def frequencias_fracionarias(self):
+        """Passa Fi e Fac para float, para somar contagens com pesos não inteiros."""
+        if self.fi.dtype.kind != "f":
+            self.fi = self.fi.astype(float)
+            self.fac = self.fac.astype(float)
+
+    def para_dicionarios(self):
+        """Lista de dicionários independentes, no formato antigo dos intervalos."""
+        return [dict(classe) for classe in self]
+
+    # ---------- sequência ----------
+
+    def __len__(self):
+        return len(self.fi)
+
+    def __getitem__(self, indice):
+        if isinstance(indice, slice):
+            return [self[i] for i in range(*indice.indices(len(self)))]
+        if indice < 0:
+            indice += len(self)
+        if not 0 <= indice < len(self):
+            raise IndexError("classe fora da tabela")
+        return _Classe(self, indice)
+
+    def __eq__(self, outro):
+        if isinstance(outro, (FrequencyTable, list, tuple)):
+            return len(self) == len(outro) and all(a == b for a, b in zip(self, outro))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"FrequencyTable(k={len(self)}, n={int(self.fi.sum())}, tipo={self.tipo_dados!r})"
+
+
+class _Classe(MutableMapping):
+    """Visão tipo dicionário de uma classe de `FrequencyTable`."""
+
+    __slots__ = ('_tabela', '_i')
+
+    def __init__(self, tabela, i):
+        self._tabela = tabela
+        self._i = i
+
+    def __getitem__(self, chave):
+        tabela, i = self._tabela, self._i
+        if chave in COLUNAS:
+            return getattr(tabela, COLUNAS[chave])[i].item()
+        if chave == 'intervalo':
+            return tabela.rotulos[i]
+        if chave == 'limite_inferior':
+            return tabela.limites[i].item()
+        if chave == 'limite_superior':
+            return tabela.limites[i + 1].item()
+        if chave == 'eh_ultima_classe':
+            return i == len(tabela) - 1
+        if chave == 'ponto_medio':
+            return (tabela.limites[i].item() + tabela.limites[i + 1].item()) / 2
+        raise KeyError(chave)
+
+    def __setitem__(self, chave, valor):
+        tabela, i = self._tabela, self._i
+        if chave in COLUNAS:
+            getattr(tabela, COLUNAS[chave])[i] = valor
+        elif chave == 'intervalo':
+            tabela.rotulos[i] = valor
+        else:
+            # os limites são compartilhados entre classes vizinhas
+            raise KeyError(f"{chave!r} não pode ser alterado por classe")
+
+    def __delitem__(self, chave):
+        raise TypeError("as colunas de uma FrequencyTable não podem ser removidas")
+
+    def __iter__(self):
+        return iter(CHAVES)
+
+    def __len__(self):
+        return len(CHAVES)
+
+    def __repr__(self):
+        return repr(dict(self))
@@ -0,0 +1,99 @@
+import math
+
+import numpy as np
+
+from agrupadas import estatisticas_agrupadas
+from contagem import contar_classes_por_grupo
+from resumo import TAMANHO_BLOCO
+from tabela import TabelaIntervaloClasse
+
+
+class TabelaGrupos:
+    """
+    Tabelas de frequência de vários grupos (por máquina, por turno...) sobre as
+    mesmas classes.
+
+    Os limites são gerados uma única vez a partir de todos os valores juntos
+    (mesma regra, casas decimais e tipo de `TabelaIntervaloClasse`), de modo que
+    as tabelas dos grupos são comparáveis classe a classe. A contagem percorre
+    os dados uma vez só, com um `bincount` sobre (grupo, classe), em vez de uma
+    tabela e uma passada por grupo.
+
+    Os grupos aparecem em ordem crescente (a ordem de `np.unique`).
+    """
+
+    def __init__(self, grupos, valores, casas_decimais=2, regra_classes="sturges",
+                 limites_classes=None):
+        grupos = np.asarray(grupos).ravel()
+        self.tabela = TabelaIntervaloClasse()
+        self.tabela.dados = valores
+        if grupos.size != self.tabela.vetor.size:
+            raise ValueError("Grupos e valores devem ter o mesmo tamanho.")
+
+        self.tabela.casas_decimais = casas_decimais
+        self.tabela.regra_classes = regra_classes
+        self.tabela.limites_classes = limites_classes
+        self.nomes, self.codigos = np.unique(grupos, return_inverse=True)
+        self.intervalos = None
+        self.contagens = None  # matriz grupos × classes
+        self.fora = None  # {grupo: valores que não caíram em nenhuma classe}
+        self._tabelas = None
+
+    @classmethod
+    def de_registros(cls, registros, **opcoes):
+        """Grupos a partir de pares (grupo, valor)."""
+        registros = list(registros)
+        grupos = [grupo for grupo, _ in registros]
+        valores = np.fromiter((valor for _, valor in registros), dtype=float, count=len(registros))
+        return cls(grupos, valores, **opcoes)
+
+    @property
+    def tipo_dados(self):
+        return self.tabela.tipo_dados
+
+    def construir(self):
+        """
+        Tabelas por grupo: dicionário {grupo: FrequencyTable}, todas com os
+        mesmos limites, com Fr e F% relativos ao total contado nas classes de
+        cada grupo (com `limites_classes`, os valores de fora ficam em `fora`).
+        """
+        if self._tabelas is not None:
+            return self._tabelas
+        if not self.tabela.tem_dados():
+            raise ValueError("Não há dados para montar as tabelas.")
+        if self.tabela.tipo_dados is None:
+            self.tabela.definir_tipo_dados()
+
+        self.intervalos = self.tabela.gerar_intervalos()
+        inferiores, superiores = self.intervalos.inferiores, self.intervalos.superiores
+        discretos = self.tipo_dados == "Discretos"
+
+        vetor = self.tabela.vetor
+        contagens = np.zeros((len(self.nomes), len(self.intervalos)), dtype=np.int64)
+        for inicio in range(0, vetor.size, TAMANHO_BLOCO):
+            fim = inicio + TAMANHO_BLOCO
+            contagens += contar_classes_por_grupo(self.codigos[inicio:fim], vetor[inicio:fim],
+                                                  inferiores, superiores, discretos, len(self.nomes))
+        self.contagens = contagens
+
+        dentro = contagens.sum(axis=1)
+        tamanhos = np.bincount(self.codigos, minlength=len(self.nomes))
+        self.fora = dict(zip(self.nomes.tolist(), (tamanhos - dentro).tolist()))
+        self._tabelas = {}
+        for nome, fi, n in zip(self.nomes.tolist(), contagens, dentro.tolist()):
+            tabela = self.intervalos.copia_vazia()
+            tabela.fi[:] = fi
+            self._tabelas[nome] = tabela.preencher(n if n > 0 else math.inf)
+        return self._tabelas
+
+    def total(self):
+        """Tabela de todos os grupos juntos (soma das contagens)."""
+        self.construir()
+        total = self.intervalos.copia_vazia()
+        total.fi[:] = self.contagens.sum(axis=0)
+        n = total.fi.sum().item()
+        return total.preencher(n if n > 0 else math.inf)
+
+    def estatisticas(self):
+        """Medidas dos dados agrupados (média, mediana, moda...) de cada grupo."""
+        return {nome: estatisticas_agrupadas(tabela) for nome, tabela in self.construir().items()}
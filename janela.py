@@ -0,0 +1,139 @@
+import collections
+import math
+import time
+
+import numpy as np
+
+from contagem import indices_de_classe
+from frequencias import FrequencyTable
+
+MODOS = ("ultimos", "tempo", "decaimento")
+
+# Com decaimento, os pesos são guardados numa escala que cresce com o tempo;
+# acima deste expoente (em meias-vidas) a escala é trazida de volta para 1
+EXPOENTE_MAXIMO = 512
+
+
+class TabelaJanela:
+    """
+    Tabela de frequências de uma janela móvel de dados que chegam continuamente,
+    sobre classes fixas (por exemplo, as de `TabelaIntervaloClasse.gerar_intervalos`).
+
+    - `tamanho=N`: só os últimos N valores (buffer circular com o índice da
+      classe de cada valor);
+    - `duracao=T`: só os valores dos últimos T segundos (fila de lotes com seus
+      instantes);
+    - `meia_vida=H`: todos os valores, com peso que cai à metade a cada H
+      segundos (decaimento exponencial).
+
+    Cada valor que entra ou sai custa O(1): só o contador da sua classe muda, e
+    a tabela nunca é recontada. `tabela()` monta as colunas (Fac, Fr, F%...) a
+    partir dos contadores, em O(k), quando for exibir.
+    """
+
+    def __init__(self, intervalos, tipo_dados="Contínuos", tamanho=None, duracao=None,
+                 meia_vida=None, relogio=time.monotonic):
+        if sum(opcao is not None for opcao in (tamanho, duracao, meia_vida)) != 1:
+            raise ValueError("Informe um (e só um) entre tamanho, duracao e meia_vida.")
+
+        self.classes = FrequencyTable.de_dicionarios(intervalos, tipo_dados).copia_vazia()
+        self.tipo_dados = tipo_dados
+        self.relogio = relogio
+        self.fora = 0  # valores recebidos que não caíram em nenhuma classe
+        self.versao = 0  # muda a cada atualização; a tela só redesenha quando ela muda
+        k = len(self.classes)
+
+        if tamanho is not None:
+            self.modo = "ultimos"
+            self.tamanho = int(tamanho)
+            self._buffer = np.full(self.tamanho, -1, dtype=np.int64)
+            self._posicao = 0
+            self._ocupado = 0
+            self._contagens = np.zeros(k, dtype=np.int64)
+        elif duracao is not None:
+            self.modo = "tempo"
+            self.duracao = float(duracao)
+            self._lotes = collections.deque()  # (instante, índices de classe)
+            self._contagens = np.zeros(k, dtype=np.int64)
+        else:
+            self.modo = "decaimento"
+            self.meia_vida = float(meia_vida)
+            self._origem = relogio()  # instante em que a escala dos pesos vale 1
+            self._contagens = np.zeros(k)
+
+    @classmethod
+    def de_tabela(cls, tabela, **janela):
+        """Janela vazia com as classes de `tabela`; `janela` é tamanho, duracao ou meia_vida."""
+        return cls(tabela.gerar_intervalos(), tabela.tipo_dados, **janela)
+
+    def adicionar(self, valores, instante=None):
+        """Acrescenta novos valores (um número ou um lote) e descarta os que saíram da janela."""
+        valores = np.atleast_1d(np.asarray(valores, dtype=float)).ravel()
+        instante = self.relogio() if instante is None else instante
+        indices = indices_de_classe(valores, self.classes.inferiores, self.classes.superiores,
+                                    self.tipo_dados == "Discretos")
+        self.fora += int(np.count_nonzero(indices < 0))
+
+        if self.modo == "ultimos":
+            self._adicionar_ultimos(indices)
+        elif self.modo == "tempo":
+            self._lotes.append((instante, indices))
+            np.add.at(self._contagens, indices[indices >= 0], 1)
+            self._expirar(instante)
+        else:
+            self._adicionar_com_decaimento(indices, instante)
+        self.versao += 1
+
+    def _adicionar_ultimos(self, indices):
+        if indices.size > self.tamanho:
+            indices = indices[-self.tamanho:]  # os mais antigos sairiam no mesmo lote
+        m = indices.size
+        posicoes = (self._posicao + np.arange(m)) % self.tamanho
+
+        saindo = self._buffer[posicoes]
+        np.subtract.at(self._contagens, saindo[saindo >= 0], 1)
+        self._buffer[posicoes] = indices
+        np.add.at(self._contagens, indices[indices >= 0], 1)
+
+        self._posicao = (self._posicao + m) % self.tamanho
+        self._ocupado = min(self._ocupado + m, self.tamanho)
+
+    def _expirar(self, agora):
+        limite = agora - self.duracao
+        while self._lotes and self._lotes[0][0] <= limite:
+            _, indices = self._lotes.popleft()
+            np.subtract.at(self._contagens, indices[indices >= 0], 1)
+
+    def _adicionar_com_decaimento(self, indices, instante):
+        # peso 2^((t - origem) / H) na escala guardada: os valores antigos não
+        # precisam ser multiplicados a cada atualização
+        expoente = (instante - self._origem) / self.meia_vida
+        if expoente > EXPOENTE_MAXIMO:
+            self._contagens *= 2.0 ** -expoente
+            self._origem = instante
+            expoente = 0.0
+        np.add.at(self._contagens, indices[indices >= 0], 2.0 ** expoente)
+
+    def contagens(self, agora=None):
+        """Frequência atual de cada classe (pesos, no modo com decaimento)."""
+        agora = self.relogio() if agora is None else agora
+        if self.modo == "tempo":
+            self._expirar(agora)
+        if self.modo == "decaimento":
+            return self._contagens * 2.0 ** -((agora - self._origem) / self.meia_vida)
+        return self._contagens.copy()
+
+    @property
+    def n(self):
+        """Valores na janela (peso total, no modo com decaimento)."""
+        return float(self.contagens().sum()) if self.modo == "decaimento" else int(self.contagens().sum())
+
+    def tabela(self, agora=None):
+        """FrequencyTable da janela atual, com Fac, Fr, Frac, F% e Fac% preenchidos."""
+        contagens = self.contagens(agora)
+        tabela = self.classes.copia_vazia()
+        if self.modo == "decaimento":
+            tabela.frequencias_fracionarias()
+        tabela.fi[:] = contagens
+        total = contagens.sum()
+        return tabela.preencher(total if total > 0 else math.inf)
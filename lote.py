@@ -0,0 +1,180 @@
+"""
+Geração de tabelas em lote, sem interação e sem interface gráfica:
+
+    python -m tabela build dados1.csv dados2.npy --decimals 2 --format json
+
+Os arquivos são processados por um mesmo conjunto de processos trabalhadores e
+cada resultado (tabela e estatísticas) vai para a saída padrão ou, com
+`--saida`, para um arquivo por entrada. Só NumPy é importado: nem matplotlib
+nem tkinter entram no caminho.
+"""
+import argparse
+import csv
+import io
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import desempenho
+from regras import REGRAS
+from tabela import abrir_tabela
+
+FORMATOS = ("text", "json", "csv")
+EXTENSOES = {"text": ".txt", "json": ".json", "csv": ".csv"}
+
+CAMPOS_CSV = ("arquivo", "classe", "intervalo", "limite_inferior", "limite_superior",
+              "frequencia", "frequencia_acumulada", "frequencia_relativa",
+              "frequencia_relativa_acumulada", "frequencia_percentual",
+              "frequencia_percentual_acumulada", "ponto_medio")
+
+# colunas do cálculo da variância, incluídas por classe quando existem
+COLUNAS_VARIANCIA = {'xi_fi': 'xi_fi', 'desvios_quadrados_fi': 'desvio_quadrado_fi'}
+
+
+def construir(caminho, casas_decimais=2, regra="sturges", formato="json"):
+    """
+    Monta a tabela de um arquivo e devolve o resultado serializável: limites,
+    colunas de frequência e estatísticas, e o texto de `exibir_tabela` quando
+    `formato` é "text".
+    """
+    tabela = abrir_tabela(caminho)
+    tabela.casas_decimais = casas_decimais
+    tabela.regra_classes = regra
+    tabela.definir_tipo_dados()
+    if not tabela.tem_dados():
+        raise ValueError("O arquivo não contém dados.")
+
+    intervalos, estatisticas = tabela.construir()
+
+    classes = [{chave: classe[chave] for chave in CAMPOS_CSV[2:]} for classe in intervalos]
+    for chave, nome in COLUNAS_VARIANCIA.items():
+        if chave in estatisticas:
+            for classe, valor in zip(classes, estatisticas[chave].tolist()):
+                classe[nome] = valor
+
+    resultado = {
+        'arquivo': caminho,
+        'n': estatisticas['n'],
+        'tipo_dados': tabela.tipo_dados,
+        'casas_decimais': casas_decimais,
+        'estatisticas': {chave: valor for chave, valor in estatisticas.items()
+                         if not isinstance(valor, np.ndarray)},
+        'classes': classes,
+    }
+    if formato == "text":
+        resultado['texto'] = tabela.texto_da_tabela(intervalos, estatisticas)
+    return resultado
+
+
+def _construir_ou_erro(caminho, casas_decimais, regra, formato, perfil=False):
+    # o erro vira o resultado deste arquivo, e os outros continuam sendo montados
+    if perfil:
+        # medido no próprio processo trabalhador; os registros voltam com o resultado
+        desempenho.limpar()
+        desempenho.ativar()
+    try:
+        resultado = construir(caminho, casas_decimais, regra, formato)
+    except Exception as erro:
+        resultado = {'arquivo': caminho, 'erro': str(erro) or type(erro).__name__}
+    if perfil:
+        desempenho.desativar()
+        resultado['desempenho'] = desempenho.registros()
+    return resultado
+
+
+def construir_varios(caminhos, casas_decimais=2, regra="sturges", formato="json", trabalhadores=None,
+                     perfil=False):
+    """
+    Resultados de `construir` para vários arquivos, na ordem dada. Com mais de um
+    arquivo e de um trabalhador, os arquivos são distribuídos em um único pool de
+    processos, aberto uma vez para o lote inteiro. Com `perfil`, cada resultado
+    traz em 'desempenho' os registros de `desempenho` daquele arquivo.
+    """
+    trabalhadores = min(trabalhadores or os.cpu_count() or 1, len(caminhos))
+    argumentos = ([casas_decimais] * len(caminhos), [regra] * len(caminhos), [formato] * len(caminhos),
+                  [perfil] * len(caminhos))
+    if trabalhadores <= 1:
+        yield from map(_construir_ou_erro, caminhos, *argumentos)
+        return
+    with ProcessPoolExecutor(max_workers=trabalhadores) as executor:
+        yield from executor.map(_construir_ou_erro, caminhos, *argumentos)
+
+
+def formatar(resultados, formato):
+    """Texto de saída de uma lista de resultados no formato pedido."""
+    if formato == "text":
+        return "\n".join(f"\n# {r['arquivo']}\n{r['texto']}" for r in resultados) + "\n"
+
+    if formato == "json":
+        # uma linha (JSON Lines) por arquivo
+        return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in resultados)
+
+    saida = io.StringIO()
+    escritor = csv.DictWriter(saida, fieldnames=CAMPOS_CSV, extrasaction="ignore", lineterminator="\n")
+    escritor.writeheader()
+    for r in resultados:
+        for i, classe in enumerate(r['classes'], 1):
+            escritor.writerow({'arquivo': r['arquivo'], 'classe': i, **classe})
+    return saida.getvalue()
+
+
+def _caminho_de_saida(pasta, caminho, formato):
+    nome = os.path.splitext(os.path.basename(caminho))[0]
+    return os.path.join(pasta, nome + EXTENSOES[formato])
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(prog="python -m tabela", description=__doc__.strip().splitlines()[0])
+    comandos = parser.add_subparsers(dest="comando", required=True)
+    build = comandos.add_parser("build", help="gera as tabelas de um ou mais arquivos")
+    build.add_argument("arquivos", nargs="+", metavar="ARQUIVO",
+                       help="arquivos de dados (texto, .npy, .f64 ou .i32)")
+    build.add_argument("--decimals", type=int, default=2, help="casas decimais (padrão: 2)")
+    build.add_argument("--format", choices=FORMATOS, default="text", help="formato da saída")
+    build.add_argument("--regra", choices=tuple(REGRAS), default="sturges",
+                       help="regra para o número de classes")
+    build.add_argument("--trabalhadores", type=int, default=None,
+                       help="processos trabalhadores (padrão: um por núcleo)")
+    build.add_argument("--saida", metavar="PASTA",
+                       help="grava um arquivo por entrada nesta pasta em vez da saída padrão")
+    build.add_argument("--perfil", metavar="ARQUIVO.json",
+                       help="grava o tempo, a CPU e a memória de cada etapa neste arquivo JSON")
+    args = parser.parse_args(argumentos)
+
+    if args.saida:
+        os.makedirs(args.saida, exist_ok=True)
+
+    falhas = escritos = 0
+    perfis = []
+    for resultado in construir_varios(args.arquivos, args.decimals, args.regra, args.format,
+                                      args.trabalhadores, perfil=bool(args.perfil)):
+        if args.perfil:
+            registros = resultado.pop('desempenho')
+            perfis.append({'arquivo': resultado['arquivo'], **desempenho.para_json(registros)})
+        if 'erro' in resultado:
+            print(f"Erro em {resultado['arquivo']}: {resultado['erro']}", file=sys.stderr)
+            falhas += 1
+            continue
+        texto = formatar([resultado], args.format)
+        if args.saida:
+            with open(_caminho_de_saida(args.saida, resultado['arquivo'], args.format), "w",
+                      encoding="utf-8") as arquivo:
+                arquivo.write(texto)
+        else:
+            if args.format == "csv" and escritos:
+                # cabeçalho só uma vez na saída padrão
+                texto = texto.partition("\n")[2]
+            sys.stdout.write(texto)
+        escritos += 1
+
+    if args.perfil:
+        with open(args.perfil, "w", encoding="utf-8") as arquivo:
+            json.dump({'arquivos': perfis}, arquivo, indent=2, ensure_ascii=False)
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,235 @@
+import os
+from concurrent.futures import ProcessPoolExecutor, wait
+from contextlib import ExitStack
+from multiprocessing import resource_tracker, shared_memory
+
+import numpy as np
+
+from cache import digest_arquivo
+from contagem import contar_classes
+from fluxo import TAMANHO_BLOCO, inicio_dos_dados, ler_blocos, ler_faixa
+from frequencias import limites_das_classes, somar_frequencias
+from resumo import Resumo, combinar_momentos, momentos
+from tabela import TabelaIntervaloClasse
+
+# Valores percorridos por vez dentro de cada fatia
+BLOCO_VALORES = 1 << 20
+
+# Segundos entre verificações de `verificar_interrupcao` enquanto as fatias rodam
+INTERVALO_VERIFICACAO = 0.1
+
+if os.name == "posix":
+    # trabalhadores criados depois disto compartilham o rastreador de memória
+    # compartilhada do processo principal, que é quem remove os segmentos
+    resource_tracker.ensure_running()
+
+
+# ===================== TRABALHADORES ===============================
+
+def _percorrer(fonte, inicio, fim, funcao):
+    """Aplica `funcao` a cada bloco da fatia [inicio, fim) da fonte."""
+    if fonte[0] == "arquivo":
+        _, caminho, tamanho_bloco = fonte
+        for bloco in ler_faixa(caminho, inicio, fim, tamanho_bloco):
+            funcao(bloco)
+        return
+
+    _, nome, n = fonte
+    memoria = _anexar(nome)
+    vetor = None
+    try:
+        vetor = np.ndarray((n,), dtype=np.float64, buffer=memoria.buf)
+        for i in range(inicio, fim, BLOCO_VALORES):
+            funcao(vetor[i:min(i + BLOCO_VALORES, fim)])
+    finally:
+        vetor = None
+        memoria.close()
+
+
+def _anexar(nome):
+    try:
+        return shared_memory.SharedMemory(name=nome, track=False)  # Python 3.13+
+    except TypeError:
+        return shared_memory.SharedMemory(name=nome)
+
+
+def _resumir_fatia(fonte, inicio, fim):
+    resumo = Resumo()
+    _percorrer(fonte, inicio, fim, resumo.atualizar)
+    return resumo
+
+
+def _contar_fatia(fonte, inicio, fim, inferiores, superiores, discretos):
+    contagens = np.zeros(len(superiores), dtype=np.int64)
+    parcial = (0, 0.0, 0.0)
+
+    def contar(bloco):
+        nonlocal parcial
+        contagens[:] += contar_classes(bloco, inferiores, superiores, discretos)
+        parcial = combinar_momentos(parcial, momentos(bloco))
+
+    _percorrer(fonte, inicio, fim, contar)
+    return contagens, parcial
+
+
+# ===================== TABELA ===============================
+
+class TabelaParalela(TabelaIntervaloClasse):
+    """
+    Tabela de intervalo de classe calculada em vários processos.
+
+    Os dados (`dados` ou o arquivo em `caminho`) são divididos em fatias, uma por
+    trabalhador. Cada processo calcula o resumo parcial (mínimo, máximo, n) e,
+    depois, as contagens por classe e os momentos (n, média, M2) da sua fatia; os
+    parciais são reduzidos na lista de intervalos habitual. Em memória, as fatias
+    são lidas de uma memória compartilhada, sem copiar os dados para cada processo.
+    Em `construir`, as duas passadas usam o mesmo segmento e o mesmo conjunto de
+    processos; usada num `with`, a tabela os mantém até o fim do bloco (inclusive
+    para `definir_tipo_dados`, que calcula o resumo).
+    """
+
+    def __init__(self, trabalhadores=None, caminho=None, pular_linhas=0,
+                 tamanho_bloco=TAMANHO_BLOCO, executor=None):
+        super().__init__()
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.caminho = caminho
+        self.pular_linhas = pular_linhas
+        self.tamanho_bloco = tamanho_bloco
+        self.executor = executor
+        self.momentos = None  # (n, média, M2) da última contagem
+        self._recursos = None  # compartilhados pelas passadas de `construir`
+
+    @property
+    def resumo(self):
+        if self._pesos is not None:
+            raise ValueError("TabelaParalela não aceita pesos; use TabelaIntervaloClasse.")
+        if self._resumo is None:
+            resumo = Resumo()
+            for parcial in self._distribuir(_resumir_fatia):
+                resumo.combinar(parcial)
+            self._resumo = resumo
+        return self._resumo
+
+    def __enter__(self):
+        self._recursos = _Recursos()
+        return self
+
+    def __exit__(self, *erro):
+        recursos, self._recursos = self._recursos, None
+        recursos.__exit__(*erro)
+
+    def construir(self):
+        if self._recursos is not None:
+            return super().construir()
+        with self:
+            return super().construir()
+
+    @property
+    def digest(self):
+        if self.caminho is None:
+            return super().digest
+        if self._digest is None:
+            self._digest = digest_arquivo(self.caminho, self.pular_linhas)
+        return self._digest
+
+    def _blocos(self):
+        if self.caminho is None:
+            yield from super()._blocos()
+        else:
+            yield from self._verificando(ler_blocos(self.caminho, self.tamanho_bloco, self.pular_linhas))
+
+    def modo_quantis_padrao(self):
+        if self.caminho is None:
+            return super().modo_quantis_padrao()
+        return "aproximado"  # como em TabelaArquivo
+
+    def _todos_os_dados(self):
+        if self.caminho is None:
+            return super()._todos_os_dados()
+        return np.concatenate(list(self._blocos()) or [np.empty(0)])
+
+    def _contar_vetorizado(self, intervalos):
+        inferiores, superiores = limites_das_classes(intervalos)
+        discretos = self.tipo_dados == "Discretos"
+
+        contagens = np.zeros(len(intervalos), dtype=np.int64)
+        self.momentos = (0, 0.0, 0.0)
+        for parcial, momento in self._distribuir(_contar_fatia, inferiores, superiores, discretos):
+            contagens += parcial
+            self.momentos = combinar_momentos(self.momentos, momento)
+
+        somar_frequencias(intervalos, contagens)
+
+    def _distribuir(self, funcao, *args):
+        """Executa `funcao` em cada fatia dos dados e devolve os resultados parciais."""
+        if self._recursos is not None:
+            return self._distribuir_com(self._recursos, funcao, args)
+        with _Recursos() as recursos:
+            return self._distribuir_com(recursos, funcao, args)
+
+    def _distribuir_com(self, recursos, funcao, args):
+        if recursos.fonte is None:
+            recursos.fonte, recursos.fatias = self._preparar_fonte(recursos.pilha)
+        executor = self.executor
+        if executor is None:
+            if recursos.executor is None:
+                recursos.executor = recursos.pilha.enter_context(
+                    ProcessPoolExecutor(max_workers=self.trabalhadores))
+            executor = recursos.executor
+        return self._mapear(executor, funcao, recursos.fonte, recursos.fatias, args)
+
+    def _preparar_fonte(self, pilha):
+        """Fonte lida pelos trabalhadores e suas fatias; a memória compartilhada fica na `pilha`."""
+        if self.caminho is not None:
+            fonte = ("arquivo", self.caminho, self.tamanho_bloco)
+            inicio = inicio_dos_dados(self.caminho, self.pular_linhas)
+            fim = os.path.getsize(self.caminho)
+            return fonte, _fatias(inicio, fim, self.trabalhadores)
+
+        vetor = np.ascontiguousarray(self.vetor, dtype=np.float64)
+        memoria = shared_memory.SharedMemory(create=True, size=max(vetor.nbytes, 1))
+        pilha.callback(memoria.unlink)
+        pilha.callback(memoria.close)
+        np.ndarray(vetor.shape, dtype=np.float64, buffer=memoria.buf)[:] = vetor
+        return ("memoria", memoria.name, vetor.size), _fatias(0, vetor.size, self.trabalhadores)
+
+    def _mapear(self, executor, funcao, fonte, fatias, args):
+        futuros = [executor.submit(funcao, fonte, inicio, fim, *args) for inicio, fim in fatias]
+        if self.verificar_interrupcao is not None:
+            # as fatias rodam em outros processos: a interrupção é verificada
+            # enquanto se espera por elas, e as que ainda não começaram são canceladas
+            pendentes = futuros
+            try:
+                while pendentes:
+                    _, pendentes = wait(pendentes, timeout=INTERVALO_VERIFICACAO)
+                    self.verificar_interrupcao()
+            except BaseException:
+                for futuro in futuros:
+                    futuro.cancel()
+                raise
+        return [futuro.result() for futuro in futuros]
+
+
+class _Recursos:
+    """
+    Memória compartilhada (com as fatias) e processos trabalhadores, criados no
+    primeiro uso e liberados juntos na saída do `with`.
+    """
+
+    def __init__(self):
+        self.pilha = ExitStack()
+        self.fonte = None
+        self.fatias = None
+        self.executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *erro):
+        self.pilha.close()
+
+
+def _fatias(inicio, fim, partes):
+    """Divide [inicio, fim) em até `partes` fatias contíguas de tamanho parecido."""
+    limites = np.linspace(inicio, fim, max(1, partes) + 1).astype(np.int64).tolist()
+    return [(a, b) for a, b in zip(limites[:-1], limites[1:]) if b > a]
@@ -0,0 +1,131 @@
+import math
+
+import numpy as np
+
+QUARTIS = (0.25, 0.5, 0.75)
+MODOS = ("exato", "aproximado")
+ERRO_PADRAO = 0.01
+
+
+def quantis_exatos(dados, probabilidades=QUARTIS):
+    """
+    Quantis exatos (interpolação linear, como `np.quantile`) por seleção.
+
+    Em vez de ordenar todos os dados, `np.partition` posiciona apenas os
+    elementos vizinhos de cada posição pedida: O(n) em vez de O(n log n).
+    """
+    vetor = np.asarray(dados, dtype=float).ravel()
+    if vetor.size == 0:
+        raise ValueError("Não há dados para calcular quantis.")
+
+    posicoes = np.asarray(probabilidades, dtype=float) * (vetor.size - 1)
+    abaixo = np.floor(posicoes).astype(np.int64)
+    acima = np.ceil(posicoes).astype(np.int64)
+
+    particionado = np.partition(vetor, np.unique(np.concatenate((abaixo, acima))))
+    fracao = posicoes - abaixo
+    return particionado[abaixo] + (particionado[acima] - particionado[abaixo]) * fracao
+
+
+def quantis_ponderados(valores, pesos, probabilidades=QUARTIS):
+    """
+    Quantis de valores com frequências (`pesos`), iguais aos de `quantis_exatos`
+    sobre os dados expandidos (cada valor repetido `peso` vezes) quando os pesos
+    são inteiros, mas com custo O(m log m) nos m valores distintos.
+    """
+    valores = np.asarray(valores, dtype=float).ravel()
+    pesos = np.asarray(pesos, dtype=float).ravel()
+    presentes = pesos > 0
+    valores, pesos = valores[presentes], pesos[presentes]
+    if valores.size == 0:
+        raise ValueError("Não há dados para calcular quantis.")
+
+    ordem = np.argsort(valores, kind="stable")
+    valores = valores[ordem]
+    acumulado = np.cumsum(pesos[ordem])
+
+    # posição (a partir de 0) nos dados expandidos e o valor que a ocupa
+    posicoes = np.asarray(probabilidades, dtype=float) * (acumulado[-1] - 1)
+    abaixo = np.floor(posicoes)
+    ultimo = valores.size - 1
+    valor_abaixo = valores[np.minimum(np.searchsorted(acumulado, abaixo, side="right"), ultimo)]
+    valor_acima = valores[np.minimum(np.searchsorted(acumulado, abaixo + 1, side="right"), ultimo)]
+    return valor_abaixo + (valor_acima - valor_abaixo) * (posicoes - abaixo)
+
+
+class EsbocoKLL:
+    """
+    Esboço KLL para quantis aproximados com memória limitada.
+
+    Guarda no máximo algumas vezes `k` valores, qualquer que seja n; o erro de
+    posição fica em torno de `erro` (fração de n). Esboços de partes diferentes
+    dos dados (blocos, arquivos, processos) podem ser combinados com `merge`.
+    """
+
+    FATOR_CAPACIDADE = 2 / 3
+
+    def __init__(self, erro=ERRO_PADRAO, semente=None):
+        if not 0 < erro < 1:
+            raise ValueError("O erro deve estar entre 0 e 1.")
+        self.erro = erro
+        self.k = max(8, math.ceil(1.7 / erro))
+        self.n = 0
+        self.niveis = [np.empty(0)]
+        self._aleatorio = np.random.default_rng(semente)
+
+    def _capacidade(self, nivel):
+        profundidade = len(self.niveis) - nivel - 1
+        return max(2, math.ceil(self.k * self.FATOR_CAPACIDADE ** profundidade))
+
+    def atualizar(self, bloco):
+        """Acrescenta um bloco de valores ao esboço."""
+        bloco = np.asarray(bloco, dtype=float).ravel()
+        if bloco.size == 0:
+            return self
+        self.n += int(bloco.size)
+        self.niveis[0] = np.concatenate((self.niveis[0], bloco))
+        self._compactar()
+        return self
+
+    def merge(self, outro):
+        """Junta outro esboço a este."""
+        while len(self.niveis) < len(outro.niveis):
+            self.niveis.append(np.empty(0))
+        for nivel, valores in enumerate(outro.niveis):
+            self.niveis[nivel] = np.concatenate((self.niveis[nivel], valores))
+        self.n += outro.n
+        self._compactar()
+        return self
+
+    def _compactar(self):
+        nivel = 0
+        while nivel < len(self.niveis):
+            valores = self.niveis[nivel]
+            if valores.size > self._capacidade(nivel):
+                if nivel == len(self.niveis) - 1:
+                    self.niveis.append(np.empty(0))
+                valores = np.sort(valores)
+                # com tamanho ímpar, o primeiro valor fica no nível
+                sobra = valores.size % 2
+                deslocamento = sobra + int(self._aleatorio.integers(2))
+                promovidos = valores[deslocamento::2]
+                self.niveis[nivel] = valores[:sobra]
+                self.niveis[nivel + 1] = np.concatenate((self.niveis[nivel + 1], promovidos))
+            nivel += 1
+
+    def quantis(self, probabilidades=QUARTIS):
+        """Quantis aproximados a partir dos valores guardados e seus pesos (2^nível)."""
+        if self.n == 0:
+            raise ValueError("Não há dados para calcular quantis.")
+        valores = np.concatenate(self.niveis)
+        pesos = np.concatenate([np.full(v.size, 2.0 ** nivel) for nivel, v in enumerate(self.niveis)])
+        ordem = np.argsort(valores, kind="stable")
+        valores = valores[ordem]
+        acumulado = np.cumsum(pesos[ordem])
+
+        alvo = np.asarray(probabilidades, dtype=float) * acumulado[-1]
+        indices = np.searchsorted(acumulado, alvo, side="left")
+        return valores[np.minimum(indices, valores.size - 1)]
+
+    def __len__(self):
+        return sum(v.size for v in self.niveis)
@@ -0,0 +1,51 @@
+import math
+
+# Regras para o número de classes (k) e o nome exibido na tabela
+REGRAS = {
+    "sturges": "Sturges",
+    "raiz": "Raiz quadrada",
+    "rice": "Rice",
+    "scott": "Scott",
+    "freedman_diaconis": "Freedman-Diaconis",
+}
+
+# regras que dependem do desvio padrão ou do intervalo interquartil
+PRECISA_DESVIO = ("scott",)
+PRECISA_IQR = ("freedman_diaconis",)
+
+# Limite de k para Scott e Freedman-Diaconis: um valor isolado longe dos demais
+# faz a amplitude / h crescer sem limite (milhões de classes quase todas vazias)
+MAXIMO_CLASSES = 1000
+
+
+def numero_de_classes(regra, n, amplitude, desvio_padrao=None, iqr=None):
+    """
+    Número de classes k pela regra escolhida, em O(1) a partir do resumo dos dados:
+
+    - sturges: k = 1 + 3,322·log10(n)
+    - raiz: k = √n
+    - rice: k = 2·n^(1/3)
+    - scott: h = 3,49·σ·n^(-1/3) e k = amplitude / h
+    - freedman_diaconis: h = 2·IQR·n^(-1/3) e k = amplitude / h
+
+    Scott e Freedman-Diaconis caem para Sturges quando h é zero (σ ou IQR nulos);
+    o k delas é limitado a MAXIMO_CLASSES e ao número de valores.
+    """
+    if regra not in REGRAS:
+        raise ValueError(f"Regra desconhecida: {regra!r} (use uma de {tuple(REGRAS)}).")
+
+    if regra == "raiz":
+        return max(1, math.ceil(math.sqrt(n)))
+    if regra == "rice":
+        return max(1, math.ceil(2 * n ** (1 / 3)))
+
+    if regra in PRECISA_DESVIO or regra in PRECISA_IQR:
+        if regra in PRECISA_DESVIO:
+            largura = 3.49 * desvio_padrao * n ** (-1 / 3)
+        else:
+            largura = 2 * iqr * n ** (-1 / 3)
+        if largura > 0 and amplitude > 0:
+            return max(1, min(math.ceil(amplitude / largura), MAXIMO_CLASSES, math.ceil(n)))
+
+    # com pesos fracionários n pode ser menor que 1, e a fórmula daria k <= 0
+    return max(1, round(1 + 3.322 * math.log10(n)))
@@ -0,0 +1,157 @@
+import math
+
+import numpy as np
+
+# Blocos de ~8 MB: cada bloco é percorrido enquanto ainda está no cache
+TAMANHO_BLOCO = 1 << 20
+
+
+class Resumo:
+    """
+    Resumo dos dados obtido numa única passada: n, mínimo, máximo, soma,
+    M2 (soma dos quadrados dos desvios em relação à média) e se todos os
+    valores são inteiros.
+
+    Resumos de partes diferentes dos dados podem ser combinados com `combinar`.
+    """
+
+    __slots__ = ("n", "minimo", "maximo", "soma", "m2", "inteiros")
+
+    def __init__(self):
+        self.n = 0
+        self.minimo = math.inf
+        self.maximo = -math.inf
+        self.soma = 0.0
+        self.m2 = 0.0
+        self.inteiros = True
+
+    def atualizar(self, bloco, pesos=None):
+        """
+        Acrescenta um bloco de valores ao resumo. Com `pesos` (frequência de cada
+        valor), n, soma e M2 são ponderados. Valores infinitos ou
+        nan levantam ValueError.
+        """
+        bloco = np.asarray(bloco, dtype=float)
+        if pesos is not None:
+            return self._atualizar_ponderado(bloco, np.asarray(pesos, dtype=float))
+        if bloco.size == 0:
+            return self
+
+        self._atualizar_extremos(bloco)
+        soma = float(bloco.sum())
+        desvios = bloco - soma / bloco.size
+        self._juntar(int(bloco.size), soma, float(np.dot(desvios, desvios)))
+        if self.inteiros:
+            self.inteiros = bool(np.all(bloco == np.trunc(bloco)))
+        return self
+
+    def _atualizar_ponderado(self, bloco, pesos):
+        presentes = pesos > 0
+        if not presentes.any():
+            return self
+        bloco, pesos = bloco[presentes], pesos[presentes]
+
+        total = float(pesos.sum())
+        self._atualizar_extremos(bloco)
+        soma = float(np.dot(pesos, bloco))
+        desvios = bloco - soma / total
+        self._juntar(int(total) if total.is_integer() else total, soma,
+                     float(np.dot(pesos, desvios * desvios)))
+        if self.inteiros:
+            self.inteiros = bool(np.all(bloco == np.trunc(bloco)))
+        return self
+
+    def _atualizar_extremos(self, bloco):
+        minimo, maximo = float(bloco.min()), float(bloco.max())
+        # inf ou nan aparecem no mínimo ou no máximo: não é preciso outra passada
+        if not (math.isfinite(minimo) and math.isfinite(maximo)):
+            raise ValueError("Os dados contêm valores não finitos (inf ou nan).")
+        self.minimo = min(self.minimo, minimo)
+        self.maximo = max(self.maximo, maximo)
+
+    def _juntar(self, n, soma, m2):
+        # M2 de cada parte é relativo à sua própria média, e as partes são
+        # combinadas pela fórmula de Chan et al.: sem o cancelamento de
+        # soma_quadrados - soma²/n quando os dados estão longe de zero
+        if n == 0:
+            return
+        media = self.soma / self.n if self.n else 0.0
+        self.n, _, self.m2 = combinar_momentos((self.n, media, self.m2), (n, soma / n, m2))
+        self.soma += soma
+
+    def combinar(self, outro):
+        """Junta outro resumo a este (por exemplo, de outro bloco ou arquivo)."""
+        self._juntar(outro.n, outro.soma, outro.m2)
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        self.inteiros = self.inteiros and outro.inteiros
+        return self
+
+    @property
+    def amplitude(self):
+        return self.maximo - self.minimo
+
+    @property
+    def media(self):
+        return self.soma / self.n
+
+    @property
+    def desvio_padrao(self):
+        """Desvio padrão amostral, M2 / (n - 1)."""
+        if self.n < 2:
+            return 0.0
+        return math.sqrt(max(self.m2 / (self.n - 1), 0.0))
+
+    def __repr__(self):
+        return (f"Resumo(n={self.n}, minimo={self.minimo}, maximo={self.maximo}, "
+                f"inteiros={self.inteiros})")
+
+
+def combinar_momentos(a, b):
+    """
+    Combina dois momentos parciais (n, média, M2) pela fórmula de Chan et al.,
+    onde M2 é a soma dos quadrados dos desvios em relação à média.
+    """
+    n_a, media_a, m2_a = a
+    n_b, media_b, m2_b = b
+    if n_b == 0:
+        return a
+    if n_a == 0:
+        return b
+    n = n_a + n_b
+    delta = media_b - media_a
+    return n, media_a + delta * n_b / n, m2_a + m2_b + delta * delta * n_a * n_b / n
+
+
+def momentos(bloco):
+    """Momentos (n, média, M2) de um bloco de valores."""
+    bloco = np.asarray(bloco, dtype=float)
+    if bloco.size == 0:
+        return 0, 0.0, 0.0
+    media = float(bloco.mean())
+    desvios = bloco - media
+    return int(bloco.size), media, float(np.dot(desvios, desvios))
+
+
+def como_vetor(dados):
+    """
+    Vetor NumPy numérico dos dados, sem cópia quando já for um vetor numérico
+    (por exemplo um memmap de int32); listas viram float64.
+    """
+    vetor = np.asarray(dados)
+    if vetor.dtype.kind not in "iuf":
+        vetor = vetor.astype(float)
+    return vetor.ravel()
+
+
+def resumir(dados, tamanho_bloco=TAMANHO_BLOCO, pesos=None):
+    """
+    Calcula o `Resumo` de `dados` percorrendo-os uma única vez, bloco a bloco.
+    `pesos`, se informados, são as frequências de cada valor.
+    """
+    vetor = como_vetor(dados)
+    resumo = Resumo()
+    for inicio in range(0, vetor.size, tamanho_bloco):
+        fim = inicio + tamanho_bloco
+        resumo.atualizar(vetor[inicio:fim], None if pesos is None else pesos[inicio:fim])
+    return resumo
@@ -0,0 +1,184 @@
+"""
+Histograma e ogiva ao vivo de valores lidos da entrada padrão.
+
+Uso:
+    tail -f leituras.txt | python src/ao_vivo.py --tamanho 5000
+    gerador | python src/ao_vivo.py --meia-vida 60 --limites 0 100 --k 20
+
+As classes são fixas: dadas por `--limites` e `--k` ou geradas dos primeiros
+`--inicio` valores (ou de todos os lidos, se a entrada terminar antes); até
+lá a janela já aberta mostra quantos chegaram. Depois disso cada valor só
+atualiza o contador da sua classe numa `TabelaJanela` (últimos N valores,
+últimos T segundos ou decaimento exponencial). A tela é redesenhada a uma taxa fixa (`--fps`), e só
+quando chegaram valores novos, pelo caminho de blitting do `PainelGrafico`.
+"""
+import argparse
+import os
+import queue
+import sys
+import threading
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# colocado na fila pela thread de leitura quando a entrada termina
+FIM = None
+
+
+class VisualizacaoAoVivo:
+    """
+    Atualiza um `PainelGrafico` a partir de uma `TabelaJanela` a `fps` quadros
+    por segundo, com `after` do Tk. Os valores chegam por `fila` (de qualquer
+    thread) e são incluídos na janela na thread da interface, a cada quadro.
+
+    Sem `janela`, os primeiros `inicio` valores são guardados e passados a
+    `criar_janela`, que fixa as classes; se a fila trouxer `FIM` antes disso,
+    as classes vêm dos valores que chegaram.
+    """
+
+    def __init__(self, root, painel, janela, fila, fps=10, grafico="histograma", titulo="Ao vivo",
+                 criar_janela=None, inicio=0):
+        self.root = root
+        self.painel = painel
+        self.janela = janela
+        self.fila = fila
+        self.intervalo = max(1, round(1000 / fps))
+        self.grafico = grafico
+        self.titulo = titulo
+        self.criar_janela = criar_janela
+        self.inicio = inicio
+        self._iniciais = []
+        self._terminou = False
+        self._versao_desenhada = None
+        self._agendado = None
+
+    def iniciar(self):
+        self._quadro()
+
+    def parar(self):
+        if self._agendado is not None:
+            self.root.after_cancel(self._agendado)
+            self._agendado = None
+
+    def _quadro(self):
+        # tudo o que chegou desde o último quadro entra como um só lote
+        lote = []
+        while True:
+            try:
+                valor = self.fila.get_nowait()
+            except queue.Empty:
+                break
+            if valor is FIM:
+                self._terminou = True
+            else:
+                lote.append(valor)
+
+        if self.janela is None:
+            self._iniciais.extend(lote)
+            if len(self._iniciais) < self.inicio and not self._terminou:
+                self.root.title(f"{self.titulo} (aguardando valores: {len(self._iniciais)}/{self.inicio})")
+                self._agendado = self.root.after(self.intervalo, self._quadro)
+                return
+            if not self._iniciais:
+                self.root.title(f"{self.titulo} (a entrada terminou sem valores)")
+                self._agendado = None
+                return
+            self.janela = self.criar_janela(self._iniciais)
+            self._iniciais = []
+        elif lote:
+            self.janela.adicionar(lote)
+
+        # nos modos por tempo a tabela muda mesmo sem valores novos
+        if self.janela.versao != self._versao_desenhada or self.janela.modo != "ultimos":
+            self._desenhar()
+            self._versao_desenhada = self.janela.versao
+        self._agendado = self.root.after(self.intervalo, self._quadro)
+
+    def _desenhar(self):
+        tabela = self.janela.tabela()
+        # o n vai no título da janela: com o título do gráfico fixo, só as
+        # barras/linhas são redesenhadas (blitting)
+        self.root.title(f"{self.titulo} (n = {self.janela.n:,.0f})")
+        if self.grafico == "ogiva":
+            if tabela.fi.sum() > 0:
+                self.painel.ogiva(tabela, self.titulo)
+        else:
+            self.painel.histograma(tabela, self.titulo)
+
+
+def _ler_entrada(fila, arquivo=sys.stdin):
+    # thread de leitura: números separados por espaço, vírgula ou linha
+    try:
+        for linha in arquivo:
+            for campo in linha.replace(",", " ").split():
+                try:
+                    fila.put(float(campo))
+                except ValueError:
+                    print(f"Valor ignorado: {campo!r}", file=sys.stderr)
+    finally:
+        fila.put(FIM)
+
+
+def _classes(args, valores=None):
+    """Intervalos e tipo de dados: de `--limites` e `--k` ou gerados de `valores`."""
+    import numpy as np
+
+    from tabela import TabelaIntervaloClasse
+
+    tabela = TabelaIntervaloClasse()
+    tabela.casas_decimais = args.decimals
+    if args.limites is not None:
+        tabela.tipo_dados = "Contínuos"
+        tabela.limites_classes = np.linspace(args.limites[0], args.limites[1], args.k + 1)
+    else:
+        tabela.dados = valores
+        tabela.definir_tipo_dados()
+    return tabela.gerar_intervalos(), tabela.tipo_dados
+
+
+def main(argumentos=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    janela = parser.add_mutually_exclusive_group(required=True)
+    janela.add_argument("--tamanho", type=int, help="últimos N valores")
+    janela.add_argument("--duracao", type=float, help="valores dos últimos T segundos")
+    janela.add_argument("--meia-vida", type=float, help="decaimento exponencial com meia-vida H segundos")
+    parser.add_argument("--limites", type=float, nargs=2, metavar=("MIN", "MAX"),
+                        help="limites das classes (com --k); sem eles, vêm dos primeiros valores")
+    parser.add_argument("--k", type=int, default=10, help="número de classes com --limites")
+    parser.add_argument("--inicio", type=int, default=200,
+                        help="valores usados para gerar as classes (padrão: 200)")
+    parser.add_argument("--decimals", type=int, default=2, help="casas decimais (padrão: 2)")
+    parser.add_argument("--fps", type=float, default=10, help="quadros por segundo (padrão: 10)")
+    parser.add_argument("--grafico", choices=("histograma", "ogiva"), default="histograma")
+    args = parser.parse_args(argumentos)
+
+    import tkinter as tk
+
+    from janela import TabelaJanela
+    from painel import PainelGrafico
+
+    def criar_janela(iniciais=()):
+        # os valores usados para gerar as classes também entram na janela
+        intervalos, tipo_dados = _classes(args, iniciais)
+        tabela = TabelaJanela(intervalos, tipo_dados, tamanho=args.tamanho, duracao=args.duracao,
+                              meia_vida=args.meia_vida)
+        if iniciais:
+            tabela.adicionar(iniciais)
+        return tabela
+
+    fila = queue.Queue()
+    threading.Thread(target=_ler_entrada, args=(fila,), daemon=True).start()
+
+    # a janela abre já; sem --limites, as classes são fixadas quando chegarem
+    # os primeiros --inicio valores (ou quando a entrada terminar)
+    root = tk.Tk()
+    painel = PainelGrafico(root)
+    painel.widget.pack(fill="both", expand=True)
+    tabela = criar_janela() if args.limites is not None else None
+    VisualizacaoAoVivo(root, painel, tabela, fila, args.fps, args.grafico,
+                       criar_janela=criar_janela, inicio=args.inicio).iniciar()
+    root.mainloop()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
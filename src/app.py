@@ -1,78 +1,273 @@
 # src/app.py
+import itertools
+import queue
+import threading
 import tkinter as tk
-from tkinter import ttk, scrolledtext, messagebox
-import matplotlib.pyplot as plt
+from tkinter import ttk, scrolledtext, messagebox, filedialog
 
-from tabela import TabelaIntervaloClasse
-from histogram import plot_hist
-from ogiva import ogiva_de_tabela_agrupada
+# NumPy (via tabela) e matplotlib só são importados no primeiro uso, para
+# que a janela apareça sem esperar por eles
+from regras import REGRAS
 
 ultimo_tabela = None
 ultimo_intervalos = None
+ultimo_quartis = None
+painel = None  # PainelGrafico, criado no primeiro gráfico
+
+# etapas do cálculo, na ordem em que a thread de trabalho as executa
+ETAPAS = ("Lendo os dados", "Identificando o tipo dos dados", "Montando a tabela",
+          "Formatando a saída")
+INTERVALO_FILA = 50  # ms entre as consultas à fila de resultados
+
+fila_resultados = queue.Queue()
+ids_tarefas = itertools.count(1)
+tarefa_atual = None
+consulta_agendada = False
+
+
+class TarefaCancelada(Exception):
+    pass
+
+
+class Tarefa:
+    """Cálculo de uma tabela em andamento na thread de trabalho."""
+
+    def __init__(self, ao_errar):
+        self.id = next(ids_tarefas)
+        self.cancelada = threading.Event()
+        self.ao_errar = ao_errar
 
 
 # ===================== FUNÇÕES ===============================
 
 def gerar_tabela():
-    global ultimo_tabela, ultimo_intervalos
-
     texto = entrada.get("1.0", tk.END).strip()
-    titulo = titulo_entry.get().strip()
 
     if not texto:
         saida.delete("1.0", tk.END)
         saida.insert(tk.END, "Digite os dados!\n")
         return
 
-    try:
-        dados = [float(x) for x in texto.replace(",", " ").split()]
-    except ValueError:
+    def preparar():
+        from cache import CACHE, digest
+        from carregador import converter_texto
+        from tabela import TabelaIntervaloClasse
+
+        # o mesmo texto não é convertido de novo
+        tabela = TabelaIntervaloClasse()
+        tabela.dados = CACHE.obter(("texto", digest(texto)), lambda: converter_texto(texto))
+        tabela.cache = CACHE
+        return tabela
+
+    def ao_errar(erro):
         messagebox.showerror("Erro", "Insira apenas números válidos.")
+
+    iniciar_tarefa(preparar, ao_errar)
+
+
+def abrir_arquivo():
+    """Gera a tabela de um arquivo (texto lido em blocos; binários mapeados em memória)."""
+    caminho = filedialog.askopenfilename(
+        title="Abrir dados",
+        filetypes=[("Texto/CSV", "*.txt *.csv"), ("NumPy", "*.npy"),
+                   ("Binário bruto", "*.f64 *.bin *.i32"), ("Todos os arquivos", "*.*")]
+    )
+    if not caminho:
         return
 
-    tabela = TabelaIntervaloClasse()
-    tabela.dados = dados
+    def preparar():
+        from cache import CACHE
+        from tabela import abrir_tabela
+
+        tabela = abrir_tabela(caminho)
+        tabela.cache = CACHE
+        return tabela
+
+    def ao_errar(erro):
+        if isinstance(erro, OSError):
+            messagebox.showerror("Erro", f"Não foi possível ler o arquivo:\n{erro}")
+        else:
+            messagebox.showerror("Erro", "O arquivo deve conter apenas números válidos.")
+
+    iniciar_tarefa(preparar, ao_errar)
+
+
+# ================== CÁLCULO EM SEGUNDO PLANO ==================
+
+def iniciar_tarefa(preparar, ao_errar):
+    """
+    Calcula a tabela em uma thread de trabalho, sem travar a janela. `preparar`
+    devolve a tabela com os dados (roda na thread); `ao_errar` recebe o erro de
+    leitura (roda na thread da interface). Uma tarefa ainda em andamento é
+    cancelada antes de a nova começar.
+    """
+    global tarefa_atual
+    cancelar_tarefa(mensagem=None)
 
-    tabela.casas_decimais = int(spin_decimais.get())
-    tabela.definir_tipo_dados()
+    tarefa = tarefa_atual = Tarefa(ao_errar)
+    opcoes = (int(spin_decimais.get()), regra_por_nome[combo_regra.get()], titulo_entry.get().strip())
+    threading.Thread(target=calcular_tabela, args=(tarefa, preparar, *opcoes), daemon=True).start()
 
-    estatisticas = tabela.calcular_estatisticas()
-    intervalos = tabela.gerar_intervalos()
-    intervalos = tabela.calcular_frequencias(intervalos)
+    barra_progresso["value"] = 0
+    status.set(ETAPAS[0] + "...")
+    botao_cancelar.state(["!disabled"])
+    agendar_consulta()
+
+
+def calcular_tabela(tarefa, preparar, casas_decimais, regra, titulo):
+    """Executado na thread de trabalho: nada de widgets aqui, só a fila."""
+    def verificar():
+        if tarefa.cancelada.is_set():
+            raise TarefaCancelada
+
+    def etapa(i):
+        verificar()
+        fila_resultados.put((tarefa.id, "progresso", i))
+
+    try:
+        etapa(0)
+        tabela = preparar()
+        # o cancelamento também é verificado a cada bloco percorrido nas etapas
+        tabela.verificar_interrupcao = verificar
+        tabela.casas_decimais = casas_decimais
+        tabela.regra_classes = regra
+
+        etapa(1)
+        tabela.definir_tipo_dados()
+        etapa(2)
+        intervalos, estatisticas = tabela.construir()
+        quartis = calcular_quartis(tabela)
+        etapa(3)
+        from desempenho import etapa as medir_etapa
+        with medir_etapa("exibicao", "app.texto_da_tabela", tabela.resumo.n):
+            texto = texto_da_tabela(tabela, intervalos, estatisticas, titulo)
+        etapa(len(ETAPAS))
+        tabela.verificar_interrupcao = None
+    except TarefaCancelada:
+        return
+    except Exception as erro:
+        # qualquer erro volta para a interface, que encerra a tarefa
+        fila_resultados.put((tarefa.id, "erro", erro))
+        return
+
+    fila_resultados.put((tarefa.id, "resultado", (tabela, intervalos, quartis, texto)))
+
+
+def calcular_quartis(tabela):
+    """Quartis da ogiva, calculados na thread de trabalho junto com a tabela."""
+    from cache import CACHE
+
+    modo = tabela.modo_quantis_padrao()
+    return CACHE.obter(("quartis", tabela.digest, modo), lambda: tabela.calcular_quantis(modo=modo))
+
+
+def verificar_fila():
+    """Consulta a fila de resultados (via `root.after`) enquanto houver tarefa."""
+    global tarefa_atual, consulta_agendada
+    consulta_agendada = False
+
+    while tarefa_atual is not None:
+        try:
+            id_tarefa, tipo, valor = fila_resultados.get_nowait()
+        except queue.Empty:
+            break
+        if id_tarefa != tarefa_atual.id:
+            continue  # sobra de uma tarefa cancelada
+
+        if tipo == "progresso":
+            barra_progresso["value"] = valor * 100 / len(ETAPAS)
+            if valor < len(ETAPAS):
+                status.set(ETAPAS[valor] + "...")
+            continue
+
+        tarefa, tarefa_atual = tarefa_atual, None
+        botao_cancelar.state(["disabled"])
+        if tipo == "erro":
+            status.set("Erro")
+            barra_progresso["value"] = 0
+            if isinstance(valor, (OSError, ValueError)):
+                tarefa.ao_errar(valor)
+            else:
+                # erro inesperado (por exemplo, falta de memória): mostrado como veio
+                messagebox.showerror("Erro", f"Não foi possível montar a tabela:\n{valor!r}")
+        else:
+            montar_tabela(*valor)
+            from cache import CACHE
+            contadores = CACHE.estatisticas()
+            status.set(f"Pronto (cache: {contadores['acertos']} acertos, {contadores['faltas']} faltas)")
+
+    if tarefa_atual is not None:
+        agendar_consulta()
+
+
+def agendar_consulta():
+    global consulta_agendada
+    if not consulta_agendada:
+        consulta_agendada = True
+        root.after(INTERVALO_FILA, verificar_fila)
+
+
+def cancelar_tarefa(mensagem="Cancelado"):
+    global tarefa_atual
+    if tarefa_atual is None:
+        return
+    tarefa_atual.cancelada.set()
+    tarefa_atual = None
+    botao_cancelar.state(["disabled"])
+    barra_progresso["value"] = 0
+    if mensagem:
+        status.set(mensagem)
+
+
+def montar_tabela(tabela, intervalos, quartis, texto):
+    global ultimo_tabela, ultimo_intervalos, ultimo_quartis
 
     ultimo_tabela = tabela
     ultimo_intervalos = intervalos
+    ultimo_quartis = quartis
 
-    # ================== EXIBIR TABELA =========================
-
+    # uma única inserção: o Text refaz o layout uma vez, qualquer que seja k
     saida.delete("1.0", tk.END)
+    saida.insert(tk.END, texto)
+
+    # o gráfico aberto acompanha a nova tabela, atualizado no lugar
+    if painel is not None and painel.modo == "histograma":
+        mostrar_histograma(selecionar=False)
+    elif painel is not None and painel.modo == "ogiva":
+        mostrar_ogiva_tabela(selecionar=False)
+
+
+def texto_da_tabela(tabela, intervalos, estatisticas, titulo):
+    """Texto completo da saída (tabela e estatísticas), montado fora da interface."""
+    from frequencias import FrequencyTable
+
+    linhas = []
 
     # título opcional – se o usuário não digitar, não mostra
     if titulo:
-        saida.insert(tk.END, titulo + "\n")
-        saida.insert(tk.END, "=" * len(titulo) + "\n\n")
+        linhas.append(titulo)
+        linhas.append("=" * len(titulo) + "\n")
 
-    saida.insert(tk.END, "Cls | Intervalo              | Fi | Fr(%) | Fac | Frac(%)\n")
-    saida.insert(tk.END, "------------------------------------------------------------\n")
+    # ================== TABELA =========================
 
-    for i, inter in enumerate(intervalos, 1):
-        intervalo_str = inter['intervalo']
+    linhas.append("Cls | Intervalo              | Fi | Fr(%) | Fac | Frac(%)")
+    linhas.append("------------------------------------------------------------")
 
-        fi = inter.get("frequencia", 0)
-        fr = inter.get("frequencia_relativa", 0) * 100
-        fac = inter.get("frequencia_acumulada", 0)
-        frac = inter.get("frequencia_relativa_acumulada", 0) * 100
-
-        saida.insert(
-            tk.END,
-            f"{i:<3} | {intervalo_str:<20} | {fi:<3} | {fr:>6.1f}% | {fac:<3} | {frac:>7.1f}%\n"
-        )
+    colunas = FrequencyTable.de_dicionarios(intervalos, tabela.tipo_dados, tabela.casas_decimais)
+    classes = zip(colunas.rotulos, colunas.fi.tolist(), (colunas.fr * 100).tolist(),
+                  colunas.fac.tolist(), (colunas.frac * 100).tolist())
+    linhas.extend(
+        f"{i:<3} | {intervalo_str:<20} | {fi:<3} | {fr:>6.1f}% | {fac:<3} | {frac:>7.1f}%"
+        for i, (intervalo_str, fi, fr, fac, frac) in enumerate(classes, 1)
+    )
 
     # ================== ESTATÍSTICAS ===========================
 
     dec = tabela.casas_decimais
-    saida.insert(tk.END, "\n=== ESTATÍSTICAS ===\n")
-    saida.insert(tk.END, f"Total de dados (n): {len(tabela.dados)}\n")
+    linhas.append("\n=== ESTATÍSTICAS ===")
+    linhas.append(f"Total de dados (n): {estatisticas.get('n', tabela.resumo.n)}")
+    if estatisticas.get('fora'):
+        linhas.append(f"Fora das classes (não incluídos em n): {estatisticas['fora']}")
 
     minimo = estatisticas['min']
     maximo = estatisticas['max']
@@ -80,32 +275,44 @@ def gerar_tabela():
     k = estatisticas['k']
     amp_classe = estatisticas['amplitude_classe']
 
-    saida.insert(tk.END, f"Valor mínimo: {minimo:.{dec}f}\n")
-    saida.insert(tk.END, f"Valor máximo: {maximo:.{dec}f}\n")
-    saida.insert(tk.END, f"Amplitude total: {amp_total:.{dec}f}\n")
-    saida.insert(tk.END, f"Número de classes (k): {k}\n")
-    saida.insert(
-        tk.END,
-        f"Amplitude de classe (A): ({maximo:.{dec}f} - {minimo:.{dec}f}) / {k} = {amp_classe:.{dec}f}\n"
-    )
+    linhas.append(f"Valor mínimo: {minimo:.{dec}f}")
+    linhas.append(f"Valor máximo: {maximo:.{dec}f}")
+    linhas.append(f"Amplitude total: {amp_total:.{dec}f}")
+    linhas.append(f"Número de classes (k): {k} — regra: {estatisticas['regra']}")
+    if 'amplitudes_classes' in estatisticas:
+        larguras = ", ".join(f"{a:.{dec}f}" for a in estatisticas['amplitudes_classes'])
+        linhas.append(f"Amplitude de classe (A), limites informados: {larguras}")
+    else:
+        linhas.append(f"Amplitude de classe (A): ({maximo:.{dec}f} - {minimo:.{dec}f}) / {k} = {amp_classe:.{dec}f}")
 
     if "media" in estatisticas:
-        saida.insert(tk.END, f"Média: {estatisticas['media']:.4f}\n")
+        linhas.append(f"Média: {estatisticas['media']:.4f}")
     if "mediana" in estatisticas:
-        saida.insert(tk.END, f"Mediana: {estatisticas['mediana']:.4f}\n")
+        linhas.append(f"Mediana: {estatisticas['mediana']:.4f}")
     if "moda" in estatisticas and estatisticas["moda"] is not None:
-        saida.insert(tk.END, f"Moda: {estatisticas['moda']}\n")
+        linhas.append(f"Moda: {estatisticas['moda']:.4f}")
     if "variancia" in estatisticas:
-        saida.insert(tk.END, f"Variância: {estatisticas['variancia']:.4f}\n")
+        linhas.append(f"Variância: {estatisticas['variancia']:.4f}")
     if "desvio_padrao" in estatisticas:
-        saida.insert(tk.END, f"Desvio padrão: {estatisticas['desvio_padrao']:.4f}\n")
-    if "cv" in estatisticas:
-        saida.insert(tk.END, f"Coeficiente de variação: {estatisticas['cv']:.2f}%\n")
+        linhas.append(f"Desvio padrão: {estatisticas['desvio_padrao']:.4f}")
+    if estatisticas.get("cv") is not None:
+        linhas.append(f"Coeficiente de variação: {estatisticas['cv']:.2f}%")
+
+    linhas.append(f"Tipo do conjunto: {tabela.tipo_dados}")
+    return "\n".join(linhas) + "\n"
+
 
-    saida.insert(tk.END, f"Tipo do conjunto: {tabela.tipo_dados}\n")
+def obter_painel():
+    """Painel de gráfico embutido na aba "Gráfico", criado no primeiro uso."""
+    global painel
+    if painel is None:
+        from painel import PainelGrafico
+        painel = PainelGrafico(aba_grafico)
+        painel.widget.pack(fill="both", expand=True)
+    return painel
 
 
-def mostrar_histograma():
+def mostrar_histograma(selecionar=True):
     if not ultimo_intervalos:
         saida.insert(tk.END, "\n⚠️ Gere a tabela primeiro!\n")
         return
@@ -114,10 +321,12 @@ def mostrar_histograma():
     if not titulo:
         titulo = "Histograma"
 
-    plot_hist(ultimo_intervalos, title=titulo)
+    obter_painel().histograma(ultimo_intervalos, titulo)
+    if selecionar:
+        abas.select(aba_grafico)
 
 
-def mostrar_ogiva_tabela():
+def mostrar_ogiva_tabela(selecionar=True):
     if not ultimo_intervalos:
         saida.insert(tk.END, "\n⚠️ Gere a tabela primeiro!\n")
         return
@@ -126,10 +335,10 @@ def mostrar_ogiva_tabela():
     if not titulo:
         titulo = "Ogiva"
 
-    intervalos_xy = [(i['limite_inferior'], i['limite_superior']) for i in ultimo_intervalos]
-    freq = [i["frequencia"] for i in ultimo_intervalos]
-
-    ogiva_de_tabela_agrupada(intervalos_xy, freq, mostrar_percentual=True, titulo=titulo)
+    # quartis já calculados na thread de trabalho (ver calcular_quartis)
+    obter_painel().ogiva(ultimo_intervalos, titulo, quartis=ultimo_quartis, mostrar_percentual=True)
+    if selecionar:
+        abas.select(aba_grafico)
 
 
 def mostrar_participantes():
@@ -147,11 +356,54 @@ def mostrar_participantes():
     messagebox.showinfo("Participantes", "Desenvolvido pelo grupo:\n\n" + nomes)
 
 
+def alternar_medicao():
+    import desempenho
+
+    if medir_desempenho.get():
+        desempenho.ativar()
+    else:
+        desempenho.desativar()
+
+
+def mostrar_desempenho():
+    """Relatório "Desempenho": tempo, CPU, n e memória de cada etapa medida."""
+    import desempenho
+
+    janela = tk.Toplevel(root)
+    janela.title("Desempenho")
+    texto = scrolledtext.ScrolledText(janela, width=80, height=14, font=("Consolas", 10))
+    texto.pack(fill="both", expand=True, padx=5, pady=5)
+
+    def atualizar():
+        texto.delete("1.0", tk.END)
+        if not desempenho.ativo() and not desempenho.registros():
+            texto.insert(tk.END, 'Marque "Medir desempenho" e gere a tabela ou os gráficos.\n')
+            return
+        texto.insert(tk.END, desempenho.relatorio() + "\n")
+
+    def limpar():
+        desempenho.limpar()
+        atualizar()
+
+    def salvar():
+        caminho = filedialog.asksaveasfilename(title="Salvar medições", defaultextension=".json",
+                                               filetypes=[("JSON", "*.json")])
+        if caminho:
+            desempenho.salvar_json(caminho)
+
+    botoes = ttk.Frame(janela)
+    botoes.pack(pady=5)
+    ttk.Button(botoes, text="Atualizar", command=atualizar).grid(row=0, column=0, padx=5)
+    ttk.Button(botoes, text="Limpar", command=limpar).grid(row=0, column=1, padx=5)
+    ttk.Button(botoes, text="Salvar JSON", command=salvar).grid(row=0, column=2, padx=5)
+    atualizar()
+
+
 # ===================== INTERFACE (UI) ===============================
 
 root = tk.Tk()
 root.title("📊 Analisador Estatístico – Tabelas, Histogramas e Ogivas")
-root.geometry("900x650")
+root.geometry("900x720")
 root.configure(bg="#eef2f7")
 
 style = ttk.Style()
@@ -173,6 +425,12 @@ spin_decimais = ttk.Spinbox(frame_input, from_=0, to=10, width=5)
 spin_decimais.set(2)
 spin_decimais.pack(anchor="w", pady=3)
 
+ttk.Label(frame_input, text="Regra para o número de classes:").pack(anchor="w")
+regra_por_nome = {nome: regra for regra, nome in REGRAS.items()}
+combo_regra = ttk.Combobox(frame_input, values=list(regra_por_nome), state="readonly", width=20)
+combo_regra.set(REGRAS["sturges"])
+combo_regra.pack(anchor="w", pady=3)
+
 ttk.Label(frame_input, text="Título da tabela/gráficos (opcional):").pack(anchor="w")
 titulo_entry = ttk.Entry(frame_input, width=50)
 titulo_entry.pack(anchor="w", pady=3)
@@ -181,6 +439,10 @@ ttk.Label(frame_input, text="Insira os dados (separados por espaço):").pack(anc
 entrada = scrolledtext.ScrolledText(frame_input, width=70, height=4, font=("Consolas", 10))
 entrada.pack(pady=4)
 
+medir_desempenho = tk.BooleanVar(value=False)
+ttk.Checkbutton(frame_input, text="Medir desempenho (tempo e memória por etapa)",
+                variable=medir_desempenho, command=alternar_medicao).pack(anchor="w")
+
 # BOTÕES
 frame_btn = ttk.Frame(root)
 frame_btn.pack(pady=10)
@@ -188,11 +450,33 @@ frame_btn.pack(pady=10)
 ttk.Button(frame_btn, text="Gerar Tabela", command=gerar_tabela).grid(row=0, column=0, padx=8)
 ttk.Button(frame_btn, text="Histograma", command=mostrar_histograma).grid(row=0, column=1, padx=8)
 ttk.Button(frame_btn, text="Ogiva", command=mostrar_ogiva_tabela).grid(row=0, column=2, padx=8)
-ttk.Button(frame_btn, text="Participantes", command=mostrar_participantes).grid(row=0, column=3, padx=8)
-
-# RESULTADO
-saida = scrolledtext.ScrolledText(root, width=100, height=22, font=("Consolas", 10))
-saida.pack(pady=10)
+ttk.Button(frame_btn, text="Abrir arquivo", command=abrir_arquivo).grid(row=0, column=3, padx=8)
+ttk.Button(frame_btn, text="Participantes", command=mostrar_participantes).grid(row=0, column=4, padx=8)
+ttk.Button(frame_btn, text="Desempenho", command=mostrar_desempenho).grid(row=0, column=6, padx=8)
+botao_cancelar = ttk.Button(frame_btn, text="Cancelar", command=cancelar_tarefa)
+botao_cancelar.grid(row=0, column=5, padx=8)
+botao_cancelar.state(["disabled"])
+
+# PROGRESSO
+frame_progresso = ttk.Frame(root)
+frame_progresso.pack()
+
+barra_progresso = ttk.Progressbar(frame_progresso, length=300, maximum=100)
+barra_progresso.pack(side="left", padx=5)
+status = tk.StringVar(value="")
+ttk.Label(frame_progresso, textvariable=status, width=35).pack(side="left")
+
+# RESULTADO: tabela em texto e gráfico persistente, em abas
+abas = ttk.Notebook(root)
+abas.pack(pady=10, fill="both", expand=True)
+
+aba_tabela = ttk.Frame(abas)
+abas.add(aba_tabela, text="Tabela")
+saida = scrolledtext.ScrolledText(aba_tabela, width=100, height=22, font=("Consolas", 10))
+saida.pack(fill="both", expand=True)
+
+aba_grafico = ttk.Frame(abas)
+abas.add(aba_grafico, text="Gráfico")
 
 # CRÉDITOS FIXOS NO RODAPÉ
 creditos = ttk.Label(
@@ -0,0 +1,124 @@
+"""
+Exporta histogramas e ogivas para arquivos (PNG, SVG, PDF...), sem janelas.
+
+Uso:
+    python src/exportar.py dados1.csv dados2.npy --saida graficos --formatos png svg
+
+Os gráficos são desenhados com o backend Agg em painéis (`PainelGrafico`) sem
+Tk. No modo em lote, cada processo trabalhador cria um painel para o histograma
+e outro para a ogiva e os reaproveita, atualizando barras e linhas no lugar,
+para todos os conjuntos de dados que receber.
+"""
+import argparse
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from painel import PainelGrafico  # noqa: E402
+
+FORMATOS = ("png", "svg", "pdf")
+
+# painéis reaproveitados pelo processo trabalhador (ver _iniciar_trabalhador)
+_paineis = None
+
+
+def novos_paineis():
+    return {"histograma": PainelGrafico(), "ogiva": PainelGrafico()}
+
+
+def exportar_tabela(tabela, pasta, nome, formatos=("png",), paineis=None, dpi=100):
+    """
+    Grava o histograma e a ogiva (com os quartis) de uma `TabelaIntervaloClasse`
+    em `pasta`, como `<nome>_histograma.<formato>` e `<nome>_ogiva.<formato>`.
+    `paineis` (de `novos_paineis`) permite reaproveitar as figuras entre
+    chamadas. Devolve os caminhos gravados.
+    """
+    paineis = paineis or novos_paineis()
+    if tabela.tipo_dados is None:
+        tabela.definir_tipo_dados()
+    intervalos, _ = tabela.construir()
+
+    quartis = tabela.calcular_quantis(modo=tabela.modo_quantis_padrao())
+
+    os.makedirs(pasta, exist_ok=True)
+    gravados = []
+    paineis["histograma"].histograma(intervalos, f"Histograma – {nome}", desenhar=False)
+    paineis["ogiva"].ogiva(intervalos, f"Ogiva – {nome}", quartis=quartis, desenhar=False)
+    for grafico, painel in paineis.items():
+        for formato in formatos:
+            caminho = os.path.join(pasta, f"{nome}_{grafico}.{formato}")
+            painel.salvar(caminho, dpi=dpi)
+            gravados.append(caminho)
+    return gravados
+
+
+def exportar_arquivo(caminho, pasta, formatos=("png",), casas_decimais=2, regra="sturges",
+                     paineis=None):
+    """Abre um arquivo de dados e exporta seus gráficos (ver `exportar_tabela`)."""
+    from tabela import abrir_tabela
+
+    tabela = abrir_tabela(caminho)
+    tabela.casas_decimais = casas_decimais
+    tabela.regra_classes = regra
+    nome = os.path.splitext(os.path.basename(caminho))[0]
+    return exportar_tabela(tabela, pasta, nome, formatos, paineis)
+
+
+def _iniciar_trabalhador():
+    global _paineis
+    _paineis = novos_paineis()
+
+
+def _exportar_no_trabalhador(caminho, pasta, formatos, casas_decimais, regra):
+    try:
+        return caminho, exportar_arquivo(caminho, pasta, formatos, casas_decimais, regra, _paineis), None
+    except Exception as erro:
+        # o arquivo com problema volta sem gráficos e com a mensagem; o lote segue
+        return caminho, [], str(erro) or type(erro).__name__
+
+
+def exportar_lote(caminhos, pasta, formatos=("png",), casas_decimais=2, regra="sturges",
+                  trabalhadores=None):
+    """
+    Exporta os gráficos de vários arquivos em processos paralelos. Gera, na
+    ordem dos arquivos, tuplas (arquivo, caminhos gravados, erro ou None).
+    """
+    trabalhadores = min(trabalhadores or os.cpu_count() or 1, len(caminhos))
+    argumentos = [(caminho, pasta, tuple(formatos), casas_decimais, regra) for caminho in caminhos]
+    if trabalhadores <= 1:
+        _iniciar_trabalhador()
+        yield from (_exportar_no_trabalhador(*a) for a in argumentos)
+        return
+    with ProcessPoolExecutor(max_workers=trabalhadores, initializer=_iniciar_trabalhador) as executor:
+        yield from executor.map(_exportar_no_trabalhador, *zip(*argumentos))
+
+
+def main(argumentos=None):
+    from regras import REGRAS
+
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("arquivos", nargs="+", metavar="ARQUIVO",
+                        help="arquivos de dados (texto, .npy, .f64 ou .i32)")
+    parser.add_argument("--saida", default="outputs", metavar="PASTA", help="pasta dos gráficos")
+    parser.add_argument("--formatos", nargs="+", choices=FORMATOS, default=["png"])
+    parser.add_argument("--decimals", type=int, default=2, help="casas decimais (padrão: 2)")
+    parser.add_argument("--regra", choices=tuple(REGRAS), default="sturges")
+    parser.add_argument("--trabalhadores", type=int, default=None,
+                        help="processos trabalhadores (padrão: um por núcleo)")
+    args = parser.parse_args(argumentos)
+
+    falhas = 0
+    for arquivo, gravados, erro in exportar_lote(args.arquivos, args.saida, args.formatos,
+                                                 args.decimals, args.regra, args.trabalhadores):
+        if erro:
+            print(f"Erro em {arquivo}: {erro}", file=sys.stderr)
+            falhas += 1
+        for caminho in gravados:
+            print(caminho)
+    return 1 if falhas else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,28 @@
+# src/graficos.py
+import os
+import sys
+
+
+def pyplot():
+    """
+    `matplotlib.pyplot`, importado só na primeira vez que um gráfico é pedido.
+
+    Sem tela disponível (servidor, CI, processos em lote) e sem `MPLBACKEND`
+    definido, usa o backend "Agg", que desenha em memória e não carrega Tk.
+    """
+    if "matplotlib.pyplot" not in sys.modules and sem_tela():
+        import matplotlib
+        matplotlib.use("Agg")
+
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def sem_tela():
+    """True quando não há servidor gráfico para abrir janelas."""
+    if os.environ.get("MPLBACKEND"):
+        return False
+    if os.name != "posix" or sys.platform == "darwin":
+        return False
+    return not (os.environ.get("DISPLAY") or os.environ.get("WAYLAND_DISPLAY"))
+
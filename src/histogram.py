@@ -1,9 +1,21 @@
-import matplotlib.pyplot as plt
+import math
+
+import numpy as np
+
+from desempenho import medir
+from graficos import pyplot
 
 def build_hist_data(intervalos):
     """
     Constrói os limites de classe e labels no formato [a – b].
+
+    Uma FrequencyTable é lida direto das colunas (limites e Fi), sem conversão.
     """
+    if hasattr(intervalos, "limites"):
+        limites = intervalos.limites
+        labels = [f"[{li} – {ls}]" for li, ls in zip(limites[:-1].tolist(), limites[1:].tolist())]
+        return limites, intervalos.fi, labels
+
     limites = []
     frequencias = []
     labels = []
@@ -22,14 +34,13 @@ def build_hist_data(intervalos):
     return limites, frequencias, labels
 
 
+@medir("graficos", tamanho=lambda intervalos, *_, **__: len(intervalos))
 def plot_hist(intervalos, title="Histograma (contínuos)"):
+    plt = pyplot()
     limites, frequencias, labels = build_hist_data(intervalos)
 
     # larguras das barras
-    larguras = [
-        limites[i+1] - limites[i]
-        for i in range(len(limites)-1)
-    ]
+    larguras = np.diff(limites)
 
     fig, ax = plt.subplots(figsize=(10, 4))
 
@@ -53,3 +64,53 @@ def plot_hist(intervalos, title="Histograma (contínuos)"):
 
     plt.tight_layout()
     plt.show()
+
+
+def grade_de_paineis(plt, quantidade, largura=3.2, altura=2.4):
+    """Figura com uma grade de eixos compartilhados para `quantidade` gráficos pequenos."""
+    colunas = math.ceil(math.sqrt(quantidade))
+    linhas = math.ceil(quantidade / colunas)
+    fig, eixos = plt.subplots(linhas, colunas, figsize=(largura * colunas, altura * linhas),
+                              sharex=True, sharey=True, squeeze=False)
+    for ax in eixos.flat[quantidade:]:
+        ax.set_visible(False)
+    return fig, eixos.flat[:quantidade]
+
+
+@medir("graficos", tamanho=lambda tabelas, *_, **__: len(tabelas))
+def histogramas_por_grupo(tabelas, titulo="Histogramas por grupo", modo="sobrepostos"):
+    """
+    Histogramas de vários grupos com as mesmas classes (por exemplo, de
+    `grupos.TabelaGrupos.construir`), a partir de {grupo: tabela}.
+
+    "sobrepostos" desenha o contorno de cada grupo nos mesmos eixos, em
+    frequência relativa (%) para comparar grupos de tamanhos diferentes;
+    "paineis" desenha um pequeno histograma (Fi) por grupo, com eixos comuns.
+    """
+    if modo not in ("sobrepostos", "paineis"):
+        raise ValueError(f"Modo desconhecido: {modo!r} (use 'sobrepostos' ou 'paineis').")
+    plt = pyplot()
+
+    if modo == "sobrepostos":
+        fig, ax = plt.subplots(figsize=(10, 4))
+        for nome, tabela in tabelas.items():
+            limites, _, labels = build_hist_data(tabela)
+            ax.stairs(tabela.fp, limites, linewidth=1.5, label=str(nome))
+        ax.set_xticks(limites[:-1])
+        ax.set_xticklabels(labels, rotation=45, ha="right")
+        ax.set_xlabel("Blocos (Classes)")
+        ax.set_ylabel("Frequência (%)")
+        ax.set_title(titulo)
+        ax.legend(fontsize="small", ncol=max(1, len(tabelas) // 12))
+    else:
+        fig, eixos = grade_de_paineis(plt, len(tabelas))
+        for ax, (nome, tabela) in zip(eixos, tabelas.items()):
+            limites, frequencias, _ = build_hist_data(tabela)
+            ax.bar(limites[:-1], frequencias, width=np.diff(limites), align="edge",
+                   edgecolor="black", linewidth=0.3, alpha=0.7)
+            ax.set_title(str(nome), fontsize="small")
+        fig.suptitle(titulo)
+
+    fig.tight_layout()
+    plt.show()
+    return fig
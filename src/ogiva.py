@@ -1,22 +1,30 @@
 # src/ogiva.py
 import numpy as np
-import matplotlib.pyplot as plt
-from typing import List, Tuple
+from typing import List, Optional, Sequence
 
-def ogiva_de_tabela_agrupada(
-    intervalos: List[Tuple[float, float]],
-    frequencias: List[int],
-    mostrar_percentual: bool = True,
-    titulo: str = "Ogiva"
-):
-    if len(intervalos) != len(frequencias):
-        raise ValueError("intervalos e frequencias devem ter o mesmo comprimento.")
-    if len(intervalos) == 0:
-        raise ValueError("Tabela vazia.")
+from desempenho import medir
+from graficos import pyplot
+from histogram import grade_de_paineis
 
-    # limites superiores de cada classe
-    upper_bounds = np.array([b for (a, b) in intervalos], dtype=float)
-    freq = np.array(frequencias, dtype=float)
+
+def pontos_da_ogiva(intervalos, frequencias=None, mostrar_percentual=True):
+    """
+    Pontos (x, y) da ogiva e o rótulo do eixo y: x são o limite inferior da 1ª
+    classe e os limites superiores; y, as frequências acumuladas (0 no início).
+    """
+    if hasattr(intervalos, "limites"):
+        lower_first = float(intervalos.limites[0])
+        upper_bounds = intervalos.superiores
+        freq = intervalos.fi.astype(float)
+    else:
+        if frequencias is None or len(intervalos) != len(frequencias):
+            raise ValueError("intervalos e frequencias devem ter o mesmo comprimento.")
+        upper_bounds = np.array([b for (a, b) in intervalos], dtype=float)
+        freq = np.array(frequencias, dtype=float)
+        lower_first = float(intervalos[0][0]) if len(intervalos) else 0.0
+
+    if len(freq) == 0:
+        raise ValueError("Tabela vazia.")
 
     n = freq.sum()
     cum_freq = np.cumsum(freq)
@@ -30,19 +38,184 @@ def ogiva_de_tabela_agrupada(
         ylabel = "Frequência acumulada (absoluta)"
 
     # primeiro ponto começa no limite inferior da 1ª classe
-    lower_first = float(intervalos[0][0])
-
     x = np.concatenate(([lower_first], upper_bounds))
     y = np.concatenate(([0], yvals))
+    return x, y, ylabel
+
+
+@medir("graficos", tamanho=lambda intervalos, *_, **__: len(intervalos))
+def ogiva_de_tabela_agrupada(
+    intervalos,
+    frequencias: Optional[List[int]] = None,
+    mostrar_percentual: bool = True,
+    titulo: str = "Ogiva",
+    quartis: Optional[Sequence[float]] = None
+):
+    """
+    Ogiva da tabela agrupada. `intervalos` é a lista de pares (li, ls) com as
+    `frequencias` correspondentes, ou uma FrequencyTable (lida direto das colunas).
+    Se `quartis` (Q1, Q2, Q3) forem informados, eles são marcados no gráfico.
+    """
+    plt = pyplot()
+    x, y, ylabel = pontos_da_ogiva(intervalos, frequencias, mostrar_percentual)
 
     # gráfico
     plt.figure(figsize=(8, 5))
     plt.plot(x, y, marker='o', linestyle='-', linewidth=2)
     plt.step(x, y, where='pre', alpha=0.3)
 
+    if quartis is not None:
+        for i, q in enumerate(quartis, 1):
+            # altura do quartil na própria ogiva (interpolação linear)
+            altura = np.interp(q, x, y)
+            plt.axvline(q, color="tab:red", linestyle=":", alpha=0.8)
+            plt.annotate(f"Q{i} = {q:.2f}", (q, altura), textcoords="offset points",
+                         xytext=(5, -12), color="tab:red")
+
     plt.title(titulo)
     plt.xlabel("Valor / Limite de classe")
     plt.ylabel(ylabel)
     plt.grid(True, linestyle='--', alpha=0.6)
     plt.tight_layout()
     plt.show()
+
+
+@medir("graficos", tamanho=lambda tabelas, *_, **__: len(tabelas))
+def ogivas_por_grupo(tabelas, titulo="Ogivas por grupo", modo="sobrepostos", mostrar_percentual=True):
+    """
+    Ogivas de vários grupos com as mesmas classes, a partir de {grupo: tabela}:
+    todas nos mesmos eixos ("sobrepostos") ou uma por painel ("paineis").
+    """
+    if modo not in ("sobrepostos", "paineis"):
+        raise ValueError(f"Modo desconhecido: {modo!r} (use 'sobrepostos' ou 'paineis').")
+    plt = pyplot()
+    if modo == "sobrepostos":
+        fig, ax = plt.subplots(figsize=(8, 5))
+        eixos = [ax] * len(tabelas)
+    else:
+        fig, eixos = grade_de_paineis(plt, len(tabelas))
+
+    for ax, (nome, tabela) in zip(eixos, tabelas.items()):
+        x, y, ylabel = pontos_da_ogiva(tabela, mostrar_percentual=mostrar_percentual)
+        ax.plot(x, y, marker='o', markersize=3, linewidth=1.5, label=str(nome))
+        ax.grid(True, linestyle='--', alpha=0.6)
+        if modo == "paineis":
+            ax.set_title(str(nome), fontsize="small")
+
+    if modo == "sobrepostos":
+        ax.set_title(titulo)
+        ax.set_xlabel("Valor / Limite de classe")
+        ax.set_ylabel(ylabel)
+        ax.legend(fontsize="small", ncol=max(1, len(tabelas) // 12))
+    else:
+        fig.suptitle(titulo)
+    fig.tight_layout()
+    plt.show()
+    return fig
+
+
+def curva_empirica(dados, modo="exato", pontos=4096, pesos=None):
+    """
+    Distribuição acumulada empírica (ECDF) dos dados brutos: x crescente e y em
+    fração (0 a 1].
+
+    "exato" ordena os dados (y = i/n para o i-ésimo menor valor); "aproximado"
+    usa um esboço KLL e devolve apenas `pontos` quantis, com memória limitada.
+    Com `pesos` (frequência de cada valor), y é a soma acumulada dos pesos e a
+    curva é sempre exata, ordenando só os valores distintos.
+    """
+    from quantis import MODOS, EsbocoKLL
+    from resumo import TAMANHO_BLOCO, como_vetor
+
+    if modo not in MODOS:
+        raise ValueError(f"Modo desconhecido: {modo!r} (use um de {MODOS}).")
+    vetor = como_vetor(dados)
+    if vetor.size == 0:
+        raise ValueError("Não há dados para a ogiva.")
+
+    if pesos is not None:
+        pesos = como_vetor(pesos).astype(float, copy=False)
+        ordem = np.argsort(vetor, kind="stable")
+        acumulado = np.cumsum(pesos[ordem])
+        return vetor[ordem], acumulado / acumulado[-1]
+
+    if modo == "aproximado":
+        esboco = EsbocoKLL()
+        for inicio in range(0, vetor.size, TAMANHO_BLOCO):
+            esboco.atualizar(vetor[inicio:inicio + TAMANHO_BLOCO])
+        y = np.linspace(1 / pontos, 1.0, pontos)
+        return esboco.quantis(y), y
+
+    x = np.sort(vetor)
+    y = np.arange(1, x.size + 1) / x.size
+    return x, y
+
+
+def reduzir_curva(x, y, colunas):
+    """
+    Reduz uma curva crescente (como a ECDF) à resolução da tela: o eixo x é
+    dividido em `colunas` faixas e de cada uma ficam o primeiro e o último ponto,
+    que numa curva crescente são o mínimo e o máximo da faixa. O desenho fica
+    igual ao da curva completa com no máximo 2·colunas + 2 pontos, qualquer que
+    seja o tamanho dos dados.
+    """
+    n = len(x)
+    if n <= 2 * colunas + 2:
+        return x, y
+
+    bordas = np.linspace(x[0], x[-1], colunas + 1)[1:-1]
+    inicios = np.searchsorted(x, bordas, side="left")
+    indices = np.unique(np.concatenate(([0, n - 1], inicios, inicios - 1)))
+    return x[indices], y[indices]
+
+
+@medir("graficos", tamanho=lambda dados, *_, **__: len(dados))
+def ogiva_de_dados_brutos(
+    dados,
+    num_classes: Optional[int] = None,
+    mostrar_percentual: bool = True,
+    titulo: str = "Ogiva (dados brutos)",
+    modo: str = "exato",
+    pesos=None
+):
+    """
+    Ogiva dos dados brutos (ECDF), sem agrupamento em classes.
+
+    A curva é calculada dos dados ordenados (ou de um esboço, com
+    `modo="aproximado"`) e reduzida à largura da figura em pixels antes de ir
+    para o matplotlib, de modo que 10 milhões de pontos custam para desenhar o
+    mesmo que alguns milhares. Com `num_classes`, a ECDF é lida apenas nos
+    `num_classes + 1` limites igualmente espaçados (ogiva por classes). Com
+    `pesos`, cada valor conta com a sua frequência (ogiva ponderada).
+    """
+    x, y = curva_empirica(dados, modo=modo, pesos=pesos)
+
+    plt = pyplot()
+    fig = plt.figure(figsize=(8, 5))
+
+    if num_classes is not None:
+        limites = np.linspace(x[0], x[-1], num_classes + 1)
+        # fração de valores ≤ cada limite (0 antes do primeiro)
+        acumulada = np.interp(limites, x, y, left=0.0, right=1.0)
+        acumulada[0] = 0.0
+        x, y = limites, acumulada
+        estilo = dict(marker='o', linestyle='-', linewidth=2)
+    else:
+        colunas = int(fig.get_figwidth() * fig.dpi)
+        x, y = reduzir_curva(x, y, colunas)
+        estilo = dict(drawstyle='steps-post', linewidth=1.5)
+
+    if mostrar_percentual:
+        y = y * 100.0
+        ylabel = "Frequência acumulada (%)"
+    else:
+        y = y * (len(dados) if pesos is None else float(np.sum(pesos)))
+        ylabel = "Frequência acumulada (absoluta)"
+
+    plt.plot(x, y, **estilo)
+    plt.title(titulo)
+    plt.xlabel("Valor")
+    plt.ylabel(ylabel)
+    plt.grid(True, linestyle='--', alpha=0.6)
+    plt.tight_layout()
+    plt.show()
@@ -0,0 +1,200 @@
+# src/painel.py
+import numpy as np
+
+from desempenho import medir
+from histogram import build_hist_data
+from ogiva import pontos_da_ogiva
+
+# Folga acima da maior frequência; o eixo y só muda quando os dados saem dela
+FOLGA_Y = 1.1
+
+
+def _n_classes(painel, intervalos, *_, **__):
+    return len(intervalos)
+
+
+class PainelGrafico:
+    """
+    Área de gráfico persistente (uma única figura) para o histograma e a ogiva.
+
+    Em vez de criar uma figura por clique, os artistas existentes são
+    atualizados no lugar: as barras com `set_height`/`set_x`/`set_width` e as
+    linhas da ogiva com `set_data`. Quando eixos, rótulos e título continuam os
+    mesmos, só as barras/linhas são redesenhadas sobre o fundo guardado
+    (blitting); o layout completo (`tight_layout`) só é refeito quando os
+    rótulos mudam.
+
+    Com `master` (um widget Tk), a figura é mostrada com `FigureCanvasTkAgg`;
+    sem ele, é desenhada em memória (Agg), por exemplo para salvar em arquivo.
+    """
+
+    def __init__(self, master=None, figsize=(9, 3.8), dpi=100):
+        from matplotlib.figure import Figure
+
+        self.figura = Figure(figsize=figsize, dpi=dpi)
+        self.eixos = self.figura.add_subplot()
+        if master is not None:
+            from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+            self.canvas = FigureCanvasTkAgg(self.figura, master=master)
+            self.widget = self.canvas.get_tk_widget()
+        else:
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            self.canvas = FigureCanvasAgg(self.figura)
+            self.widget = None
+
+        self.modo = None  # "histograma" ou "ogiva"
+        self._animados = []
+        self._fundo = None
+        self._rotulos = None
+        self._barras = None
+        self._linha = self._degraus = None
+        self._quartis = []
+        self._marcas = None
+        self._layout_pendente = False
+        self.canvas.mpl_connect("draw_event", self._ao_desenhar)
+
+    # ---------- histograma ----------
+
+    @medir("graficos", tamanho=_n_classes)
+    def histograma(self, intervalos, titulo="Histograma", desenhar=True):
+        limites, frequencias, labels = build_hist_data(intervalos)
+        limites = np.asarray(limites, dtype=float)
+        frequencias = np.asarray(frequencias, dtype=float)
+        larguras = np.diff(limites)
+
+        completo = self._trocar_modo("histograma")
+        if self._barras is None or len(self._barras) != len(frequencias):
+            if self._barras is not None:
+                self._barras.remove()
+            self._barras = self.eixos.bar(limites[:-1], frequencias, width=larguras, align="edge",
+                                          edgecolor="black", alpha=0.7, animated=True)
+            self._animados = list(self._barras)
+            completo = True
+        else:
+            for barra, x, altura, largura in zip(self._barras, limites[:-1].tolist(),
+                                                 frequencias.tolist(), larguras.tolist()):
+                barra.set_x(x)
+                barra.set_width(largura)
+                barra.set_height(altura)
+
+        if labels != self._rotulos:
+            self.eixos.set_xticks(limites[:-1])
+            self.eixos.set_xticklabels(labels, rotation=45, ha="right")
+            self.eixos.set_xlim(limites[0], limites[-1])
+            self._rotulos = labels
+            completo = True
+
+        completo |= self._ajustar_y(frequencias.max() if frequencias.size else 1.0)
+        completo |= self._titulo(titulo, "Blocos (Classes)", "Frequência Absoluta")
+        self._atualizar(completo, desenhar)
+
+    # ---------- ogiva ----------
+
+    @medir("graficos", tamanho=_n_classes)
+    def ogiva(self, intervalos, titulo="Ogiva", quartis=None, mostrar_percentual=True, desenhar=True):
+        x, y, ylabel = pontos_da_ogiva(intervalos, mostrar_percentual=mostrar_percentual)
+
+        completo = self._trocar_modo("ogiva")
+        if self._linha is None:
+            self._linha, = self.eixos.plot(x, y, marker='o', linestyle='-', linewidth=2, animated=True)
+            self._degraus, = self.eixos.step(x, y, where='pre', alpha=0.3, animated=True)
+            self._animados = [self._linha, self._degraus]
+            self.eixos.grid(True, linestyle='--', alpha=0.6)
+            completo = True
+        else:
+            self._linha.set_data(x, y)
+            self._degraus.set_data(x, y)
+
+        limites_x = (float(x[0]), float(x[-1]))
+        if self._rotulos != limites_x:
+            self.eixos.set_xlim(*limites_x)
+            self._rotulos = limites_x
+            completo = True
+        completo |= self._ajustar_y(y[-1] if y.size else 1.0)
+
+        marcas = None if quartis is None else tuple(float(q) for q in quartis)
+        if marcas != self._marcas:
+            for artista in self._quartis:
+                artista.remove()
+            self._quartis = []
+            for i, q in enumerate(marcas or (), 1):
+                altura = np.interp(q, x, y)
+                self._quartis.append(self.eixos.axvline(q, color="tab:red", linestyle=":", alpha=0.8))
+                self._quartis.append(self.eixos.annotate(
+                    f"Q{i} = {q:.2f}", (q, altura), textcoords="offset points",
+                    xytext=(5, -12), color="tab:red"))
+            self._marcas = marcas
+            completo = True
+
+        completo |= self._titulo(titulo, "Valor / Limite de classe", ylabel)
+        self._atualizar(completo, desenhar)
+
+    # ---------- atualização ----------
+
+    def _trocar_modo(self, modo):
+        if self.modo == modo:
+            return False
+        self.eixos.clear()
+        self.modo = modo
+        self._animados = []
+        self._barras = self._linha = self._degraus = None
+        self._quartis = []
+        self._marcas = None
+        self._rotulos = None
+        return True
+
+    def _ajustar_y(self, maximo):
+        # mantém o eixo enquanto o novo máximo couber sem sobrar muito espaço
+        topo = self.eixos.get_ylim()[1]
+        if 0 < maximo <= topo and maximo * FOLGA_Y * 2 > topo:
+            return False
+        self.eixos.set_ylim(0, max(maximo, 1e-12) * FOLGA_Y)
+        return True
+
+    def _titulo(self, titulo, xlabel, ylabel):
+        if (self.eixos.get_title(), self.eixos.get_xlabel(), self.eixos.get_ylabel()) == (titulo, xlabel, ylabel):
+            return False
+        self.eixos.set_title(titulo)
+        self.eixos.set_xlabel(xlabel)
+        self.eixos.set_ylabel(ylabel)
+        return True
+
+    def _atualizar(self, completo, desenhar=True):
+        # o layout só é recalculado quando eixos, rótulos ou título mudaram
+        self._layout_pendente |= completo
+        if not desenhar:
+            return  # só os artistas mudam; a figura é desenhada ao salvar
+        if self._layout_pendente or self._fundo is None:
+            self.figura.tight_layout()
+            self._layout_pendente = False
+            self.canvas.draw()
+            return
+        self.canvas.restore_region(self._fundo)
+        self._desenhar_animados()
+        self.canvas.blit(self.figura.bbox)
+
+    def _ao_desenhar(self, evento):
+        if evento.canvas is not self.canvas:
+            return  # desenho feito por savefig em outro formato
+        # fundo sem os artistas animados, para os próximos blits
+        self._fundo = self.canvas.copy_from_bbox(self.figura.bbox)
+        self._desenhar_animados()
+
+    def _desenhar_animados(self):
+        for artista in self._animados:
+            self.figura.draw_artist(artista)
+
+    @medir("graficos")
+    def salvar(self, caminho, **opcoes):
+        """Grava a figura atual (PNG, SVG, PDF... pela extensão)."""
+        if self._layout_pendente:
+            self.figura.tight_layout()
+            self._layout_pendente = False
+        for artista in self._animados:
+            artista.set_animated(False)
+        try:
+            self.figura.savefig(caminho, **opcoes)
+        finally:
+            for artista in self._animados:
+                artista.set_animated(True)
+            self._fundo = None
@@ -1,20 +1,199 @@
+import itertools
 import math
 
+import numpy as np
+
+from agrupadas import estatisticas_agrupadas
+from cache import digest
+from desempenho import medir
+from carregador import carregar, converter_texto, formato_do_arquivo
+from contagem import classes_contiguas, contar_classes, na_grade
+from frequencias import (FrequencyTable, acumular_frequencias, limites_das_classes,
+                         somar_frequencias)
+from regras import PRECISA_IQR, REGRAS, numero_de_classes
+from quantis import (MODOS as MODOS_QUANTIS, ERRO_PADRAO, QUARTIS, EsbocoKLL, quantis_exatos,
+                     quantis_ponderados)
+from resumo import TAMANHO_BLOCO, Resumo, como_vetor
+
+# "numpy" conta por busca binária nos limites; "referencia" é o laço original
+MOTORES = ("numpy", "referencia")
+
+# Acima deste n, os quantis padrão vêm do esboço KLL: np.partition copiaria
+# todos os dados (80 MB em float64) para a memória
+LIMITE_QUANTIS_EXATOS = 10_000_000
+
+
+def _n_dados(tabela, *_):
+    """n dos dados para os registros de desempenho, sem provocar leitura nova."""
+    return tabela._resumo.n if tabela._resumo is not None else None
+
+
 class TabelaIntervaloClasse:
     def __init__(self):
         self.dados = []
         self.tipo_dados = None
         self.casas_decimais = 2  # valor padrão
+        self.motor = "numpy"
+        self.regra_classes = "sturges"
+        self.limites_classes = None  # limites de classe informados pelo usuário
+        self.fora = 0  # valores fora dos `limites_classes`, conhecidos depois da contagem
+        self.cache = None  # CacheLRU opcional (por exemplo, cache.CACHE)
+        # chamada antes de cada bloco percorrido; pode levantar uma exceção para interromper
+        self.verificar_interrupcao = None
+        # limites e contagem em unidades inteiras de 10^-casas_decimais (ver gerar_intervalos)
+        self.aritmetica_exata = False
+
+    @property
+    def dados(self):
+        return self._dados
+
+    @dados.setter
+    def dados(self, valores):
+        self._dados = valores
+        self._pesos = None  # os pesos, se houver, são atribuídos depois dos dados
+        self._limpar_resultados()
+
+    @property
+    def pesos(self):
+        """Frequência de cada valor de `dados`, ou None quando cada valor conta uma vez"""
+        return self._pesos
+
+    @pesos.setter
+    def pesos(self, pesos):
+        if pesos is not None:
+            pesos = como_vetor(pesos).astype(float, copy=False)
+            if pesos.size != self.vetor.size:
+                raise ValueError("Os pesos devem ter o mesmo tamanho dos dados.")
+            if not np.all(np.isfinite(pesos)) or np.any(pesos < 0):
+                raise ValueError("Os pesos devem ser números finitos e não negativos.")
+        self._pesos = pesos
+        self._limpar_resultados()
+
+    def _limpar_resultados(self):
+        # resumo e vetor valem apenas para os dados (e pesos) atuais
+        self._vetor = None
+        self._resumo = None
+        self._esboco = None
+        self._digest = None
+
+    @property
+    def vetor(self):
+        """Dados como vetor NumPy, convertido uma única vez (memmaps são usados sem cópia)"""
+        if self._vetor is None:
+            self._vetor = como_vetor(self._dados)
+        return self._vetor
+
+    @property
+    def resumo(self):
+        """Mínimo, máximo, n, soma, M2 e integralidade, em uma passada."""
+        if self._resumo is None:
+            def calcular():
+                resumo = Resumo()
+                for bloco, pesos in self._blocos_ponderados():
+                    resumo.atualizar(bloco, pesos)
+                return resumo
+
+            if self.cache is not None:
+                self._resumo = self.cache.obter((self.digest, "resumo"), calcular)
+            else:
+                self._resumo = calcular()
+        return self._resumo
+
+    @property
+    def digest(self):
+        """Impressão digital do conteúdo dos dados, usada nas chaves do cache."""
+        if self._digest is None:
+            self._digest = digest(self.vetor)
+            if self._pesos is not None:
+                self._digest = digest(self._digest + digest(self._pesos))
+        return self._digest
+
+    def chave(self):
+        """Chave do resultado no cache: dados e todos os parâmetros que mudam a tabela."""
+        limites = None if self.limites_classes is None else tuple(map(float, self.limites_classes))
+        return (self.digest, self.tipo_dados, self.casas_decimais, self.regra_classes,
+                limites, self.motor, self.aritmetica_exata)
+
+    def construir(self):
+        """Intervalos contados e estatísticas, reaproveitados do `cache` quando houver"""
+        def calcular():
+            intervalos = self.calcular_frequencias(self.gerar_intervalos())
+            return intervalos, self.calcular_estatisticas(intervalos), self.resumo
+
+        if self.cache is None:
+            intervalos, estatisticas, _ = calcular()
+        else:
+            intervalos, estatisticas, self._resumo = self.cache.obter(("tabela",) + self.chave(), calcular)
+            self.fora = estatisticas['fora']
+        return intervalos, estatisticas
+
+    def _blocos(self):
+        """Dados em blocos de vetor; subclasses podem ler de outras fontes."""
+        vetor = self.vetor
+        return self._verificando((vetor[inicio:inicio + TAMANHO_BLOCO]
+                                  for inicio in range(0, vetor.size, TAMANHO_BLOCO)))
+
+    def _blocos_ponderados(self):
+        """Pares (bloco de valores, bloco de pesos ou None)."""
+        if self._pesos is None:
+            return zip(self._blocos(), itertools.repeat(None))
+        vetor, pesos = self.vetor, self._pesos
+        return self._verificando(((vetor[inicio:inicio + TAMANHO_BLOCO], pesos[inicio:inicio + TAMANHO_BLOCO])
+                                  for inicio in range(0, vetor.size, TAMANHO_BLOCO)))
+
+    def _verificando(self, blocos):
+        """Repassa os blocos, chamando `verificar_interrupcao` antes de cada um."""
+        for bloco in blocos:
+            if self.verificar_interrupcao is not None:
+                self.verificar_interrupcao()
+            yield bloco
+
+    def _pesos_inteiros(self):
+        return self._pesos is None or bool(np.all(self._pesos == np.trunc(self._pesos)))
+
+    def _todos_os_dados(self):
+        """Todos os dados num único vetor, para operações que precisam deles juntos."""
+        return self.vetor
+
+    def tem_dados(self):
+        return self.resumo.n > 0
+
+    @property
+    def esboco(self):
+        """Esboço KLL dos dados (erro padrão de 1%), montado uma vez e reaproveitado."""
+        if self._esboco is None:
+            esboco = EsbocoKLL()
+            for bloco in self._blocos():
+                esboco.atualizar(bloco)
+            self._esboco = esboco
+        return self._esboco
+
+    def numero_classes(self):
+        """Número de classes pela regra escolhida (Sturges por padrão)"""
+        if self.limites_classes is not None:
+            return len(self.limites_classes) - 1
+
+        resumo = self.resumo
+        iqr = None
+        if self.regra_classes in PRECISA_IQR:
+            q1, q3 = self.calcular_quantis((0.25, 0.75), modo="aproximado")
+            iqr = q3 - q1
+        return numero_de_classes(self.regra_classes, resumo.n, resumo.amplitude,
+                                 desvio_padrao=resumo.desvio_padrao, iqr=iqr)
+
+    def nome_regra(self):
+        if self.limites_classes is not None:
+            return "limites informados"
+        return REGRAS[self.regra_classes]
 
     def entrada_dados(self):
         """Solicita entrada de dados do usuário"""
         print("=== ENTRADA DE DADOS ===")
         print("Digite os dados separados por vírgula, espaço ou ambos:")
-        entrada = input("Dados: ").replace(",", " ")
+        entrada = input("Dados: ")
 
-        valores = [x.strip() for x in entrada.split() if x.strip()]
         try:
-            self.dados = [float(x) for x in valores]
+            self.dados = converter_texto(entrada)
         except ValueError:
             print("❌ Erro: certifique-se de digitar apenas números válidos.")
             self.dados = []
@@ -22,9 +201,9 @@ class TabelaIntervaloClasse:
 
         self.definir_tipo_dados()
 
-        print(f"\nDados recebidos: {self.dados}")
+        print(f"\nDados recebidos: {self.dados.tolist()}")
         print(f"Tipo de dados: {self.tipo_dados}")
-        print(f"Quantidade: {len(self.dados)}")
+        print(f"Quantidade: {self.resumo.n}")
 
         try:
             casas = input("\nQuantas casas decimais deseja exibir? (padrão = 2): ")
@@ -33,164 +212,334 @@ class TabelaIntervaloClasse:
             print("Valor inválido! Usando 2 casas decimais.")
             self.casas_decimais = 2
 
+    @medir("tipo", tamanho=_n_dados)
     def definir_tipo_dados(self):
-        decimais = any(x != int(x) for x in self.dados)
-        self.tipo_dados = "Contínuos" if decimais else "Discretos"
+        self.tipo_dados = "Discretos" if self.resumo.inteiros else "Contínuos"
 
-    def calcular_estatisticas(self):
-        min_val = min(self.dados)
-        max_val = max(self.dados)
+    @medir("estatisticas", tamanho=_n_dados)
+    def calcular_estatisticas(self, intervalos=None):
+        """Estatísticas da tabela e, com os `intervalos` contados, as dos dados agrupados"""
+        min_val = self.resumo.minimo
+        max_val = self.resumo.maximo
         amplitude_total = max_val - min_val
-        k = round(1 + 3.322 * math.log10(len(self.dados)))
+        k = self.numero_classes()
         amplitude_classe = amplitude_total / k
 
-        return {
+        estatisticas = {
             'min': min_val,
             'max': max_val,
             'amplitude_total': amplitude_total,
             'k': k,
-            'amplitude_classe': amplitude_classe
+            'amplitude_classe': amplitude_classe,
+            'regra': self.nome_regra()
         }
-
+        if self.limites_classes is not None:
+            # com limites informados, A é a largura real de cada classe
+            larguras = np.diff(np.asarray(self.limites_classes, dtype=float))
+            estatisticas['amplitudes_classes'] = larguras.tolist()
+            estatisticas['amplitude_classe'] = larguras[0].item() if np.all(larguras == larguras[0]) else None
+        if intervalos is not None:
+            estatisticas['n'] = self._n_nas_classes(intervalos)
+            estatisticas['fora'] = self.fora
+            estatisticas.update(estatisticas_agrupadas(intervalos))
+        return estatisticas
+
+    def calcular_quantis(self, probabilidades=QUARTIS, modo="exato", erro=ERRO_PADRAO):
+        """Quantis dos dados brutos (Q1, Q2 e Q3 por padrão), exatos ou pelo esboço KLL"""
+        if modo not in MODOS_QUANTIS:
+            raise ValueError(f"Modo desconhecido: {modo!r} (use um de {MODOS_QUANTIS}).")
+        if self._pesos is not None:
+            return quantis_ponderados(self.vetor, self._pesos, probabilidades)
+
+        if modo == "aproximado":
+            if erro == ERRO_PADRAO:
+                return self.esboco.quantis(probabilidades)
+            esboco = EsbocoKLL(erro)
+            for bloco in self._blocos():
+                esboco.atualizar(bloco)
+            return esboco.quantis(probabilidades)
+
+        return quantis_exatos(self._todos_os_dados(), probabilidades)
+
+    def modo_quantis_padrao(self):
+        """Modo de `calcular_quantis` usado nos gráficos"""
+        # o modo exato copiaria um memmap (ou dados muito grandes) inteiro para a RAM
+        if isinstance(self._dados, np.memmap) or self.resumo.n > LIMITE_QUANTIS_EXATOS:
+            return "aproximado"
+        return "exato"
+
+    @medir("intervalos", tamanho=_n_dados)
     def gerar_intervalos(self):
-        min_val = min(self.dados)
-        max_val = max(self.dados)
-        n_dados = len(self.dados)
+        """Gera os intervalos de classe (limites informados, laço original ou aritmética exata)"""
+        if self.limites_classes is not None:
+            limites = np.asarray(self.limites_classes, dtype=float)
+            if limites.size < 2 or np.any(np.diff(limites) < 0):
+                raise ValueError("Os limites de classe devem ser crescentes e ter ao menos 2 valores.")
+            return FrequencyTable(limites, self.tipo_dados, self.casas_decimais)
+
+        min_val = self.resumo.minimo
+        max_val = self.resumo.maximo
+
+        k = self.numero_classes()
+        if self.aritmetica_exata:
+            # limite i = min + i·A direto, sem acumular erro de soma em float
+            return FrequencyTable(self._limites_exatos(min_val, max_val, k), self.tipo_dados,
+                                  self.casas_decimais)
 
-        # Número de classes (Sturges)
-        k = round(1 + 3.322 * math.log10(n_dados))
         amplitude_classe = (max_val - min_val) / k
 
         fator = 10 ** self.casas_decimais
         amplitude_classe = math.ceil(amplitude_classe * fator) / fator
 
-        intervalos = []
-        limite_inferior = min_val
+        # mesmos limites do laço original: o inferior de cada classe é o superior da anterior
+        limites = [min_val]
+        for _ in range(k - 1):
+            limites.append(limites[-1] + amplitude_classe)
+        limites.append(max_val)
+
+        return FrequencyTable(limites, self.tipo_dados, self.casas_decimais)
 
-        for i in range(k):
-            limite_superior = limite_inferior + amplitude_classe
+    def _limites_exatos(self, min_val, max_val, k):
+        fator = 10 ** self.casas_decimais
+        extremos = na_grade([min_val, max_val], fator)
+        if extremos is None:
+            amplitude_classe = math.ceil((max_val - min_val) / k * fator) / fator
+            limites = min_val + amplitude_classe * np.arange(k + 1)
+        else:
+            minimo, maximo = extremos.tolist()
+            amplitude_classe = -(-(maximo - minimo) // k)  # teto da divisão inteira
+            limites = (minimo + amplitude_classe * np.arange(k + 1)) / fator
+        limites[-1] = max_val
+        return limites
 
-            if i == k - 1:
-                limite_superior = max_val
+    @medir("frequencias", tamanho=_n_dados)
+    def calcular_frequencias(self, intervalos):
+        if self.motor not in MOTORES:
+            raise ValueError(f"Motor desconhecido: {self.motor!r} (use um de {MOTORES}).")
+        self.fora = 0
 
-            formato = f"{{:.{self.casas_decimais}f}}"
+        if self.motor == "numpy" and (isinstance(intervalos, FrequencyTable)
+                                      or classes_contiguas(*limites_das_classes(intervalos))):
+            self._contar_vetorizado(intervalos)
+        else:
+            self._contar_referencia(intervalos)
 
-            if self.tipo_dados == "Discretos":
-                intervalo_str = f"{int(limite_inferior)} |-| {int(math.ceil(limite_superior))}" if i == k - 1 \
-                    else f"{int(limite_inferior)} |- {int(math.floor(limite_superior))}"
-            else:
-                intervalo_str = f"{formato.format(limite_inferior)} |-| {formato.format(limite_superior)}" if i == k - 1 \
-                    else f"{formato.format(limite_inferior)} |- {formato.format(limite_superior)}"
-
-            intervalos.append({
-                'intervalo': intervalo_str,
-                'limite_inferior': limite_inferior,
-                'limite_superior': limite_superior,
-                'frequencia': 0,
-                'frequencia_acumulada': 0,
-                'eh_ultima_classe': (i == k - 1),
-                'frequencia_relativa': 0,
-                'frequencia_relativa_acumulada': 0,
-                'frequencia_percentual': 0,
-                'frequencia_percentual_acumulada': 0
-            })
-            limite_inferior = limite_superior
-
-        return intervalos
+        return self._acumular_frequencias(intervalos)
 
-    def calcular_frequencias(self, intervalos):
-        n_total = len(self.dados)
+    def _contar_vetorizado(self, intervalos):
+        inferiores, superiores = limites_das_classes(intervalos)
+        discretos = self.tipo_dados == "Discretos"
 
-        for dado in self.dados:
+        # Com aritmética exata, dados inteiros (por exemplo um memmap .i32) são
+        # contados direto na grade inteira dos limites, sem conversão para float.
+        # Dados float são comparados aos limites exatos em float: cada limite é o
+        # double mais próximo do seu decimal, e a conversão preserva a ordem, então
+        # o resultado é o mesmo da grade inteira sem uma passada extra de escala.
+        fator = 10 ** self.casas_decimais
+        grade = None
+        if self.aritmetica_exata and self.vetor.dtype.kind in "iu":
+            grade = na_grade(np.append(inferiores, superiores[-1:]), fator)
+
+        contagens = np.zeros(len(intervalos), dtype=np.int64 if self._pesos is None else float)
+        for bloco, pesos in self._blocos_ponderados():
+            if grade is None:
+                contagens += contar_classes(bloco, inferiores, superiores, discretos, pesos)
+            else:
+                inteiros = bloco if fator == 1 else bloco.astype(np.int64) * fator
+                contagens += contar_classes(inteiros, grade[:-1], grade[1:], discretos, pesos)
+
+        if contagens.dtype.kind == "f" and self._pesos_inteiros():
+            contagens = np.rint(contagens).astype(np.int64)
+        somar_frequencias(intervalos, contagens)
+
+    def _contar_referencia(self, intervalos):
+        # o laço original trabalha sobre dicionários simples
+        classes = intervalos.para_dicionarios() if isinstance(intervalos, FrequencyTable) else intervalos
+        inteiros = self._pesos_inteiros()
+        for bloco, pesos in self._blocos_ponderados():
+            if pesos is not None:
+                pesos = pesos.astype(np.int64) if inteiros else pesos
+                pesos = pesos.tolist()
+            self._contar_referencia_bloco(classes, bloco.tolist(), pesos)
+
+        if classes is not intervalos:
+            intervalos.fi[:] = 0
+            somar_frequencias(intervalos, np.array([c['frequencia'] for c in classes]))
+
+    def _contar_referencia_bloco(self, intervalos, dados, pesos=None):
+        for dado, peso in zip(dados, itertools.repeat(1) if pesos is None else pesos):
             for intervalo in intervalos:
                 if self.tipo_dados == "Discretos":
                     if intervalo['limite_inferior'] <= dado <= intervalo['limite_superior']:
-                        intervalo['frequencia'] += 1
+                        intervalo['frequencia'] += peso
                         break
                 else:
                     if intervalo['eh_ultima_classe']:
                         if intervalo['limite_inferior'] <= dado <= intervalo['limite_superior']:
-                            intervalo['frequencia'] += 1
+                            intervalo['frequencia'] += peso
                             break
                     elif intervalo['limite_inferior'] <= dado < intervalo['limite_superior']:
-                        intervalo['frequencia'] += 1
+                        intervalo['frequencia'] += peso
                         break
 
-        freq_acum = freq_rel_acum = freq_perc_acum = 0
-        for intervalo in intervalos:
-            freq_acum += intervalo['frequencia']
-            intervalo['frequencia_acumulada'] = freq_acum
-
-            intervalo['frequencia_relativa'] = intervalo['frequencia'] / n_total
-            freq_rel_acum += intervalo['frequencia_relativa']
-            intervalo['frequencia_relativa_acumulada'] = freq_rel_acum
-
-            intervalo['frequencia_percentual'] = round(intervalo['frequencia_relativa'] * 100, 2)
-            freq_perc_acum += intervalo['frequencia_percentual']
-            intervalo['frequencia_percentual_acumulada'] = round(freq_perc_acum, 2)
-
-        return intervalos
+    def _acumular_frequencias(self, intervalos):
+        n = self._n_nas_classes(intervalos)
+        if self.limites_classes is not None:
+            self.fora += self.resumo.n - n
+            if not n:
+                raise ValueError("Nenhum valor dentro das classes.")
+        return acumular_frequencias(intervalos, n, exata=self.aritmetica_exata)
+
+    def _n_nas_classes(self, intervalos):
+        """n de Fr e Fac%: com `limites_classes`, só os valores que caíram nas classes."""
+        if self.limites_classes is None:
+            return self.resumo.n
+        if isinstance(intervalos, FrequencyTable):
+            return intervalos.fi.sum().item()
+        return sum(i['frequencia'] for i in intervalos)
 
     def exibir_tabela(self, intervalos, estatisticas):
+        print(self.texto_da_tabela(intervalos, estatisticas))
+
+    @medir("exibicao", tamanho=_n_dados)
+    def texto_da_tabela(self, intervalos, estatisticas):
+        """Tabela completa e estatísticas, no texto exibido por `exibir_tabela`."""
         dec = self.casas_decimais
         formato = f"{{:.{dec}f}}"
-
-        print("\n" + "=" * 110)
-        print("TABELA DE DISTRIBUIÇÃO DE FREQUÊNCIAS COMPLETA")
-        print("=" * 110)
-        print(f"{'Classe':<6} {'Intervalo':<20} {'Fi':<6} {'Fac':<8} {'Fr':<10} {'Frac':<10} {'F%':<10} {'Fac%':<10}")
-        print("-" * 110)
-
-        for i, intervalo in enumerate(intervalos, 1):
-            casas_fr = 2 if self.tipo_dados == "Discretos" else dec
-            f_percent = f"{intervalo['frequencia_percentual']:.2f}%"
-            fac_percent = f"{intervalo['frequencia_percentual_acumulada']:.2f}%"
-
-            print(f"{i:<6} {intervalo['intervalo']:<20} "
-                  f"{intervalo['frequencia']:<6} "
-                  f"{intervalo['frequencia_acumulada']:<8} "
-                  f"{intervalo['frequencia_relativa']:<10.{casas_fr}f} "
-                  f"{intervalo['frequencia_relativa_acumulada']:<10.{casas_fr}f} "
-                  f"{f_percent:<10} "
-                  f"{fac_percent:<10}")
-
-        print("-" * 110)
-        total = len(self.dados)
-        print(f"{'Total':<6} {'':<20} "
-              f"{total:<6} "
-              f"{total:<8} "
-              f"{1.0:<10.2f} "
-              f"{1.0:<10.2f} "
-              f"{'100.0%':<10} "
-              f"{'100.0%':<10}")
-
-        print("\n" + "=" * 60)
-        print("ESTATÍSTICAS DESCRITIVAS:")
-        print("=" * 60)
-        print(f"Quantidade de dados: {len(self.dados)}")
-        print(f"Valor mínimo: {formato.format(estatisticas['min'])}")
-        print(f"Valor máximo: {formato.format(estatisticas['max'])}")
-        print(f"Amplitude total: {formato.format(estatisticas['amplitude_total'])}")
-        print(f"Número de classes (Sturges): {estatisticas['k']}")
+        linhas = []
+
+        linhas.append("\n" + "=" * 110)
+        linhas.append("TABELA DE DISTRIBUIÇÃO DE FREQUÊNCIAS COMPLETA")
+        linhas.append("=" * 110)
+        linhas.append(f"{'Classe':<6} {'Intervalo':<20} {'Fi':<6} {'Fac':<8} {'Fr':<10} {'Frac':<10} {'F%':<10} {'Fac%':<10}")
+        linhas.append("-" * 110)
+
+        tabela = FrequencyTable.de_dicionarios(intervalos, self.tipo_dados, dec)
+        casas_fr = 2 if self.tipo_dados == "Discretos" else dec
+        classes = zip(tabela.rotulos, tabela.fi.tolist(), tabela.fac.tolist(), tabela.fr.tolist(),
+                      tabela.frac.tolist(), tabela.fp.tolist(), tabela.facp.tolist())
+
+        for i, (intervalo, fi, fac, fr, frac, fp, facp) in enumerate(classes, 1):
+            f_percent = f"{fp:.2f}%"
+            fac_percent = f"{facp:.2f}%"
+
+            linhas.append(f"{i:<6} {intervalo:<20} "
+                          f"{fi:<6} "
+                          f"{fac:<8} "
+                          f"{fr:<10.{casas_fr}f} "
+                          f"{frac:<10.{casas_fr}f} "
+                          f"{f_percent:<10} "
+                          f"{fac_percent:<10}")
+
+        linhas.append("-" * 110)
+        total = estatisticas.get('n', self.resumo.n)
+        linhas.append(f"{'Total':<6} {'':<20} "
+                      f"{total:<6} "
+                      f"{total:<8} "
+                      f"{1.0:<10.2f} "
+                      f"{1.0:<10.2f} "
+                      f"{'100.0%':<10} "
+                      f"{'100.0%':<10}")
+
+        linhas.append("\n" + "=" * 60)
+        linhas.append("ESTATÍSTICAS DESCRITIVAS:")
+        linhas.append("=" * 60)
+        linhas.append(f"Quantidade de dados: {total}")
+        if estatisticas.get('fora'):
+            linhas.append(f"Valores fora das classes (não incluídos em n): {estatisticas['fora']}")
+        linhas.append(f"Valor mínimo: {formato.format(estatisticas['min'])}")
+        linhas.append(f"Valor máximo: {formato.format(estatisticas['max'])}")
+        linhas.append(f"Amplitude total: {formato.format(estatisticas['amplitude_total'])}")
+        linhas.append(f"Número de classes ({estatisticas['regra']}): {estatisticas['k']}")
 
         # 🔹 Exibe a fórmula detalhada da amplitude de classe
-        print("\nAmplitude de Classe (A):")
-        print(f"A = (maior - menor) / K")
-        print(f"A = ({formato.format(estatisticas['max'])} - {formato.format(estatisticas['min'])}) / {estatisticas['k']} "
-              f"= {formato.format(estatisticas['amplitude_classe'])}")
+        linhas.append("\nAmplitude de Classe (A):")
+        if 'amplitudes_classes' in estatisticas:
+            linhas.append("A = limite superior - limite inferior (limites informados)")
+            linhas.append("A = " + ", ".join(formato.format(a) for a in estatisticas['amplitudes_classes']))
+        else:
+            linhas.append(f"A = (maior - menor) / K")
+            linhas.append(f"A = ({formato.format(estatisticas['max'])} - {formato.format(estatisticas['min'])}) / {estatisticas['k']} "
+                          f"= {formato.format(estatisticas['amplitude_classe'])}")
+
+        if 'media' in estatisticas:
+            linhas.extend(self._linhas_variancia(tabela, estatisticas))
 
-        print(f"\nTipo de dados: {self.tipo_dados}")
+        linhas.append(f"\nTipo de dados: {self.tipo_dados}")
+        return "\n".join(linhas)
+
+    def exibir_variancia(self, tabela, estatisticas):
+        """Exibe o cálculo da variância de classe e as medidas dos dados agrupados"""
+        print("\n".join(self._linhas_variancia(tabela, estatisticas)))
+
+    def _linhas_variancia(self, tabela, estatisticas):
+        dec = self.casas_decimais
+        linhas = []
+
+        linhas.append("\n" + "=" * 80)
+        linhas.append("CÁLCULO DA VARIÂNCIA DE CLASSE")
+        linhas.append("=" * 80)
+        linhas.append(f"{'Classe':<6} {'Intervalo':<20} {'xi':<12} {'Fi':<6} {'xi.Fi':<14} {'(xi-x̄)².Fi':<14}")
+        linhas.append("-" * 80)
+
+        classes = zip(tabela.rotulos, estatisticas['pontos_medios'].tolist(), tabela.fi.tolist(),
+                      estatisticas['xi_fi'].tolist(), estatisticas['desvios_quadrados_fi'].tolist())
+        for i, (intervalo, xi, fi, xi_fi, desvio) in enumerate(classes, 1):
+            linhas.append(f"{i:<6} {intervalo:<20} {xi:<12.{dec}f} {fi:<6} {xi_fi:<14.{dec}f} {desvio:<14.{dec}f}")
+
+        linhas.append("-" * 80)
+        linhas.append(f"{'Total':<6} {'':<20} {'':<12} {estatisticas.get('n', self.resumo.n):<6} "
+                      f"{estatisticas['soma_xi_fi']:<14.{dec}f} {estatisticas['soma_desvios_quadrados_fi']:<14.{dec}f}")
+
+        linhas.append(f"\nMédia (x̄ = Σxi.Fi / n): {estatisticas['media']:.4f}")
+        linhas.append(f"Mediana: {estatisticas['mediana']:.4f}")
+        linhas.append(f"Moda (Czuber): {estatisticas['moda']:.4f}")
+        linhas.append(f"Variância (s² = Σ(xi-x̄)².Fi / (n-1)): {estatisticas['variancia']:.4f}")
+        linhas.append(f"Desvio padrão: {estatisticas['desvio_padrao']:.4f}")
+        if estatisticas['cv'] is not None:
+            linhas.append(f"Coeficiente de variação: {estatisticas['cv']:.2f}%")
+        return linhas
 
     def gerar_e_exibir_tabela(self):
-        if not self.dados:
+        if not self.tem_dados():
             print("Nenhum dado foi inserido!")
             return
-        estatisticas = self.calcular_estatisticas()
-        intervalos = self.gerar_intervalos()
-        intervalos_com_freq = self.calcular_frequencias(intervalos)
+        intervalos_com_freq, estatisticas = self.construir()
         self.exibir_tabela(intervalos_com_freq, estatisticas)
 
 
+def abrir_tabela(caminho):
+    """Tabela de um arquivo sem carregá-lo inteiro (memmap para binários, blocos para texto)"""
+    if formato_do_arquivo(caminho) == "texto":
+        from fluxo import TabelaArquivo
+        return TabelaArquivo(caminho)
+
+    tabela = TabelaIntervaloClasse()
+    tabela.dados = carregar(caminho)
+    return tabela
+
+
+def gerar_tabela_de_arquivo():
+    """Gera a tabela de um arquivo grande sem carregá-lo inteiro na memória"""
+    caminho = input("Caminho do arquivo (CSV, um valor por linha, .npy, .f64 ou .i32): ").strip()
+    try:
+        casas = input("Quantas casas decimais deseja exibir? (padrão = 2): ")
+        casas_decimais = int(casas) if casas.strip() else 2
+    except ValueError:
+        print("Valor inválido! Usando 2 casas decimais.")
+        casas_decimais = 2
+
+    try:
+        tabela = abrir_tabela(caminho)
+        tabela.casas_decimais = casas_decimais
+        tabela.definir_tipo_dados()
+        tabela.gerar_e_exibir_tabela()
+    except OSError as erro:
+        print(f"❌ Erro ao ler o arquivo: {erro}")
+    except ValueError:
+        print("❌ Erro: o arquivo deve conter apenas números válidos.")
+
+
 def main():
     print("SOFTWARE PARA TABELA DE INTERVALO DE CLASSE")
     print("Desenvolvido em Python - Dados Quantitativos\n")
@@ -201,7 +550,8 @@ def main():
         print("\nMenu:")
         print("1. Inserir dados")
         print("2. Gerar tabela")
-        print("3. Sair")
+        print("3. Gerar tabela de arquivo (leitura em blocos)")
+        print("4. Sair")
 
         opcao = input("Escolha uma opção: ")
 
@@ -210,6 +560,8 @@ def main():
         elif opcao == '2':
             tabela.gerar_e_exibir_tabela()
         elif opcao == '3':
+            gerar_tabela_de_arquivo()
+        elif opcao == '4':
             print("Saindo do programa...")
             break
         else:
@@ -217,4 +569,10 @@ def main():
 
 
 if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1:
+        # modo sem interação: python -m tabela build ARQUIVO... (ver lote.py)
+        from lote import main as main_lote
+        sys.exit(main_lote(sys.argv[1:]))
     main()
@@ -0,0 +1,17 @@
+import importlib.util
+import os
+
+CAMINHO = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                       "benchmarks", "diferencial.py")
+
+
+def carregar_diferencial():
+    especificacao = importlib.util.spec_from_file_location("diferencial", CAMINHO)
+    modulo = importlib.util.module_from_spec(especificacao)
+    especificacao.loader.exec_module(modulo)
+    return modulo
+
+
+def test_motores_iguais_a_referencia():
+    # todos os motores contra o algoritmo original, em casos aleatórios e adversariais
+    assert carregar_diferencial().main(["--casos", "50"]) == 0
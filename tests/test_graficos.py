@@ -0,0 +1,33 @@
+import os
+import sys
+
+import matplotlib
+import numpy as np
+import pytest
+
+matplotlib.use("Agg")
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path[:0] = [RAIZ, os.path.join(RAIZ, "src")]
+
+import matplotlib.pyplot as plt  # noqa: E402
+
+from ogiva import ogiva_de_dados_brutos  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def fechar_figuras():
+    yield
+    plt.close("all")
+
+
+@pytest.mark.parametrize("num_classes", [None, 5])
+@pytest.mark.parametrize("pesos", [None, [1, 2, 0.5, 3, 1]])
+def test_ogiva_de_dados_brutos(num_classes, pesos):
+    dados = np.array([1.0, 2.5, 2.5, 4.0, 7.0])
+    ogiva_de_dados_brutos(dados, num_classes=num_classes, pesos=pesos)
+
+    linhas = plt.gcf().axes[0].get_lines()
+    assert len(linhas) == 1
+    y = linhas[0].get_ydata()
+    assert y[-1] == pytest.approx(100.0)
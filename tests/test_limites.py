@@ -0,0 +1,76 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from acumulador import AcumuladorFrequencias  # noqa: E402
+from fluxo import TabelaArquivo  # noqa: E402
+from grupos import TabelaGrupos  # noqa: E402
+from janela import TabelaJanela  # noqa: E402
+from tabela import TabelaIntervaloClasse  # noqa: E402
+
+
+def tabela_com_limites(dados, limites):
+    tabela = TabelaIntervaloClasse()
+    tabela.dados = dados
+    tabela.limites_classes = limites
+    tabela.definir_tipo_dados()
+    return tabela
+
+
+def test_valores_fora_dos_limites_nao_entram_em_n():
+    tabela = tabela_com_limites([1, 2, 3, 4, 50.5], [0, 2, 4])
+    intervalos, estatisticas = tabela.construir()
+
+    assert estatisticas['n'] == 4
+    assert estatisticas['fora'] == tabela.fora == 1
+    assert intervalos.fr.sum() == pytest.approx(1.0)
+    assert intervalos.facp[-1] == pytest.approx(100.0)
+    assert estatisticas['amplitudes_classes'] == [2.0, 2.0]
+    assert "Quantidade de dados: 4" in tabela.texto_da_tabela(intervalos, estatisticas)
+
+
+def test_nenhum_valor_dentro_dos_limites():
+    tabela = tabela_com_limites([10, 20], [0, 2, 4])
+    with pytest.raises(ValueError):
+        tabela.construir()
+
+
+def test_acumulador_deixa_fora_de_n_os_valores_sem_classe():
+    tabela = tabela_com_limites([1, 2, 3], [0, 2, 4])
+    acumulador = AcumuladorFrequencias.de_tabela(tabela)
+    janela = TabelaJanela.de_tabela(tabela, tamanho=10)
+    for lote in ([1, 2, 3], [100]):
+        acumulador.adicionar(lote)
+        janela.adicionar(lote)
+
+    assert acumulador.n == janela.n == 3
+    assert acumulador.fora == janela.fora == 1
+    assert acumulador.intervalos.facp[-1] == pytest.approx(100.0)
+    assert acumulador.maximo == 3
+    assert acumulador.media == pytest.approx(2.0)
+    with pytest.raises(ValueError):
+        acumulador.adicionar([1, float("nan")])
+
+
+def test_grupos_deixam_fora_de_n_os_valores_sem_classe():
+    grupos = TabelaGrupos(["a", "a", "a", "b", "b"], [1, 3, 50, 1, 2], limites_classes=[0, 2, 4])
+    tabelas = grupos.construir()
+
+    assert grupos.fora == {"a": 1, "b": 0}
+    assert tabelas["a"].facp[-1] == pytest.approx(100.0)
+    assert tabelas["a"].fr.tolist() == pytest.approx([0.5, 0.5])
+    assert grupos.total().facp[-1] == pytest.approx(100.0)
+
+
+@pytest.mark.parametrize("conteudo", ["", "10\n20\n"])
+def test_arquivo_sem_valores_dentro_dos_limites(tmp_path, conteudo):
+    caminho = tmp_path / "dados.txt"
+    caminho.write_text(conteudo)
+    tabela = TabelaArquivo(str(caminho), limites=(0, 4), k=2)
+
+    assert not tabela.tem_dados()
+    with pytest.raises(ValueError, match="Nenhum valor dentro das classes"):
+        tabela.construir()